@@ -1,21 +1,61 @@
 from bootstrap.config import AppConfig
 from bootstrap.utils import log_config
 from common.infrastructure.app.app import App
+from common.infrastructure.cache.metrics import CacheMetrics
 from common.infrastructure.database.sqlalchemy.database import Database
 from common.infrastructure.di.container.container import CommonContainer
 from common.infrastructure.logger.logging.logger_factory import LoggerFactory
+from common.infrastructure.logger.logging.metrics import LogQueueMetrics
+from common.infrastructure.metrics.registry import MetricsRegistry
+from common.infrastructure.server.fastapi.middleware.query_budget_middleware import (
+    QueryBudgetMiddleware,
+)
+from common.infrastructure.server.fastapi.middleware.request_log_sampler import (
+    RequestLogMetrics,
+    RequestLogSampler,
+)
 from common.infrastructure.server.fastapi.server import FastAPIServer
 from fastfit.auth.infrastructure.app.app import AuthApp, TokenApp
 from fastfit.auth.infrastructure.di.container.container import (
     AuthContainer,
     TokenContainer,
 )
+from fastfit.auth.infrastructure.services.jwt.claims_cache import ClaimsCacheMetrics
 from fastfit.identity.infrastructure.app.app import IdentityApp
 from fastfit.identity.infrastructure.di.container.container import IdentityContainer
 from fastfit.menu.infrastructure.app.app import MenuApp
 from fastfit.menu.infrastructure.di.container.container import DishContainer
 from fastfit.order.infrastructure.app.app import OrderApp
 from fastfit.order.infrastructure.di.container.container import OrderContainer
+from fastfit.order.infrastructure.services.asyncio.idempotency_key_sweeper import (
+    IdempotencyKeySweeper,
+)
+from fastfit.order.infrastructure.services.asyncio.order_status_worker import (
+    OrderStatusWorker,
+)
+from fastfit.order.infrastructure.services.postgres.order_status_listener import (
+    PostgresOrderStatusListener,
+)
+
+
+def register_service_metrics(
+    registry: MetricsRegistry,
+    config: AppConfig,
+    token_container: TokenContainer,
+    dish_container: DishContainer,
+    request_log_sampler: RequestLogSampler,
+) -> None:
+    """Export counts kept by in-process services on every metrics render."""
+    cache_metrics = CacheMetrics(registry)
+    if config.menu.snapshot_cache_enabled:
+        cache_metrics.track(
+            "menu_snapshots", dish_container.menu_snapshot_cache().stats
+        )
+    if (claims_cache := token_container.claims_cache()) is not None:
+        ClaimsCacheMetrics(registry, cache_metrics, claims_cache)
+    if (log_queue_handler := LoggerFactory.queue_handler()) is not None:
+        LogQueueMetrics(registry, log_queue_handler)
+    RequestLogMetrics(registry, request_log_sampler)
 
 
 def main() -> App:
@@ -34,15 +74,21 @@ def main() -> App:
     # Server
     logger.info("setting up FastAPI server...")
     server = FastAPIServer(logger)
+    # NOTE: Registered first so it is torn down last, after other handlers log
+    server.on_tear_down(LoggerFactory.shutdown)
+    server.on_start_up(database.warm_up)
+    server.on_start_up(database.start_replica_monitor)
     server.on_tear_down(database.shutdown)
     logger.info("FastAPI server setup complete")
 
     common_container = CommonContainer(config=config, database=database)
     uuid_generator = common_container.uuid_generator
     query_executor = common_container.query_executor
+    read_query_executor = common_container.read_query_executor
     clock = common_container.clock
 
     identity_container = IdentityContainer(
+        identity_config=config.identity,
         uuid_generator=uuid_generator,
         query_executor=query_executor,
         token_introspector=None,  # NOTE: Need to be overriden later
@@ -55,6 +101,7 @@ def main() -> App:
         token_generator=common_container.token_generator,
         query_executor=query_executor,
         identity_repository=identity_container.identity_repository,
+        descriptor_cache=identity_container.descriptor_cache,
     )
 
     identity_container.token_introspector.override(token_container.token_introspector)
@@ -67,16 +114,26 @@ def main() -> App:
     )
 
     dish_container = DishContainer(
-        uuid_generator=uuid_generator, query_executor=query_executor
+        menu_config=config.menu,
+        uuid_generator=uuid_generator,
+        query_executor=query_executor,
+        read_query_executor=read_query_executor,
     )
 
     order_container = OrderContainer(
-        clock=clock, uuid_generator=uuid_generator, query_executor=query_executor
+        order_config=config.order,
+        unit_of_work=common_container.unit_of_work,
+        clock=clock,
+        uuid_generator=uuid_generator,
+        query_executor=query_executor,
+        read_query_executor=read_query_executor,
+        price_book=dish_container.price_book,
     )
 
     logger.info("building application...")
 
-    app = App(logger, server)
+    request_log_sampler = RequestLogSampler.from_config(config.logger)
+    app = App(logger, server, request_log_sampler)
     app.add_app(
         TokenApp(token_container, server),
         AuthApp(auth_container, server),
@@ -86,6 +143,46 @@ def main() -> App:
     )
     app.configure()
 
+    if config.order.scheduler_enabled:
+        order_status_worker = OrderStatusWorker(
+            order_container.order_status_scheduler(), logger, config.order
+        )
+        server.on_start_up(order_status_worker.start)
+        server.on_tear_down(order_status_worker.stop)
+
+    if config.order.events_notify_enabled:
+        order_status_listener = PostgresOrderStatusListener(
+            database.get_engine(),
+            order_container.order_status_hub(),
+            logger,
+            config.order,
+        )
+        server.on_start_up(order_status_listener.start)
+        server.on_tear_down(order_status_listener.stop)
+
+    idempotency_key_sweeper = IdempotencyKeySweeper(
+        clock(),
+        common_container.unit_of_work(),
+        order_container.idempotency_key_repository(),
+        logger,
+        config.order,
+    )
+    server.on_start_up(idempotency_key_sweeper.start)
+    server.on_tear_down(idempotency_key_sweeper.stop)
+
+    if (query_profiler := database.get_profiler()) is not None:
+        server.use_middleware(QueryBudgetMiddleware, profiler=query_profiler)
+    if config.metrics.metrics_enabled:
+        metrics_registry = common_container.metrics_registry()
+        register_service_metrics(
+            metrics_registry,
+            config,
+            token_container,
+            dish_container,
+            request_log_sampler,
+        )
+        server.expose_metrics(metrics_registry, config.metrics.metrics_path)
+
     logger.info("application initialized")
 
     return app
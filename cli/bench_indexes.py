@@ -0,0 +1,233 @@
+"""Compare query plans of the hot lookups with and without secondary indexes.
+
+Seeds a synthetic dataset inside a single transaction, explains every query
+with the indexes in place, drops them and explains again. The transaction is
+rolled back at the end, so the database is left untouched, but the seeding
+holds locks on the tables for the whole run: never point it at production.
+"""
+
+import asyncio
+import json
+import sys
+from dataclasses import dataclass
+from typing import Any
+
+from bootstrap.config import AppConfig
+from common.infrastructure.database.sqlalchemy.database import Database
+from common.infrastructure.logger.logging.logger_factory import LoggerFactory
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+
+RESTAURANTS = 50
+DISHES_PER_RESTAURANT = 200
+ORDERS = 200_000
+USERS = 5_000
+TOKENS = 100_000
+
+INDEXES = (
+    "ix_orders_user_id_created_at",
+    "ix_orders_restaurant_id_status_created_at",
+    "ix_orders_restaurant_id_updated_at",
+    "ix_dishes_restaurant_id",
+    "ix_dishes_category_id",
+    "ix_dishes_filters",
+    "ix_tokens_expires_at",
+)
+
+SEED = (
+    f"""
+    CREATE TEMPORARY TABLE bench_restaurants ON COMMIT DROP AS
+    SELECT gen_random_uuid() AS restaurant_id, n
+    FROM generate_series(1, {RESTAURANTS}) AS n
+    """,
+    f"""
+    CREATE TEMPORARY TABLE bench_users ON COMMIT DROP AS
+    SELECT gen_random_uuid() AS user_id, n
+    FROM generate_series(1, {USERS}) AS n
+    """,
+    """
+    INSERT INTO categories (category_id, name, restaurant_id)
+    SELECT gen_random_uuid(), 'bench ' || r.n || '.' || c, r.restaurant_id
+    FROM bench_restaurants AS r, generate_series(1, 10) AS c
+    """,
+    f"""
+    INSERT INTO dishes (
+        dish_id, name, description, price, currency, calories, proteins, fats,
+        carbohydrates, ingredients, filters, category_id, restaurant_id
+    )
+    SELECT
+        gen_random_uuid(), 'bench ' || d, '', 100 + d % 500, 'RUB', 100 + d % 700,
+        d % 40, d % 30, d % 80, ARRAY['bench'],
+        (ARRAY[
+            ARRAY[]::dishfiltertype[],
+            ARRAY['VEGAN']::dishfiltertype[],
+            ARRAY['GLUTEN_FREE']::dishfiltertype[],
+            ARRAY['VEGAN', 'GLUTEN_FREE']::dishfiltertype[],
+            ARRAY['SPORTS_MENU']::dishfiltertype[]
+        ])[1 + d % 5],
+        c.category_id, c.restaurant_id
+    FROM categories AS c
+    JOIN bench_restaurants AS r USING (restaurant_id),
+    generate_series(1, {DISHES_PER_RESTAURANT // 10}) AS d
+    """,
+    f"""
+    INSERT INTO orders (
+        order_id, user_id, phone_number, status, delivery_type,
+        restaurant_id, created_at, updated_at
+    )
+    SELECT
+        gen_random_uuid(), u.user_id, '+70000000000',
+        -- NOTE: Like production, only a small share of orders is active
+        CASE WHEN o % 50 = 0
+            THEN (ARRAY['CREATED', 'PREPARING', 'READY']::orderstatus[])
+                [1 + o / 50 % 3]
+            ELSE 'DELIVERED'::orderstatus
+        END,
+        'PICKUP', r.restaurant_id,
+        now() - make_interval(mins => o), now() - make_interval(mins => o)
+    FROM generate_series(1, {ORDERS}) AS o
+    JOIN bench_users AS u ON u.n = 1 + o % {USERS}
+    JOIN bench_restaurants AS r ON r.n = 1 + o % {RESTAURANTS}
+    """,
+    f"""
+    INSERT INTO tokens (token_id, identity_id, value, issued_at, expires_at)
+    SELECT
+        gen_random_uuid(), gen_random_uuid(), 'bench-' || t,
+        now() - make_interval(hours => t % 720),
+        now() - make_interval(hours => t % 720) + interval '1 hour'
+    FROM generate_series(1, {TOKENS}) AS t
+    """,
+    "ANALYZE categories, dishes, orders, tokens",
+)
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    sql: str
+
+
+CASES = (
+    Case(
+        "orders by user",
+        """
+        SELECT * FROM orders
+        WHERE user_id = (SELECT user_id FROM bench_users WHERE n = 1)
+        ORDER BY created_at DESC, order_id DESC
+        LIMIT 11
+        """,
+    ),
+    Case(
+        "orders by restaurant and status",
+        """
+        SELECT * FROM orders
+        WHERE restaurant_id = (SELECT restaurant_id FROM bench_restaurants
+                               WHERE n = 1)
+          AND status = 'PREPARING'
+        ORDER BY created_at
+        """,
+    ),
+    Case(
+        "orders changed in a restaurant",
+        """
+        SELECT order_id, status FROM orders
+        WHERE restaurant_id = (SELECT restaurant_id FROM bench_restaurants
+                               WHERE n = 1)
+          AND updated_at > now() - interval '2 hours'
+        """,
+    ),
+    Case(
+        "dishes by restaurant",
+        """
+        SELECT * FROM dishes
+        WHERE restaurant_id = (SELECT restaurant_id FROM bench_restaurants
+                               WHERE n = 1)
+        """,
+    ),
+    Case(
+        "dishes by filters",
+        """
+        SELECT dish_id FROM dishes
+        WHERE filters @> ARRAY['SPORTS_MENU']::dishfiltertype[]
+        """,
+    ),
+    Case(
+        "expired tokens",
+        "SELECT token_id FROM tokens WHERE expires_at < now() - interval '29 days'",
+    ),
+)
+
+
+@dataclass(frozen=True)
+class Plan:
+    node: str
+    cost: float
+    time: float
+
+
+async def explain(connection: AsyncConnection, case: Case) -> Plan:
+    result = await connection.execute(
+        text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {case.sql}")
+    )
+    raw = result.scalar_one()
+    document: list[dict[str, Any]] = json.loads(raw) if isinstance(raw, str) else raw
+    plan = document[0]["Plan"]
+    return Plan(
+        node=_scan_nodes(plan),
+        cost=plan["Total Cost"],
+        time=document[0]["Execution Time"],
+    )
+
+
+def _scan_nodes(plan: dict[str, Any]) -> str:
+    """Summarise the scans of a plan, which is where the indexes show up."""
+    nodes: list[str] = []
+    stack = [plan]
+    while stack:
+        node = stack.pop()
+        if "Scan" in node["Node Type"] and node.get("Relation Name") not in (
+            None,
+            "bench_users",
+            "bench_restaurants",
+        ):
+            index = node.get("Index Name")
+            nodes.append(f"{node['Node Type']}" + (f" ({index})" if index else ""))
+        stack.extend(node.get("Plans", []))
+    return ", ".join(nodes)
+
+
+async def run_benchmark() -> None:
+    config = AppConfig.load()
+    logger = LoggerFactory.create(None, config.env, config.logger)
+    database = Database.create(
+        config.db.model_copy(update={"db_statement_timeout": None}), logger
+    )
+
+    async with database.get_engine().connect() as connection:
+        transaction = await connection.begin()
+        try:
+            for statement in SEED:
+                await connection.execute(text(statement))
+
+            indexed = [await explain(connection, case) for case in CASES]
+            for index in INDEXES:
+                await connection.execute(text(f"DROP INDEX IF EXISTS {index}"))
+            plain = [await explain(connection, case) for case in CASES]
+        finally:
+            await transaction.rollback()
+
+    await database.shutdown()
+
+    for case, before, after in zip(CASES, plain, indexed, strict=True):
+        sys.stdout.write(
+            f"{case.name}\n"
+            f"  without indexes: {before.time:9.2f} ms  cost {before.cost:10.2f}"
+            f"  {before.node}\n"
+            f"  with indexes:    {after.time:9.2f} ms  cost {after.cost:10.2f}"
+            f"  {after.node}\n"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
@@ -0,0 +1,177 @@
+"""Compare eager loading strategies for order graphs on a large order history.
+
+Seeds a single user with a long order history inside one transaction and
+loads pages of orders with their items using every collection loading
+strategy. The transaction is rolled back at the end, so the database is left
+untouched, but the seeding holds locks on the tables for the whole run: never
+point it at production.
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from bootstrap.config import AppConfig
+from common.infrastructure.database.sqlalchemy.database import Database
+from common.infrastructure.database.sqlalchemy.loading import (
+    CollectionLoadingEnum,
+    load_collection,
+)
+from common.infrastructure.logger.logging.logger_factory import LoggerFactory
+from fastfit.order.infrastructure.database.postgres.sqlalchemy.models.order_base import (
+    OrderBase,
+)
+from sqlalchemy import event, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+
+ORDERS = 20_000
+ITEMS_PER_ORDER = 8
+DISHES = 50
+PAGE_SIZES = (10, 100, 1_000, ORDERS)
+ROUNDS = 5
+
+SEED = (
+    """
+    CREATE TEMPORARY TABLE bench_owner ON COMMIT DROP AS
+    SELECT gen_random_uuid() AS user_id, gen_random_uuid() AS restaurant_id
+    """,
+    """
+    INSERT INTO categories (category_id, name, restaurant_id)
+    SELECT gen_random_uuid(), 'bench', restaurant_id FROM bench_owner
+    """,
+    f"""
+    INSERT INTO dishes (
+        dish_id, name, description, price, currency, calories, proteins, fats,
+        carbohydrates, ingredients, filters, category_id, restaurant_id
+    )
+    SELECT
+        gen_random_uuid(), 'bench ' || d, '', 100 + d, 'RUB', 100 + d,
+        d % 40, d % 30, d % 80, ARRAY['bench'], ARRAY[]::dishfiltertype[],
+        c.category_id, c.restaurant_id
+    FROM categories AS c
+    JOIN bench_owner AS b USING (restaurant_id),
+    generate_series(1, {DISHES}) AS d
+    """,
+    f"""
+    INSERT INTO orders (
+        order_id, user_id, phone_number, status, delivery_type,
+        restaurant_id, created_at
+    )
+    SELECT
+        gen_random_uuid(), b.user_id, '+70000000000', 'DELIVERED', 'PICKUP',
+        b.restaurant_id, now() - make_interval(mins => o)
+    FROM bench_owner AS b, generate_series(1, {ORDERS}) AS o
+    """,
+    f"""
+    INSERT INTO order_items (order_id, dish_id, quantity, price, currency)
+    SELECT o.order_id, d.dish_id, 1 + abs(hashtext(d.name)) % 3, d.price, 'RUB'
+    FROM orders AS o
+    JOIN bench_owner AS b USING (user_id)
+    CROSS JOIN LATERAL (
+        SELECT dish_id, name, price FROM dishes
+        WHERE dishes.restaurant_id = b.restaurant_id
+        ORDER BY md5(o.order_id::text || dishes.dish_id::text)
+        LIMIT {ITEMS_PER_ORDER}
+    ) AS d
+    """,
+    "ANALYZE categories, dishes, orders, order_items",
+)
+
+
+@dataclass(frozen=True)
+class Measurement:
+    strategy: CollectionLoadingEnum
+    page_size: int
+    statements: int
+    time: float
+
+
+async def measure(
+    connection: AsyncConnection,
+    user_id: UUID,
+    strategy: CollectionLoadingEnum,
+    page_size: int,
+) -> Measurement:
+    statements = 0
+
+    def count(*_: Any) -> None:
+        nonlocal statements
+        statements += 1
+
+    stmt = (
+        select(OrderBase)
+        .where(OrderBase.user_id == user_id)
+        .order_by(OrderBase.created_at.desc(), OrderBase.order_id.desc())
+        .limit(page_size)
+        .options(load_collection(OrderBase.items, strategy))
+    )
+    timings = []
+    sync_connection = connection.sync_connection
+    event.listen(sync_connection, "before_cursor_execute", count)
+    try:
+        for _ in range(ROUNDS):
+            statements = 0
+            # NOTE: A fresh session per round, so nothing is served from the
+            # identity map of the previous one
+            async with AsyncSession(bind=connection) as session:
+                started = time.perf_counter()
+                result = await session.execute(stmt)
+                orders = result.unique().scalars().all()
+                timings.append(time.perf_counter() - started)
+            if len(orders) != min(page_size, ORDERS):
+                raise RuntimeError(f"Loaded {len(orders)} orders of {page_size}")
+    finally:
+        event.remove(sync_connection, "before_cursor_execute", count)
+
+    return Measurement(
+        strategy=strategy,
+        page_size=page_size,
+        statements=statements,
+        time=statistics.median(timings) * 1000,
+    )
+
+
+async def run_benchmark() -> None:
+    config = AppConfig.load()
+    logger = LoggerFactory.create(None, config.env, config.logger)
+    database = Database.create(
+        config.db.model_copy(update={"db_statement_timeout": None}), logger
+    )
+
+    async with database.get_engine().connect() as connection:
+        transaction = await connection.begin()
+        try:
+            for statement in SEED:
+                await connection.execute(text(statement))
+            user_id = (
+                await connection.execute(text("SELECT user_id FROM bench_owner"))
+            ).scalar_one()
+
+            measurements = [
+                await measure(connection, user_id, strategy, page_size)
+                for page_size in PAGE_SIZES
+                for strategy in CollectionLoadingEnum
+            ]
+        finally:
+            await transaction.rollback()
+
+    await database.shutdown()
+
+    sys.stdout.write(
+        f"{ORDERS} orders with {ITEMS_PER_ORDER} items each, "
+        f"median of {ROUNDS} rounds\n"
+    )
+    for m in measurements:
+        sys.stdout.write(
+            f"  {m.page_size:>6} orders  {m.strategy.value:<8}"
+            f"  {m.time:9.2f} ms  {m.statements} statement(s)\n"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
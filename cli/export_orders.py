@@ -0,0 +1,104 @@
+"""Export a restaurant's orders as CSV, one line per ordered dish.
+
+Orders are streamed from a server-side cursor in batches of
+``db_stream_yield_per``, so memory stays flat however long the period is.
+Logs go to stdout, the CSV is written to ``--output``.
+"""
+
+import asyncio
+import csv
+from argparse import ArgumentParser, Namespace
+from datetime import UTC, date, datetime, time, timedelta
+from pathlib import Path
+from uuid import UUID
+
+from bootstrap.config import AppConfig
+from common.infrastructure.database.sqlalchemy.database import Database
+from common.infrastructure.di.container.container import CommonContainer
+from common.infrastructure.logger.logging.logger_factory import LoggerFactory
+from fastfit.menu.presentation.http.fastapi.controllers import DEFAULT_RESTAURANT_ID
+from fastfit.order.infrastructure.di.container.container import OrderContainer
+
+
+HEADER = (
+    "order_id",
+    "created_at",
+    "status",
+    "delivery_type",
+    "dish",
+    "quantity",
+    "price",
+    "currency",
+)
+
+
+def parse_args() -> Namespace:
+    today = datetime.now(UTC).date()
+    parser = ArgumentParser(description="Export orders as CSV")
+    parser.add_argument("--restaurant-id", type=UUID, default=DEFAULT_RESTAURANT_ID)
+    parser.add_argument(
+        "--since",
+        type=date.fromisoformat,
+        default=today - timedelta(days=30),
+        help="First day to export (UTC), 30 days ago by default",
+    )
+    parser.add_argument(
+        "--until",
+        type=date.fromisoformat,
+        default=today,
+        help="Last day to export (UTC), today by default",
+    )
+    parser.add_argument("--output", type=Path, default=Path("orders.csv"))
+    # NOTE: Unknown arguments, such as --config, are left to the config loader
+    args, _ = parser.parse_known_args()
+    return args
+
+
+async def export_orders(args: Namespace) -> None:
+    config = AppConfig.load()
+    logger = LoggerFactory.create(None, config.env, config.logger)
+    database = Database.create(
+        config.db.model_copy(update={"db_statement_timeout": None}), logger
+    )
+
+    common_container = CommonContainer(config=config, database=database)
+    order_container = OrderContainer(
+        order_config=config.order,
+        query_executor=common_container.query_executor,
+        read_query_executor=common_container.read_query_executor,
+    )
+    order_read_repository = order_container.order_read_repository()
+
+    start = datetime.combine(args.since, time.min, UTC)
+    end = datetime.combine(args.until + timedelta(days=1), time.min, UTC)
+    exported = 0
+    with args.output.open("w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(HEADER)
+        try:
+            async with order_read_repository.stream_by_restaurant(
+                args.restaurant_id, start, end
+            ) as orders:
+                async for order in orders:
+                    writer.writerows(
+                        (
+                            order.order_id,
+                            order.created_at.isoformat(),
+                            order.status.value,
+                            order.delivery_type.value,
+                            item.dish.name,
+                            item.quantity,
+                            item.price,
+                            item.currency,
+                        )
+                        for item in order.items
+                    )
+                    exported += 1
+        finally:
+            await database.shutdown()
+
+    logger.info(f"exported {exported} orders to {args.output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(export_orders(parse_args()))
@@ -37,18 +37,23 @@ async def seed_menu() -> None:
     query_executor = common_container.query_executor
     uow = common_container.unit_of_work()
 
-    category_container = CategoryContainer(
-        query_executor=query_executor, uuid_generator=uuid_generator
-    )
-    category_factory = category_container.category_factory()
-    category_repo = category_container.category_repository()
-
     dish_container = DishContainer(
-        query_executor=query_executor, uuid_generator=uuid_generator
+        menu_config=config.menu,
+        query_executor=query_executor,
+        read_query_executor=common_container.read_query_executor,
+        uuid_generator=uuid_generator,
     )
     dish_factory = dish_container.dish_factory()
     dish_repo = dish_container.dish_repository()
 
+    category_container = CategoryContainer(
+        query_executor=query_executor,
+        uuid_generator=uuid_generator,
+        menu_snapshot_cache=dish_container.menu_snapshot_cache,
+    )
+    category_factory = category_container.category_factory()
+    category_repo = category_container.category_repository()
+
     restaurant_id = DEFAULT_RESTAURANT_ID
 
     # Категории
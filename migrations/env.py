@@ -17,10 +17,16 @@ from fastfit.menu.infrastructure.database.postgres.sqlalchemy.models.models impo
     CategoryBase,
     DishBase,
 )
+from fastfit.order.infrastructure.database.postgres.sqlalchemy.models.idempotency_key_base import (
+    IdempotencyKeyBase,
+)
 from fastfit.order.infrastructure.database.postgres.sqlalchemy.models.order_base import (
     OrderBase,
     OrderItemBase,
 )
+from fastfit.order.infrastructure.database.postgres.sqlalchemy.models.order_status_schedule_base import (
+    OrderStatusScheduleBase,
+)
 from sqlalchemy import Connection
 from sqlalchemy.ext.asyncio import AsyncEngine
 
@@ -33,6 +39,8 @@ __models__: list[type[Base]] = [
     CategoryBase,
     OrderBase,
     OrderItemBase,
+    OrderStatusScheduleBase,
+    IdempotencyKeyBase,
 ]
 
 
@@ -95,7 +103,9 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
-    database = Database.create(cfg.db, logger)
+    # NOTE: Index builds may legitimately outlast the request statement timeout
+    db_config = cfg.db.model_copy(update={"db_statement_timeout": None})
+    database = Database.create(db_config, logger)
     connectable: AsyncEngine = database.get_engine()
 
     logger.info("running migrations online using AsyncEngine")
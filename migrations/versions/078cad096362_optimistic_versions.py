@@ -0,0 +1,30 @@
+"""optimistic versions
+
+Revision ID: 078cad096362
+Revises: 107c0a37e8df
+Create Date: 2026-10-18 12:03:17.554902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '078cad096362'
+down_revision: Union[str, Sequence[str], None] = '107c0a37e8df'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('orders', sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False))
+    op.add_column('dishes', sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('dishes', 'version')
+    op.drop_column('orders', 'version')
@@ -0,0 +1,39 @@
+"""order status schedule
+
+Revision ID: 107c0a37e8df
+Revises: ad0b555bdd4a
+Create Date: 2026-10-18 10:12:41.208331
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '107c0a37e8df'
+down_revision: Union[str, Sequence[str], None] = 'ad0b555bdd4a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('order_status_schedule',
+    sa.Column('order_id', sa.UUID(), nullable=False),
+    sa.Column('status', postgresql.ENUM(name='orderstatus', create_type=False), nullable=False),
+    sa.Column('due_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['order_id'], ['orders.order_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('order_id')
+    )
+    op.create_index(op.f('ix_order_status_schedule_due_at'), 'order_status_schedule', ['due_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_order_status_schedule_due_at'), table_name='order_status_schedule')
+    op.drop_table('order_status_schedule')
@@ -0,0 +1,31 @@
+"""orders restaurant updated_at index
+
+Revision ID: 8438a9393e9f
+Revises: 4e336488f62f
+Create Date: 2026-10-18 19:41:12.530284
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8438a9393e9f'
+down_revision: Union[str, Sequence[str], None] = '4e336488f62f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # NOTE: CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index('ix_orders_restaurant_id_updated_at', 'orders', ['restaurant_id', 'updated_at'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_orders_restaurant_id_updated_at', table_name='orders', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,31 @@
+"""orders user created_at index
+
+Revision ID: a38315be255f
+Revises: 078cad096362
+Create Date: 2026-10-18 13:26:55.318042
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a38315be255f'
+down_revision: Union[str, Sequence[str], None] = '078cad096362'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # NOTE: CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index('ix_orders_user_id_created_at', 'orders', ['user_id', 'created_at', 'order_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_orders_user_id_created_at', table_name='orders', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,39 @@
+"""secondary indexes
+
+Revision ID: d24ca16e944c
+Revises: a38315be255f
+Create Date: 2026-10-18 15:02:41.907113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd24ca16e944c'
+down_revision: Union[str, Sequence[str], None] = 'a38315be255f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # NOTE: CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index('ix_orders_restaurant_id_status_created_at', 'orders', ['restaurant_id', 'status', 'created_at'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(op.f('ix_dishes_restaurant_id'), 'dishes', ['restaurant_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(op.f('ix_dishes_category_id'), 'dishes', ['category_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_dishes_filters', 'dishes', ['filters'], unique=False, postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(op.f('ix_tokens_expires_at'), 'tokens', ['expires_at'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(op.f('ix_tokens_expires_at'), table_name='tokens', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_dishes_filters', table_name='dishes', postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_dishes_category_id'), table_name='dishes', postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_dishes_restaurant_id'), table_name='dishes', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_orders_restaurant_id_status_created_at', table_name='orders', postgresql_concurrently=True, if_exists=True)
@@ -3,13 +3,22 @@ from typing import Any
 from common.infrastructure.config.config import Settings
 from common.infrastructure.config.database_config import DatabaseConfig
 from common.infrastructure.config.logger_config import LoggerConfig
+from common.infrastructure.config.metrics_config import MetricsConfig
 from fastfit.auth.infrastructure.config.auth_config import AuthConfig
+from fastfit.identity.infrastructure.config.identity_config import IdentityConfig
+from fastfit.menu.infrastructure.config.menu_config import MenuConfig
+from fastfit.order.infrastructure.config.order_config import OrderConfig
+from pydantic import Field
 
 
 class AppConfig(Settings):
     auth: AuthConfig
     db: DatabaseConfig
     logger: LoggerConfig
+    identity: IdentityConfig = Field(default_factory=IdentityConfig)
+    menu: MenuConfig = Field(default_factory=MenuConfig)
+    metrics: MetricsConfig = Field(default_factory=MetricsConfig)
+    order: OrderConfig = Field(default_factory=OrderConfig)
 
     def masked_dict(self) -> dict[str, Any]:
         return self.model_dump(
@@ -10,6 +10,9 @@ from common.infrastructure.server.fastapi.middleware.error_middleware import (
 from common.infrastructure.server.fastapi.middleware.logging_middleware import (
     LoggingMiddleware,
 )
+from common.infrastructure.server.fastapi.middleware.request_log_sampler import (
+    RequestLogSampler,
+)
 from common.infrastructure.server.fastapi.server import FastAPIServer
 from fastapi.staticfiles import StaticFiles
 
@@ -20,9 +23,15 @@ class IApp(ABC):
 
 
 class App(IApp):
-    def __init__(self, logger: logging.Logger, server: FastAPIServer) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        server: FastAPIServer,
+        request_log_sampler: RequestLogSampler | None = None,
+    ) -> None:
         self.logger = logger
         self.server = server
+        self.request_log_sampler = request_log_sampler
 
     def configure(self) -> None:
         """Must be called after configuration of sub apps."""
@@ -38,7 +47,9 @@ class App(IApp):
                 DomainErrorHandler(),
             ],
         )
-        self.server.use_middleware(LoggingMiddleware, logger=self.logger)
+        self.server.use_middleware(
+            LoggingMiddleware, logger=self.logger, sampler=self.request_log_sampler
+        )
         self.server.include_cors_middleware()
 
     def add_app(self, *apps: IApp) -> None:
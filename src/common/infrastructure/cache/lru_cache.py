@@ -0,0 +1,106 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+
+KEY = TypeVar("KEY", bound=Hashable)
+VALUE = TypeVar("VALUE")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+
+    @property
+    def requests(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.requests if self.requests else 0.0
+
+
+@dataclass
+class _Entry(Generic[VALUE]):
+    value: VALUE
+    expires_at: float | None
+
+
+class LRUCache(Generic[KEY, VALUE]):
+    """Bounded in-process LRU cache with optional per-entry TTL.
+
+    Intended to be used from a single event loop, so no locking is performed.
+    Expired entries are dropped lazily on access.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float | None = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError(f"Cache maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._entries: OrderedDict[KEY, _Entry[VALUE]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: KEY) -> VALUE | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        if entry.expires_at is not None and entry.expires_at <= self._timer():
+            del self._entries[key]
+            self._expirations += 1
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry.value
+
+    def set(self, key: KEY, value: VALUE, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = self._timer() + ttl if ttl is not None else None
+
+        self._entries[key] = _Entry(value, expires_at)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def pop(self, key: KEY) -> VALUE | None:
+        entry = self._entries.pop(key, None)
+        return entry.value if entry else None
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+            size=len(self._entries),
+        )
@@ -0,0 +1,43 @@
+from collections.abc import Callable
+
+from common.infrastructure.cache.lru_cache import CacheStats
+from common.infrastructure.metrics.registry import MetricsRegistry
+
+
+class CacheMetrics:
+    """Exports the counts of in-process caches on every render.
+
+    Caches are labelled with the name they are tracked under, so the hit rate
+    of each one is ``hit / (hit + miss)`` of its lookups.
+    """
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self.lookups = registry.counter(
+            "cache_lookups_total",
+            "Cache lookups by cache and result.",
+            ("cache", "result"),
+        )
+        self.removals = registry.counter(
+            "cache_removals_total",
+            "Entries dropped by cache and reason.",
+            ("cache", "reason"),
+        )
+        self.entries = registry.gauge(
+            "cache_entries", "Entries held by cache.", ("cache",)
+        )
+        self._caches: dict[str, Callable[[], CacheStats]] = {}
+        registry.on_collect(self.collect)
+
+    def track(self, name: str, stats: Callable[[], CacheStats]) -> None:
+        self._caches[name] = stats
+
+    def collect(self) -> None:
+        for name, stats in self._caches.items():
+            self.observe(name, stats())
+
+    def observe(self, name: str, stats: CacheStats) -> None:
+        self.lookups.set_total(stats.hits, (name, "hit"))
+        self.lookups.set_total(stats.misses, (name, "miss"))
+        self.removals.set_total(stats.evictions, (name, "evicted"))
+        self.removals.set_total(stats.expirations, (name, "expired"))
+        self.entries.set(stats.size, (name,))
@@ -1,4 +1,6 @@
+from datetime import timedelta
 from enum import Enum
+from typing import Any
 
 from pydantic import BaseModel
 
@@ -19,14 +21,64 @@ class DatabaseConfig(BaseModel):
     db_port: int
     db_driver: DatabaseDriverEnum
     db_extension: DatabaseExtensionEnum | None = None
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: timedelta = timedelta(seconds=30)
+    db_pool_recycle: timedelta | None = None
+    db_pool_pre_ping: bool = False
+    db_pool_warmup: int = 0
+    db_statement_cache_size: int = 100
+    db_compiled_cache_size: int = 500
+    db_statement_timeout: timedelta | None = None
+    db_profiling_enabled: bool = True
+    db_slow_query_threshold: timedelta | None = timedelta(milliseconds=200)
+    db_query_budget: int | None = 50
+    db_stream_yield_per: int = 1000
+    db_replica_host: str | None = None
+    db_replica_port: int | None = None
+    db_replica_lag_interval: timedelta = timedelta(seconds=5)
+
+    @property
+    def connect_args(self) -> dict[str, Any]:
+        if self.db_extension != DatabaseExtensionEnum.ASYNCPG:
+            return {}
+
+        args: dict[str, Any] = {"statement_cache_size": self.db_statement_cache_size}
+        if self.db_statement_timeout is not None:
+            timeout_ms = int(self.db_statement_timeout.total_seconds() * 1000)
+            args["server_settings"] = {"statement_timeout": str(timeout_ms)}
+        return args
+
+    @property
+    def replica_connect_args(self) -> dict[str, Any]:
+        args = self.connect_args
+        if self.db_extension != DatabaseExtensionEnum.ASYNCPG:
+            return args
+
+        # NOTE: Writes routed to the replica by mistake fail fast instead of
+        # waiting for the standby to reject them
+        server_settings = args.get("server_settings", {})
+        args["server_settings"] = {
+            **server_settings,
+            "default_transaction_read_only": "on",
+        }
+        return args
 
     @property
     def database_url(self) -> str:
+        return self._url(self.db_host, self.db_port)
+
+    @property
+    def replica_database_url(self) -> str | None:
+        if self.db_replica_host is None:
+            return None
+        return self._url(self.db_replica_host, self.db_replica_port or self.db_port)
+
+    def _url(self, host: str, port: int) -> str:
         driver_str = self.db_driver.value
         if self.db_extension:
             driver_str += f"+{self.db_extension.value}"
 
         return (
-            f"{driver_str}://{self.db_user}:{self.db_pass}"
-            f"@{self.db_host}:{self.db_port}/{self.db_name}"
+            f"{driver_str}://{self.db_user}:{self.db_pass}@{host}:{port}/{self.db_name}"
         )
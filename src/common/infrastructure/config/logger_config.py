@@ -1,7 +1,8 @@
+from datetime import timedelta
 from enum import Enum
 from typing import Any, Literal
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 
 
 class LoggingLevelEnum(Enum):
@@ -18,6 +19,17 @@ class LoggingLevelEnum(Enum):
 class LoggerConfig(BaseModel):
     level: LoggingLevelEnum = LoggingLevelEnum.INFO
     format: Literal["json", "text"] = "json"
+    # NOTE: Format and write records on a background thread instead of the caller
+    queue_enabled: bool = False
+    queue_size: int = 10_000
+    queue_overflow: Literal["drop", "sample"] = "drop"
+    queue_sample_rate: int = 10
+    queue_sample_watermark: float = 0.5
+    queue_batch_size: int = 256
+    # NOTE: Request logs of 1 in N successful requests, errors are always logged
+    request_sample_rate: int = 1
+    request_slow_threshold: timedelta | None = None
+    request_exclude_prefixes: list[str] = Field(default_factory=list)
 
     @field_validator("level", mode="before")
     @classmethod
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class MetricsConfig(BaseModel):
+    metrics_enabled: bool = True
+    metrics_path: str = "/metrics"
+    metrics_namespace: str = "fastfit"
@@ -0,0 +1,94 @@
+import weakref
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from common.infrastructure.database.sqlalchemy.models.base import Base
+from sqlalchemy import inspect
+
+
+def column_values(model: Base) -> dict[str, Any]:
+    """Column attributes set on ``model``, relationships excluded."""
+    state = inspect(model)
+    return {
+        attr.key: state.dict[attr.key]
+        for attr in state.mapper.column_attrs
+        if attr.key in state.dict
+    }
+
+
+def _related_values(model: Base, name: str) -> tuple[tuple[Any, ...], ...]:
+    return tuple(
+        tuple(sorted(column_values(child).items())) for child in getattr(model, name)
+    )
+
+
+@dataclass(frozen=True)
+class Changes:
+    values: dict[str, Any]
+    version: int | None = None
+    related: frozenset[str] = field(default_factory=frozenset)
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    entity: "weakref.ref[Any]"
+    values: dict[str, Any]
+    related: dict[str, tuple[tuple[Any, ...], ...]]
+    version: int | None
+
+
+class ChangeTracker:
+    """Remembers persisted column values of loaded entities to diff on save.
+
+    Snapshots are keyed by entity identity and dropped with the entity, so
+    tracking does not depend on the session the entity was loaded in.
+    """
+
+    def __init__(self, related: Sequence[str] = ()) -> None:
+        self._related = tuple(related)
+        self._snapshots: dict[int, _Snapshot] = {}
+
+    def track(self, entity: object, model: Base, version: int | None = None) -> None:
+        key = id(entity)
+        ref = weakref.ref(entity, lambda _: self._snapshots.pop(key, None))
+        self._snapshots[key] = _Snapshot(
+            entity=ref,
+            values=column_values(model),
+            related={name: _related_values(model, name) for name in self._related},
+            version=version,
+        )
+
+    def changes(self, entity: object, model: Base) -> Changes:
+        """Columns of ``model`` that differ from the snapshot of ``entity``.
+
+        An untracked entity yields every column and relationship, without a
+        version to check.
+        """
+        values = column_values(model)
+        snapshot = self._snapshots.get(id(entity))
+        if snapshot is None or snapshot.entity() is not entity:
+            return Changes(values, related=frozenset(self._related))
+        changed = {
+            key: value
+            for key, value in values.items()
+            if key not in snapshot.values or snapshot.values[key] != value
+        }
+        related = frozenset(
+            name
+            for name in self._related
+            if snapshot.related[name] != _related_values(model, name)
+        )
+        return Changes(changed, snapshot.version, related)
+
+    def refresh(
+        self, entity: object, model: Base, changes: Changes, bumped: bool
+    ) -> None:
+        """Record ``model`` as persisted after ``changes`` were written.
+
+        The tracked version only advances when the write ``bumped`` the row.
+        """
+        if changes.version is None:
+            return
+        version = changes.version + 1 if bumped else changes.version
+        self.track(entity, model, version)
@@ -1,9 +1,14 @@
+import asyncio
+import contextlib
 import logging
-from typing import Self
+from typing import Any, Self
 
 from common.infrastructure.config.database_config import DatabaseConfig
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from common.infrastructure.database.sqlalchemy.pool_stats import PoolStats
+from common.infrastructure.database.sqlalchemy.query_profiler import QueryProfiler
 from common.infrastructure.database.sqlalchemy.session_factory import MAKER
-from sqlalchemy import MetaData, text
+from sqlalchemy import MetaData, QueuePool, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     async_sessionmaker,
@@ -11,38 +16,164 @@ from sqlalchemy.ext.asyncio import (
 )
 
 
+# NOTE: A standby that has replayed everything it received is not lagging,
+# even if the primary has been idle since the last replayed transaction
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery()"
+    " OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE("
+    "EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+    " END"
+)
+
+
 class Database:
-    def __init__(self, engine: AsyncEngine, logger: logging.Logger):
+    def __init__(  # noqa: PLR0913
+        self,
+        engine: AsyncEngine,
+        logger: logging.Logger,
+        profiler: QueryProfiler | None = None,
+        pool_warmup: int = 0,
+        replica_engine: AsyncEngine | None = None,
+        replica_lag_interval: float = 5.0,
+    ):
         self._engine = engine
+        self._replica_engine = replica_engine
         self._logger = logger
+        self._profiler = profiler
+        self._pool_warmup = pool_warmup
+        self._replica_lag_interval = replica_lag_interval
+        self._replica_lag: float | None = None
+        self._replica_monitor: asyncio.Task[None] | None = None
+        if profiler is not None:
+            profiler.attach(engine)
+            if replica_engine is not None:
+                profiler.attach(replica_engine)
         self._create_session_maker()
 
     @classmethod
     def create(
         cls, config: DatabaseConfig, logger: logging.Logger | None = None
     ) -> Self:
+        logger = logger or logging.getLogger()
         return cls(
             engine=cls.create_engine(config),
-            logger=logger or logging.getLogger(),
+            logger=logger,
+            profiler=cls.create_profiler(config, logger),
+            pool_warmup=config.db_pool_warmup,
+            replica_engine=cls.create_replica_engine(config),
+            replica_lag_interval=config.db_replica_lag_interval.total_seconds(),
         )
 
     @staticmethod
     def create_engine(config: DatabaseConfig) -> AsyncEngine:
-        return create_async_engine(
-            config.database_url, echo=False
-        )  # echo=True for detailed logs
+        return _create_engine(config, config.database_url, config.connect_args)
+
+    @staticmethod
+    def create_replica_engine(config: DatabaseConfig) -> AsyncEngine | None:
+        url = config.replica_database_url
+        if url is None:
+            return None
+        return _create_engine(config, url, config.replica_connect_args)
+
+    @staticmethod
+    def create_profiler(
+        config: DatabaseConfig, logger: logging.Logger
+    ) -> QueryProfiler | None:
+        if not config.db_profiling_enabled:
+            return None
+        threshold = config.db_slow_query_threshold
+        return QueryProfiler(
+            logger,
+            slow_threshold_ms=threshold.total_seconds() * 1000 if threshold else None,
+            query_budget=config.db_query_budget,
+            skip_modules=(QueryExecutor.__module__,),
+        )
 
     def _create_session_maker(self) -> None:
         self._session_maker = async_sessionmaker(
             bind=self._engine, expire_on_commit=False
         )
+        self._replica_session_maker = (
+            async_sessionmaker(bind=self._replica_engine, expire_on_commit=False)
+            if self._replica_engine is not None
+            else None
+        )
 
     def get_engine(self) -> AsyncEngine:
         return self._engine
 
+    def get_replica_engine(self) -> AsyncEngine | None:
+        return self._replica_engine
+
     def get_session_maker(self) -> MAKER:
         return self._session_maker
 
+    def get_replica_session_maker(self) -> MAKER | None:
+        return self._replica_session_maker
+
+    def replica_lag(self) -> float | None:
+        """Replication delay in seconds seen by the last probe, if any."""
+        return self._replica_lag
+
+    def get_profiler(self) -> QueryProfiler | None:
+        return self._profiler
+
+    def pool_stats(self) -> PoolStats | None:
+        pool = self._engine.sync_engine.pool
+        if not isinstance(pool, QueuePool):
+            return None
+        return PoolStats(
+            size=pool.size(),
+            max_overflow=pool._max_overflow,  # noqa: SLF001
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+        )
+
+    async def warm_up(self) -> None:
+        """Open ``pool_warmup`` connections upfront so first requests skip connect."""
+        if self._pool_warmup <= 0:
+            return
+
+        self._logger.info(f"warming up {self._pool_warmup} database connections...")
+        engines = [self._engine]
+        if self._replica_engine is not None:
+            engines.append(self._replica_engine)
+        try:
+            connections = await asyncio.gather(
+                *(
+                    engine.connect().start()
+                    for engine in engines
+                    for _ in range(self._pool_warmup)
+                )
+            )
+            await asyncio.gather(*(connection.close() for connection in connections))
+        except Exception:
+            # NOTE: Service can still start, connections are opened on demand
+            self._logger.exception("database warm-up failed")
+            return
+        self._logger.info(f"database connections warmed up: {self.pool_stats()}")
+
+    async def start_replica_monitor(self) -> None:
+        if self._replica_engine is None or self._replica_monitor is not None:
+            return
+        self._replica_monitor = asyncio.create_task(
+            self._monitor_replica_lag(self._replica_engine)
+        )
+
+    async def _monitor_replica_lag(self, engine: AsyncEngine) -> None:
+        while True:
+            try:
+                async with engine.connect() as conn:
+                    lag = await conn.scalar(REPLICA_LAG_QUERY)
+                self._replica_lag = float(lag or 0)
+            except Exception:
+                self._replica_lag = None
+                self._logger.warning("replica lag probe failed", exc_info=True)
+            await asyncio.sleep(self._replica_lag_interval)
+
     async def truncate_database(self, metadata: MetaData) -> None:
         async with self._engine.begin() as conn:
             table_names = [table.name for table in metadata.sorted_tables]
@@ -55,6 +186,31 @@ class Database:
             await conn.execute(stmt)
 
     async def shutdown(self) -> None:
+        if self._replica_monitor is not None:
+            self._replica_monitor.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._replica_monitor
+            self._replica_monitor = None
+
         self._logger.info("disposing database engine...")
         await self._engine.dispose()
+        if self._replica_engine is not None:
+            await self._replica_engine.dispose()
         self._logger.info("database engine disposed gracefully")
+
+
+def _create_engine(
+    config: DatabaseConfig, url: str, connect_args: dict[str, Any]
+) -> AsyncEngine:
+    recycle = config.db_pool_recycle
+    return create_async_engine(
+        url,
+        echo=False,  # echo=True for detailed logs
+        pool_size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
+        pool_timeout=config.db_pool_timeout.total_seconds(),
+        pool_recycle=int(recycle.total_seconds()) if recycle else -1,
+        pool_pre_ping=config.db_pool_pre_ping,
+        connect_args=connect_args,
+        query_cache_size=config.db_compiled_cache_size,
+    )
@@ -1,21 +1,61 @@
-from collections.abc import Sequence
-from typing import Any, TypeVar, overload
+import sys
+import time
+from collections.abc import AsyncIterator, Callable, Mapping, Sequence
+from contextlib import (
+    AbstractAsyncContextManager,
+    AbstractContextManager,
+    asynccontextmanager,
+    nullcontext,
+)
+from typing import Any, TypeVar, cast, overload
 
+from common.application.exceptions import NotFoundError, OptimisticLockError
+from common.infrastructure.database.sqlalchemy.change_tracker import Changes
+from common.infrastructure.database.sqlalchemy.metrics import (
+    DatabaseMetrics,
+    statement_operation,
+)
 from common.infrastructure.database.sqlalchemy.models.base import Base
+from common.infrastructure.database.sqlalchemy.query_profiler import QueryProfiler
 from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
-from sqlalchemy import Delete, Insert, Result, Row, Select, Update
+from sqlalchemy import (
+    CursorResult,
+    Delete,
+    Insert,
+    Result,
+    Row,
+    Select,
+    Update,
+    inspect,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
 from sqlalchemy.sql.dml import (
+    ReturningDelete,
     ReturningInsert,
     ReturningUpdate,
 )
 
 
 RESULT = TypeVar("RESULT")
+ROW = TypeVar("ROW", bound=tuple[Any, ...])
+PARAMS = Mapping[str, Any]
+
+DEFAULT_STREAM_YIELD_PER = 1000
 
 
 class QueryExecutor:
-    def __init__(self, uow: UnitOfWork) -> None:
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        metrics: DatabaseMetrics | None = None,
+        profiler: QueryProfiler | None = None,
+        stream_yield_per: int = DEFAULT_STREAM_YIELD_PER,
+    ) -> None:
         self.uow = uow
+        self.metrics = metrics
+        self.profiler = profiler
+        self.stream_yield_per = stream_yield_per
 
     async def execute_scalar(
         self,
@@ -26,9 +66,11 @@ class QueryExecutor:
             | Delete
             | ReturningInsert[tuple[RESULT]]
             | ReturningUpdate[tuple[RESULT]]
+            | ReturningDelete[tuple[RESULT]]
         ),
+        params: PARAMS | None = None,
     ) -> RESULT:
-        return (await self.execute(statement)).unique().scalar_one()
+        return (await self.execute(statement, params)).unique().scalar_one()
 
     async def execute_scalar_one(
         self,
@@ -39,9 +81,11 @@ class QueryExecutor:
             | Delete
             | ReturningInsert[tuple[RESULT]]
             | ReturningUpdate[tuple[RESULT]]
+            | ReturningDelete[tuple[RESULT]]
         ),
+        params: PARAMS | None = None,
     ) -> RESULT | None:
-        return (await self.execute(statement)).unique().scalar_one_or_none()
+        return (await self.execute(statement, params)).unique().scalar_one_or_none()
 
     async def execute_scalar_many(
         self,
@@ -52,73 +96,219 @@ class QueryExecutor:
             | Delete
             | ReturningInsert[tuple[RESULT]]
             | ReturningUpdate[tuple[RESULT]]
+            | ReturningDelete[tuple[RESULT]]
         ),
+        params: PARAMS | None = None,
     ) -> Sequence[RESULT]:
-        return (await self.execute(statement)).unique().scalars().all()
+        return (await self.execute(statement, params)).unique().scalars().all()
 
+    # NOTE: Rows of column selects are returned as is, entities loaded with
+    # joined collections need the deduplication of the scalar methods
     async def execute_one(
         self,
-        statement: Select[tuple[RESULT, ...]],
-    ) -> Row[tuple[RESULT]] | None:
-        return (await self.execute(statement)).unique().one_or_none()
+        statement: Select[ROW],
+        params: PARAMS | None = None,
+    ) -> Row[ROW] | None:
+        return (await self.execute(statement, params)).one_or_none()
 
     async def execute_many(
         self,
-        statement: Select[tuple[RESULT, ...]],
-    ) -> Sequence[Row[tuple[RESULT]]]:
-        return (await self.execute(statement)).unique().all()
+        statement: Select[ROW],
+        params: PARAMS | None = None,
+    ) -> Sequence[Row[ROW]]:
+        return (await self.execute(statement, params)).all()
+
+    # NOTE: Streams fetch from a server-side cursor in batches of yield_per and
+    # are context managers yielding the partitions. The session stays open until
+    # the block exits, so statements issued between batches (e.g. loading
+    # children of a batch) share its connection, and leaving the block early
+    # closes the cursor and the session in the caller's context.
+    # Results are not deduplicated, joined eager collections are not supported.
+    @asynccontextmanager
+    async def stream_scalar_many(
+        self,
+        statement: Select[tuple[RESULT]],
+        params: PARAMS | None = None,
+        yield_per: int | None = None,
+    ) -> AsyncIterator[AsyncIterator[Sequence[RESULT]]]:
+        async with self._stream(statement, params, yield_per) as result:
+            yield result.scalars().partitions()
+
+    @asynccontextmanager
+    async def stream_many(
+        self,
+        statement: Select[ROW],
+        params: PARAMS | None = None,
+        yield_per: int | None = None,
+    ) -> AsyncIterator[AsyncIterator[Sequence[Row[ROW]]]]:
+        async with self._stream(statement, params, yield_per) as result:
+            yield result.partitions()
 
     @overload
     async def execute(
-        self, statement: Select[tuple[RESULT]]
+        self, statement: Select[tuple[RESULT]], params: PARAMS | None = None
     ) -> Result[tuple[RESULT]]: ...
     @overload
     async def execute(
-        self, statement: Select[tuple[RESULT, ...]]
+        self, statement: Select[tuple[RESULT, ...]], params: PARAMS | None = None
     ) -> Result[tuple[RESULT]]: ...
     @overload
+    async def execute(
+        self, statement: Select[ROW], params: PARAMS | None = None
+    ) -> Result[ROW]: ...
+    @overload
     async def execute(  # type: ignore[overload-overlap]
-        self, statement: ReturningInsert[tuple[RESULT]]
+        self, statement: ReturningInsert[tuple[RESULT]], params: PARAMS | None = None
     ) -> Result[tuple[RESULT]]: ...
     @overload
     async def execute(  # type: ignore[overload-overlap]
-        self, statement: ReturningUpdate[tuple[RESULT]]
+        self, statement: ReturningUpdate[tuple[RESULT]], params: PARAMS | None = None
     ) -> Result[tuple[RESULT]]: ...
     @overload
-    async def execute(self, statement: Insert) -> Result[tuple[()]]: ...
+    async def execute(  # type: ignore[overload-overlap]
+        self, statement: ReturningDelete[tuple[RESULT]], params: PARAMS | None = None
+    ) -> Result[tuple[RESULT]]: ...
     @overload
-    async def execute(self, statement: Update) -> Result[tuple[()]]: ...
+    async def execute(
+        self, statement: Insert, params: PARAMS | None = None
+    ) -> Result[tuple[()]]: ...
     @overload
-    async def execute(self, statement: Delete) -> Result[tuple[()]]: ...
+    async def execute(
+        self, statement: Update, params: PARAMS | None = None
+    ) -> Result[tuple[()]]: ...
+    @overload
+    async def execute(
+        self, statement: Delete, params: PARAMS | None = None
+    ) -> Result[tuple[()]]: ...
 
-    async def execute(self, statement: Any) -> Result[Any]:
-        async with self.uow.get_session() as session:
-            result = await session.execute(statement)
-            return result  # type: ignore[no-any-return]
+    async def execute(
+        self, statement: Any, params: PARAMS | None = None
+    ) -> Result[Any]:
+        # NOTE: Statements built once with bindparam() and executed with
+        # params keep their memoized cache key, so repeated calls skip both
+        # construction and cache key derivation before the compiled cache hit
+        async with self._session() as session:
+            with self._caller():
+                await self._checkout(session)
+                started = time.perf_counter()
+                result = await session.execute(statement, params)
+                self._observe(statement_operation(statement), started)
+                return result  # type: ignore[no-any-return]
 
     async def add(
         self,
         model: Base,
     ) -> None:
-        async with self.uow.get_session() as session:
-            session.add(model)
-            await session.flush()
-            session.expire_all()
+        async with self._session() as session:
+            with self._caller():
+                await self._checkout(session)
+                session.add(model)
+                await self._flush(session)
+                session.expire_all()
 
     async def add_all(
         self,
         models: Sequence[Base],
     ) -> None:
-        async with self.uow.get_session() as session:
-            session.add_all(models)
-            await session.flush()
-            session.expire_all()
+        async with self._session() as session:
+            with self._caller():
+                await self._checkout(session)
+                session.add_all(models)
+                await self._flush(session)
+                session.expire_all()
 
     async def save(
         self,
         model: Base,
     ) -> None:
-        async with self.uow.get_session() as session:
-            model = await session.merge(model)
-            await session.flush()
-            session.expire_all()
+        async with self._session() as session:
+            with self._caller():
+                await self._checkout(session)
+                started = time.perf_counter()
+                merged = await session.merge(model)
+                await session.flush()
+                self._observe("flush", started)
+                session.expire(merged)
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Defer ``callback`` until the writes issued so far are committed."""
+        self.uow.after_commit(callback)
+
+    async def update_columns(self, model: Base, changes: Changes) -> bool:
+        """Write only ``changes`` of ``model`` with a single UPDATE.
+
+        With a version the row must still carry it, the version is bumped in
+        the same statement, also when only related rows changed. Loaded
+        instances are synchronized in place instead of expiring the whole
+        session. Returns whether the row was written.
+        """
+        mapper = inspect(type(model))
+        key = {
+            mapper.get_property_by_column(column).key: column
+            for column in mapper.primary_key
+        }
+        values: dict[str, Any] = {
+            name: value for name, value in changes.values.items() if name not in key
+        }
+        if not values and (changes.version is None or not changes.related):
+            return False
+        stmt = update(type(model)).where(
+            *(column == getattr(model, name) for name, column in key.items())
+        )
+        if changes.version is not None:
+            version = mapper.columns["version"]
+            stmt = stmt.where(version == changes.version)
+            values["version"] = version + 1
+
+        result = cast(CursorResult[Any], await self.execute(stmt.values(values)))
+        if result.rowcount:
+            return True
+        if changes.version is not None:
+            raise OptimisticLockError()
+        raise NotFoundError(str(mapper.primary_key_from_instance(model)))
+
+    @asynccontextmanager
+    async def _stream(
+        self, statement: Select[Any], params: PARAMS | None, yield_per: int | None
+    ) -> AsyncIterator[AsyncResult[Any]]:
+        async with self._session() as session:
+            with self._caller():
+                await self._checkout(session)
+                started = time.perf_counter()
+                result = await session.stream(
+                    statement,
+                    params,
+                    execution_options={"yield_per": yield_per or self.stream_yield_per},
+                )
+                self._observe(statement_operation(statement), started)
+            try:
+                yield result
+            finally:
+                await result.close()
+
+    def _session(self) -> AbstractAsyncContextManager[AsyncSession]:
+        return self.uow.get_session()
+
+    def _caller(self) -> AbstractContextManager[None]:
+        if self.profiler is None:
+            return nullcontext()
+        # NOTE: Frames are walked lazily, only when a slow query is reported
+        return self.profiler.caller(sys._getframe(1))  # noqa: SLF001
+
+    async def _flush(self, session: AsyncSession) -> None:
+        started = time.perf_counter()
+        await session.flush()
+        self._observe("flush", started)
+
+    async def _checkout(self, session: AsyncSession) -> None:
+        # NOTE: The first statement of a session acquires a pooled connection,
+        # acquiring it upfront separates the pool wait from statement latency
+        if self.metrics is None or session.in_transaction():
+            return
+        started = time.perf_counter()
+        await session.connection()
+        self.metrics.observe_checkout(time.perf_counter() - started)
+
+    def _observe(self, operation: str, started: float) -> None:
+        if self.metrics is not None:
+            self.metrics.observe_query(operation, time.perf_counter() - started)
@@ -0,0 +1,35 @@
+from enum import Enum
+from typing import Any
+
+from sqlalchemy.orm import (
+    QueryableAttribute,
+    joinedload,
+    selectinload,
+    subqueryload,
+)
+from sqlalchemy.orm.interfaces import LoaderOption
+
+
+class CollectionLoadingEnum(str, Enum):
+    SELECTIN = "selectin"
+    SUBQUERY = "subquery"
+    JOINED = "joined"
+
+
+def load_collection(
+    attribute: QueryableAttribute[Any], strategy: CollectionLoadingEnum
+) -> LoaderOption:
+    """Eager load option for a one-to-many relationship.
+
+    Selectin and subquery loading fetch the collection in a second statement,
+    so the parent columns are not repeated per child. Joined loading fetches
+    everything at once at the cost of one row per child. Many-to-one
+    references stay on ``joinedload``, which adds columns but never rows.
+    """
+    match strategy:
+        case CollectionLoadingEnum.SELECTIN:
+            return selectinload(attribute)
+        case CollectionLoadingEnum.SUBQUERY:
+            return subqueryload(attribute)
+        case CollectionLoadingEnum.JOINED:
+            return joinedload(attribute)
@@ -0,0 +1,128 @@
+from typing import Any
+
+from common.infrastructure.database.sqlalchemy.pool_stats import PoolStats
+from common.infrastructure.metrics.registry import MetricsRegistry
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.engine.default import DefaultExecutionContext
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+COMPILE_CACHE_RESULTS = {
+    CacheStats.CACHE_HIT: "hit",
+    CacheStats.CACHE_MISS: "miss",
+    CacheStats.CACHING_DISABLED: "disabled",
+    CacheStats.NO_CACHE_KEY: "no_key",
+    CacheStats.NO_DIALECT_SUPPORT: "unsupported",
+}
+
+DB_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+
+
+class DatabaseMetrics:
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self.queries = registry.counter(
+            "db_queries_total", "Database statements by operation.", ("operation",)
+        )
+        self.query_duration = registry.histogram(
+            "db_query_duration_seconds",
+            "Database statement latency by operation.",
+            ("operation",),
+            buckets=DB_BUCKETS,
+        )
+        self.checkout_wait = registry.histogram(
+            "db_pool_checkout_wait_seconds",
+            "Time spent waiting for a pooled connection.",
+            buckets=DB_BUCKETS,
+        )
+        self.pool_connections = registry.gauge(
+            "db_pool_connections",
+            "Pooled connections by state.",
+            ("state",),
+        )
+        self.pool_saturation = registry.gauge(
+            "db_pool_saturation",
+            "Share of the pool capacity (size plus overflow) checked out.",
+        )
+        self.replica_lag = registry.gauge(
+            "db_replica_lag_seconds",
+            "Replication delay of the read replica at the last probe.",
+        )
+        self.compile_cache = registry.counter(
+            "db_compile_cache_total",
+            "Statement executions by compiled cache outcome.",
+            ("result",),
+        )
+
+    def attach(self, engine: AsyncEngine) -> None:
+        event.listen(engine.sync_engine, "after_cursor_execute", self._after)
+
+    def observe_query(self, operation: str, seconds: float) -> None:
+        labels = (operation,)
+        self.queries.inc(labels)
+        self.query_duration.observe(seconds, labels)
+
+    def observe_checkout(self, seconds: float) -> None:
+        self.checkout_wait.observe(seconds)
+
+    def observe_pool(self, stats: PoolStats | None) -> None:
+        if stats is None:
+            return
+        self.pool_connections.set(stats.checked_in, ("checked_in",))
+        self.pool_connections.set(stats.checked_out, ("checked_out",))
+        self.pool_connections.set(stats.overflow, ("overflow",))
+        self.pool_saturation.set(stats.saturation)
+
+    def observe_replica_lag(self, seconds: float | None) -> None:
+        if seconds is None:
+            return
+        self.replica_lag.set(seconds)
+
+    def observe_compile(self, cache_hit: CacheStats) -> None:
+        """Count a statement by how its compiled form was obtained.
+
+        Misses mean the statement was compiled from scratch, a steady stream
+        of them points at statements that vary per call or an undersized
+        ``db_compiled_cache_size``.
+        """
+        self.compile_cache.inc((COMPILE_CACHE_RESULTS.get(cache_hit, "other"),))
+
+    def _after(  # noqa: PLR0913
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        if isinstance(context, DefaultExecutionContext):
+            self.observe_compile(context.cache_hit)
+
+
+def statement_operation(statement: Any) -> str:
+    if getattr(statement, "is_select", False):
+        return "select"
+    if getattr(statement, "is_insert", False):
+        return "insert"
+    if getattr(statement, "is_update", False):
+        return "update"
+    if getattr(statement, "is_delete", False):
+        return "delete"
+    if getattr(statement, "is_text", False):
+        return "text"
+    return "other"
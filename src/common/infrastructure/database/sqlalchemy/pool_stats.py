@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    size: int
+    max_overflow: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+
+    @property
+    def capacity(self) -> int:
+        return self.size + self.max_overflow
+
+    @property
+    def saturation(self) -> float:
+        """Share of the pool capacity currently checked out."""
+        return self.checked_out / self.capacity if self.capacity else 0.0
@@ -0,0 +1,216 @@
+import hashlib
+import logging
+import re
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import FrameType
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExceptionContext, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+# NOTE: asyncpg renders typed parameters as "$1::VARCHAR", the cast is part of
+# the parameter and a "::" must never be read as a named ":param"
+_CAST = r"(?:::\w+(?: WITH(?:OUT)? TIME ZONE)?(?:\[\])*)?"
+_PARAM = re.compile(rf"(?:\$\d+|%\(\w+\)s|(?<![:\w]):\w+|\?){_CAST}")
+_PARAM_LIST = re.compile(rf"\(\s*\?{_CAST}(?:\s*,\s*\?{_CAST})*\s*\)")
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    id: str
+    statement: str
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(statement: str) -> Fingerprint:
+    """Normalize a statement so that executions differing only in values match."""
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _STRING.sub("?", normalized)
+    normalized = _PARAM.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _PARAM_LIST.sub("(...)", normalized)
+    digest = hashlib.blake2b(normalized.encode(), digest_size=8).hexdigest()
+    return Fingerprint(id=digest, statement=normalized)
+
+
+@dataclass
+class QueryStats:
+    statement: str
+    count: int = 0
+    rows: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def avg_seconds(self) -> float:
+        return self.total_seconds / self.count if self.count else 0.0
+
+
+@dataclass
+class RequestQueries:
+    label: str
+    count: int = 0
+    seconds: float = 0.0
+    fingerprints: dict[str, int] = field(default_factory=dict)
+
+
+_caller: ContextVar[FrameType | None] = ContextVar("_query_caller", default=None)
+_request: ContextVar[RequestQueries | None] = ContextVar(
+    "_request_queries", default=None
+)
+
+
+class QueryProfiler:
+    """Times every statement on the engine and keeps per-fingerprint stats.
+
+    Statements slower than ``slow_threshold_ms`` are logged together with the
+    repository method that issued them, and requests issuing more than
+    ``query_budget`` statements are reported when they finish.
+    """
+
+    _START_KEY = "query_profiler_start"
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        slow_threshold_ms: float | None = None,
+        query_budget: int | None = None,
+        skip_modules: tuple[str, ...] = (),
+    ) -> None:
+        self.logger = logger
+        self.slow_threshold_ms = slow_threshold_ms
+        self.query_budget = query_budget
+        self.skip_modules = skip_modules
+        self._stats: dict[str, QueryStats] = {}
+
+    def attach(self, engine: AsyncEngine) -> None:
+        event.listen(engine.sync_engine, "before_cursor_execute", self._before)
+        event.listen(engine.sync_engine, "after_cursor_execute", self._after)
+        event.listen(engine.sync_engine, "handle_error", self._error)
+
+    @contextmanager
+    def caller(self, frame: FrameType | None) -> Iterator[None]:
+        """Attribute statements executed inside the block to ``frame``."""
+        token = _caller.set(frame)
+        try:
+            yield
+        finally:
+            _caller.reset(token)
+
+    @contextmanager
+    def request(self, label: str) -> Iterator[RequestQueries]:
+        """Count statements issued inside the block against the query budget."""
+        queries = RequestQueries(label)
+        token = _request.set(queries)
+        try:
+            yield queries
+        finally:
+            _request.reset(token)
+            self._check_budget(queries)
+
+    def stats(self) -> dict[str, QueryStats]:
+        return dict(self._stats)
+
+    def _before(  # noqa: PLR0913
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        conn.info.setdefault(self._START_KEY, []).append(time.perf_counter())
+
+    def _after(  # noqa: PLR0913
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        elapsed = time.perf_counter() - conn.info[self._START_KEY].pop()
+        rows = max(getattr(cursor, "rowcount", -1), 0)
+        fp = fingerprint(statement)
+
+        stats = self._stats.get(fp.id)
+        if stats is None:
+            stats = self._stats[fp.id] = QueryStats(fp.statement)
+        stats.count += 1
+        stats.rows += rows
+        stats.total_seconds += elapsed
+        stats.max_seconds = max(stats.max_seconds, elapsed)
+
+        queries = _request.get()
+        if queries is not None:
+            queries.count += 1
+            queries.seconds += elapsed
+            queries.fingerprints[fp.id] = queries.fingerprints.get(fp.id, 0) + 1
+
+        elapsed_ms = elapsed * 1000
+        if self.slow_threshold_ms is not None and elapsed_ms >= self.slow_threshold_ms:
+            self.logger.warning(
+                "slow query",
+                extra={
+                    "extra": {
+                        "fingerprint": fp.id,
+                        "statement": fp.statement,
+                        "rows": rows,
+                        "duration_ms": f"{elapsed_ms:.2f}",
+                        "caller": self._caller_name(),
+                    }
+                },
+            )
+
+    def _error(self, context: ExceptionContext) -> None:
+        # NOTE: after_cursor_execute is skipped for failed statements, so the
+        # start time pushed by before_cursor_execute is dropped here
+        if context.connection is None or context.execution_context is None:
+            return
+        starts = context.connection.info.get(self._START_KEY)
+        if starts:
+            starts.pop()
+
+    def _check_budget(self, queries: RequestQueries) -> None:
+        if self.query_budget is None or queries.count <= self.query_budget:
+            return
+        repeated = sorted(
+            queries.fingerprints.items(), key=lambda item: item[1], reverse=True
+        )[:5]
+        self.logger.warning(
+            "query budget exceeded",
+            extra={
+                "extra": {
+                    "request": queries.label,
+                    "queries": queries.count,
+                    "budget": self.query_budget,
+                    "duration_ms": f"{queries.seconds * 1000:.2f}",
+                    "top_statements": [
+                        {"statement": self._stats[fp_id].statement, "count": count}
+                        for fp_id, count in repeated
+                    ],
+                }
+            },
+        )
+
+    def _caller_name(self) -> str | None:
+        frame = _caller.get()
+        while frame is not None and frame.f_globals.get("__name__", "").startswith(
+            self.skip_modules
+        ):
+            frame = frame.f_back
+        if frame is None:
+            return None
+        return f"{frame.f_globals.get('__name__')}.{frame.f_code.co_qualname}"
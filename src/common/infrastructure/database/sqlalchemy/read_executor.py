@@ -0,0 +1,53 @@
+from collections.abc import Callable, Sequence
+from contextlib import AbstractAsyncContextManager
+
+from common.application.exceptions import RepositoryError
+from common.infrastructure.database.sqlalchemy.change_tracker import Changes
+from common.infrastructure.database.sqlalchemy.executor import (
+    DEFAULT_STREAM_YIELD_PER,
+    QueryExecutor,
+)
+from common.infrastructure.database.sqlalchemy.metrics import DatabaseMetrics
+from common.infrastructure.database.sqlalchemy.models.base import Base
+from common.infrastructure.database.sqlalchemy.query_profiler import QueryProfiler
+from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class ReadQueryExecutor(QueryExecutor):
+    """Runs reads on the replica, unless a primary transaction is open.
+
+    Reads made inside an open write transaction stay on the primary, so a
+    caller always sees its own writes.
+    """
+
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        primary_uow: UnitOfWork,
+        metrics: DatabaseMetrics | None = None,
+        profiler: QueryProfiler | None = None,
+        stream_yield_per: int = DEFAULT_STREAM_YIELD_PER,
+    ) -> None:
+        super().__init__(uow, metrics, profiler, stream_yield_per)
+        self.primary_uow = primary_uow
+
+    async def add(self, model: Base) -> None:
+        raise RepositoryError("Read executor does not accept writes")
+
+    async def add_all(self, models: Sequence[Base]) -> None:
+        raise RepositoryError("Read executor does not accept writes")
+
+    async def save(self, model: Base) -> None:
+        raise RepositoryError("Read executor does not accept writes")
+
+    async def update_columns(self, model: Base, changes: Changes) -> bool:
+        raise RepositoryError("Read executor does not accept writes")
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        raise RepositoryError("Read executor does not accept writes")
+
+    def _session(self) -> AbstractAsyncContextManager[AsyncSession]:
+        if self.primary_uow.in_transaction():
+            return self.primary_uow.get_session()
+        return self.uow.get_session()
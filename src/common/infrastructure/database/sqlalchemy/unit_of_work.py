@@ -1,8 +1,8 @@
 import re
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from sqlite3 import IntegrityError
 from types import TracebackType
 from typing import Self
@@ -27,6 +27,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 class Transaction:
     session: AsyncSession
     nesting_level: int = 0
+    after_commit: list[Callable[[], None]] = field(default_factory=list)
 
     def should_commit(self) -> bool:
         return self.nesting_level == 0
@@ -57,8 +58,13 @@ class UnitOfWork(IUnitOfWork):
         except Exception as e:
             raise RepositoryError("Unnable to commit transaction") from e
 
+        callbacks = self._get_transaction().after_commit
+        while callbacks:
+            callbacks.pop(0)()
+
     async def rollback(self) -> None:
         session = self._get_session()
+        self._get_transaction().after_commit.clear()
 
         try:
             await session.rollback()
@@ -108,6 +114,21 @@ class UnitOfWork(IUnitOfWork):
         async with self as uow:
             yield uow._get_session()  # noqa: SLF001
 
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Run ``callback`` once the current transaction commits.
+
+        Callbacks are dropped on rollback. Outside a transaction the write
+        has already been committed, so the callback runs immediately.
+        """
+        if not self._transaction_exists():
+            callback()
+            return
+        self._get_transaction().after_commit.append(callback)
+
+    def in_transaction(self) -> bool:
+        """Whether the current context has an open transaction."""
+        return self._transaction_exists()
+
     async def _finalize_transaction(self, has_error: bool) -> None:
         if not self._transaction_exists():
             return
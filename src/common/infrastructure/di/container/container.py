@@ -2,7 +2,13 @@ from typing import Any
 
 from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
 from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
-from common.infrastructure.di.container.providers import provide_maker_session_factory
+from common.infrastructure.di.container.providers import (
+    provide_database_metrics,
+    provide_maker_session_factory,
+    provide_metrics_registry,
+    provide_query_profiler,
+    provide_read_query_executor,
+)
 from common.infrastructure.services.clock import SystemClock
 from common.infrastructure.services.id_generator import UUID4Generator
 from common.infrastructure.services.secrets_token_generator import SecretsTokenGenerator
@@ -18,7 +24,29 @@ class CommonContainer(containers.DeclarativeContainer):
     uuid_generator = providers.Singleton(UUID4Generator)
     token_generator = providers.Singleton(SecretsTokenGenerator)
 
+    # ---------------------- Metrics ----------------------
+    metrics_registry = providers.Singleton(
+        provide_metrics_registry, config.provided.metrics
+    )
+    database_metrics = providers.Singleton(
+        provide_database_metrics, config.provided.metrics, metrics_registry, database
+    )
+
     # ---------------------- Database ----------------------
     session_factory = providers.Singleton(provide_maker_session_factory, database)
     unit_of_work = providers.Singleton(UnitOfWork, session_factory)
-    query_executor = providers.Singleton(QueryExecutor, unit_of_work)
+    query_profiler = providers.Singleton(provide_query_profiler, database)
+    query_executor = providers.Singleton(
+        QueryExecutor,
+        unit_of_work,
+        database_metrics,
+        query_profiler,
+        config.provided.db.db_stream_yield_per,
+    )
+    read_query_executor = providers.Singleton(
+        provide_read_query_executor,
+        database,
+        query_executor,
+        database_metrics,
+        query_profiler,
+    )
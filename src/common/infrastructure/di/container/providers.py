@@ -1,9 +1,58 @@
+from common.infrastructure.config.metrics_config import MetricsConfig
 from common.infrastructure.database.sqlalchemy.database import Database
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from common.infrastructure.database.sqlalchemy.metrics import DatabaseMetrics
+from common.infrastructure.database.sqlalchemy.query_profiler import QueryProfiler
+from common.infrastructure.database.sqlalchemy.read_executor import (
+    ReadQueryExecutor,
+)
 from common.infrastructure.database.sqlalchemy.session_factory import (
     ISessionFactory,
     MakerSessionFactory,
 )
+from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
+from common.infrastructure.metrics.registry import MetricsRegistry
 
 
 def provide_maker_session_factory(database: Database) -> ISessionFactory:
     return MakerSessionFactory(database.get_session_maker())
+
+
+def provide_read_query_executor(
+    database: Database,
+    query_executor: QueryExecutor,
+    metrics: DatabaseMetrics | None,
+    profiler: QueryProfiler | None,
+) -> QueryExecutor:
+    maker = database.get_replica_session_maker()
+    if maker is None:
+        return query_executor
+    return ReadQueryExecutor(
+        UnitOfWork(MakerSessionFactory(maker)),
+        query_executor.uow,
+        metrics,
+        profiler,
+        query_executor.stream_yield_per,
+    )
+
+
+def provide_query_profiler(database: Database) -> QueryProfiler | None:
+    return database.get_profiler()
+
+
+def provide_metrics_registry(config: MetricsConfig) -> MetricsRegistry:
+    return MetricsRegistry(config.metrics_namespace)
+
+
+def provide_database_metrics(
+    config: MetricsConfig, registry: MetricsRegistry, database: Database
+) -> DatabaseMetrics | None:
+    if not config.metrics_enabled:
+        return None
+    metrics = DatabaseMetrics(registry)
+    metrics.attach(database.get_engine())
+    if (replica_engine := database.get_replica_engine()) is not None:
+        metrics.attach(replica_engine)
+    registry.on_collect(lambda: metrics.observe_pool(database.pool_stats()))
+    registry.on_collect(lambda: metrics.observe_replica_lag(database.replica_lag()))
+    return metrics
@@ -1,12 +1,24 @@
+import atexit
 import logging
+import queue
 import sys
+from typing import ClassVar
 
 from common.infrastructure.config.config import RunEnvironment
 from common.infrastructure.config.logger_config import LoggerConfig
 from common.infrastructure.logger.logging.formatter import JSONFormatter
+from common.infrastructure.logger.logging.queue_handler import (
+    BatchingQueueListener,
+    BoundedQueueHandler,
+)
 
 
 class LoggerFactory:
+    # NOTE: One queue and listener thread per process, shared by every logger
+    _queue_handler: ClassVar[BoundedQueueHandler | None] = None
+    _queue_listener: ClassVar[BatchingQueueListener | None] = None
+    _queue_loggers: ClassVar[set[logging.Logger]] = set()
+
     @classmethod
     def create(
         cls, name: str | None, env: RunEnvironment, cfg: LoggerConfig
@@ -33,8 +45,62 @@ class LoggerFactory:
                 datefmt="%Y-%m-%dT%H:%M:%S",
             )
 
+        if cfg.queue_enabled:
+            logger.addHandler(LoggerFactory.create_queue_handler(cfg, formatter))
+            LoggerFactory._queue_loggers.add(logger)
+            return logger
+
         stream_handler = logging.StreamHandler(sys.stdout)
         stream_handler.setFormatter(formatter)
         logger.addHandler(stream_handler)
 
         return logger
+
+    @classmethod
+    def create_queue_handler(
+        cls, cfg: LoggerConfig, formatter: logging.Formatter
+    ) -> BoundedQueueHandler:
+        if cls._queue_handler is not None:
+            return cls._queue_handler
+
+        log_queue: queue.Queue[logging.LogRecord | None] = queue.Queue(cfg.queue_size)
+        listener = BatchingQueueListener(
+            log_queue, formatter, sys.stdout, batch_size=cfg.queue_batch_size
+        )
+        listener.start()
+        # NOTE: Flush pending records when the interpreter exits without shutdown
+        atexit.register(cls.shutdown)
+
+        cls._queue_listener = listener
+        cls._queue_handler = BoundedQueueHandler(
+            log_queue,
+            overflow=cfg.queue_overflow,
+            sample_rate=cfg.queue_sample_rate,
+            sample_watermark=cfg.queue_sample_watermark,
+        )
+        return cls._queue_handler
+
+    @classmethod
+    def queue_handler(cls) -> BoundedQueueHandler | None:
+        return cls._queue_handler
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Stop the shared listener, writing out everything still queued.
+
+        Loggers fall back to writing synchronously, so records of the remaining
+        teardown are not lost.
+        """
+        handler, listener = cls._queue_handler, cls._queue_listener
+        if handler is None or listener is None:
+            return
+        cls._queue_handler = None
+        cls._queue_listener = None
+
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(listener.formatter)
+        for logger in cls._queue_loggers:
+            logger.removeHandler(handler)
+            logger.addHandler(stream_handler)
+        cls._queue_loggers.clear()
+        listener.stop()
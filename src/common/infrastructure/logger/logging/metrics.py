@@ -0,0 +1,25 @@
+from common.infrastructure.logger.logging.queue_handler import BoundedQueueHandler
+from common.infrastructure.metrics.registry import MetricsRegistry
+
+
+class LogQueueMetrics:
+    """Exports the counts of the shared log queue handler on every render."""
+
+    def __init__(self, registry: MetricsRegistry, handler: BoundedQueueHandler) -> None:
+        self.handler = handler
+        self.records = registry.counter(
+            "log_queue_records_total",
+            "Log records offered to the queue by outcome.",
+            ("outcome",),
+        )
+        self.pending = registry.gauge(
+            "log_queue_pending", "Log records queued and not yet written."
+        )
+        registry.on_collect(self.collect)
+
+    def collect(self) -> None:
+        stats = self.handler.stats()
+        self.records.set_total(stats.enqueued, ("enqueued",))
+        self.records.set_total(stats.dropped, ("dropped",))
+        self.records.set_total(stats.sampled_out, ("sampled_out",))
+        self.pending.set(stats.pending)
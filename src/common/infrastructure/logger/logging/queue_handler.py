@@ -0,0 +1,146 @@
+import contextlib
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+from logging.handlers import QueueHandler
+from typing import Literal, TextIO
+
+
+@dataclass(frozen=True)
+class LogQueueStats:
+    enqueued: int
+    dropped: int
+    sampled_out: int
+    pending: int
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Non-blocking handler putting records on a bounded queue.
+
+    Records that do not fit are dropped. With ``overflow="sample"`` only one in
+    ``sample_rate`` records below WARNING is kept once the queue fills past
+    ``sample_watermark``, so bursts thin out before anything has to be dropped.
+    """
+
+    def __init__(
+        self,
+        log_queue: "queue.Queue[logging.LogRecord | None]",
+        overflow: Literal["drop", "sample"] = "drop",
+        sample_rate: int = 10,
+        sample_watermark: float = 0.5,
+    ) -> None:
+        super().__init__(log_queue)
+        self.log_queue = log_queue
+        self.overflow = overflow
+        self.sample_rate = sample_rate
+        self.sample_threshold = int(log_queue.maxsize * sample_watermark)
+        self._seen = 0
+        self.enqueued = 0
+        self.dropped = 0
+        self.sampled_out = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # NOTE: Formatting is left to the listener, only the message is resolved
+        # so that mutable arguments cannot change before it is written
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self._sampled_out(record):
+            self.sampled_out += 1
+            return
+        try:
+            self.log_queue.put_nowait(record)
+            self.enqueued += 1
+        except queue.Full:
+            self.dropped += 1
+
+    def stats(self) -> LogQueueStats:
+        return LogQueueStats(
+            enqueued=self.enqueued,
+            dropped=self.dropped,
+            sampled_out=self.sampled_out,
+            pending=self.log_queue.qsize(),
+        )
+
+    def _sampled_out(self, record: logging.LogRecord) -> bool:
+        if self.overflow != "sample" or record.levelno >= logging.WARNING:
+            return False
+        if self.log_queue.qsize() < self.sample_threshold:
+            return False
+        self._seen += 1
+        return self._seen % self.sample_rate != 0
+
+
+class BatchingQueueListener:
+    """Background thread formatting queued records and writing them in batches.
+
+    Everything already queued when a record arrives is written with one call.
+    """
+
+    def __init__(
+        self,
+        log_queue: "queue.Queue[logging.LogRecord | None]",
+        formatter: logging.Formatter,
+        stream: TextIO,
+        batch_size: int = 256,
+    ) -> None:
+        self.log_queue = log_queue
+        self.formatter = formatter
+        self.stream = stream
+        self.batch_size = batch_size
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="log-queue-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self.log_queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = [self.log_queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.log_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            records = [record for record in batch if record is not None]
+            stopping = len(records) != len(batch)
+            self._write(records)
+
+        # NOTE: Drain whatever was queued behind the stop sentinel
+        remaining: list[logging.LogRecord] = []
+        while True:
+            try:
+                record = self.log_queue.get_nowait()
+            except queue.Empty:
+                break
+            if record is not None:
+                remaining.append(record)
+        self._write(remaining)
+
+    def _write(self, records: list[logging.LogRecord]) -> None:
+        if not records:
+            return
+        lines: list[str] = []
+        for record in records:
+            try:
+                lines.append(self.formatter.format(record))
+            except Exception:
+                # NOTE: A broken record must never stop the listener
+                continue
+        with contextlib.suppress(Exception):
+            self.stream.write("\n".join(lines) + "\n")
+            self.stream.flush()
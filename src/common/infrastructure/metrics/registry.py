@@ -0,0 +1,191 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+from typing import TypeVar
+
+
+LABELS = tuple[str, ...]
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return f"{{{pairs}}}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Metric(ABC):
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: LABELS) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+
+    @abstractmethod
+    def samples(self) -> list[str]: ...
+
+    def render(self) -> str:
+        header = (
+            f"# HELP {self.name} {self.documentation}\n"
+            f"# TYPE {self.name} {self.type_name}\n"
+        )
+        return header + "".join(f"{line}\n" for line in self.samples())
+
+
+class Counter(Metric):
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: LABELS = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LABELS, float] = {}
+
+    def inc(self, labels: LABELS = (), amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def set_total(self, value: float, labels: LABELS = ()) -> None:
+        """Mirror a total that is counted elsewhere, e.g. from a collector."""
+        self._values[labels] = value
+
+    def samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} "
+            f"{_format_value(value)}"
+            for labels, value in self._values.items()
+        ]
+
+
+class Gauge(Counter):
+    type_name = "gauge"
+
+    def dec(self, labels: LABELS = (), amount: float = 1.0) -> None:
+        self.inc(labels, -amount)
+
+    def set(self, value: float, labels: LABELS = ()) -> None:
+        self._values[labels] = value
+
+
+class _HistogramValue:
+    __slots__ = ("buckets", "count", "sum")
+
+    def __init__(self, size: int) -> None:
+        self.buckets = [0] * size
+        self.count = 0
+        self.sum = 0.0
+
+
+class Histogram(Metric):
+    """Fixed-bucket histogram, observing is a bisect and three increments."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: LABELS = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.bounds = tuple(sorted(buckets))
+        self._values: dict[LABELS, _HistogramValue] = {}
+
+    def observe(self, value: float, labels: LABELS = ()) -> None:
+        histogram = self._values.get(labels)
+        if histogram is None:
+            histogram = self._values[labels] = _HistogramValue(len(self.bounds) + 1)
+        histogram.buckets[bisect_left(self.bounds, value)] += 1
+        histogram.count += 1
+        histogram.sum += value
+
+    def samples(self) -> list[str]:
+        lines: list[str] = []
+        names = (*self.labelnames, "le")
+        for labels, histogram in self._values.items():
+            cumulative = 0
+            bounds = [*map(_format_value, self.bounds), "+Inf"]
+            for bound, count in zip(bounds, histogram.buckets, strict=True):
+                cumulative += count
+                bucket_labels = _format_labels(names, (*labels, bound))
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            label_str = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_str} {_format_value(histogram.sum)}")
+            lines.append(f"{self.name}_count{label_str} {histogram.count}")
+        return lines
+
+
+METRIC = TypeVar("METRIC", bound=Metric)
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered in the Prometheus text format.
+
+    Metrics are updated from the event loop only, so plain dictionaries are
+    enough and no locks are taken on the request path.
+    """
+
+    def __init__(self, namespace: str = "") -> None:
+        self.namespace = namespace
+        self._metrics: dict[str, Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+
+    def counter(
+        self, name: str, documentation: str, labelnames: LABELS = ()
+    ) -> Counter:
+        return self._register(Counter(self._name(name), documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: LABELS = ()) -> Gauge:
+        return self._register(Gauge(self._name(name), documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: LABELS = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(
+            Histogram(self._name(name), documentation, labelnames, buckets)
+        )
+
+    def on_collect(self, collector: Callable[[], None]) -> None:
+        """Run ``collector`` before every render, e.g. to refresh sampled gauges."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        for collector in self._collectors:
+            collector()
+        return "".join(metric.render() for metric in self._metrics.values())
+
+    def _name(self, name: str) -> str:
+        return f"{self.namespace}_{name}" if self.namespace else name
+
+    def _register(self, metric: METRIC) -> METRIC:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
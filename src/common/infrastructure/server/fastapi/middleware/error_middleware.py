@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Callable
 from typing import ClassVar
 
 from common.application.exceptions import (
@@ -10,9 +9,9 @@ from common.application.exceptions import (
     RepositoryError,
 )
 from common.domain.exceptions import DomainError
-from fastapi import FastAPI, Request, Response, status
+from fastapi import Request, status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
 class IHTTPErrorHandler(ABC):
@@ -81,25 +80,45 @@ class RepositoryErrorHandler(IHTTPErrorHandler):
         )
 
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app: FastAPI, handlers: list[IHTTPErrorHandler]):
-        super().__init__(app)
+class ErrorHandlingMiddleware:
+    """Pure ASGI middleware translating exceptions through a handler chain.
+
+    Handlers are tried in order, the first one able to handle the exception
+    builds the response. Once the response has started it can no longer be
+    replaced, so the exception is re-raised.
+    """
+
+    def __init__(self, app: ASGIApp, handlers: list[IHTTPErrorHandler]) -> None:
+        self.app = app
         self.handlers = handlers
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
-            for handler in self.handlers:
-                if handler.can_handle(exc):
-                    return handler.handle(request, exc)
+            if response_started:
+                raise
+            response = self.handle(Request(scope, receive), exc)
+            await response(scope, receive, send)
 
-            return JSONResponse(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                content={"error": "InternalError", "detail": str(exc)},
-            )
+    def handle(self, request: Request, exc: Exception) -> JSONResponse:
+        for handler in self.handlers:
+            if handler.can_handle(exc):
+                return handler.handle(request, exc)
+
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content={"error": "InternalError", "detail": str(exc)},
+        )
@@ -5,22 +5,40 @@ import uuid
 from collections.abc import Awaitable, Callable
 from typing import Any
 
+from common.infrastructure.server.fastapi.middleware.request_log_sampler import (
+    RequestLogSampler,
+)
 from fastapi import FastAPI, Request, Response, status
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app: FastAPI, logger: logging.Logger):
-        super().__init__(app)
-        self.logger = logger
+class LoggingMiddleware:
+    """Pure ASGI middleware logging requests with their status and timing.
 
-    async def dispatch(
+    Timing covers the whole response, including a streamed body. Which requests
+    are logged is decided by the sampler, by default every one of them.
+    """
+
+    def __init__(
         self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+        app: ASGIApp,
+        logger: logging.Logger,
+        sampler: RequestLogSampler | None = None,
+    ) -> None:
+        self.app = app
+        self.logger = logger
+        self.sampler = sampler or RequestLogSampler()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.sampler.is_excluded(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        sampled = self.sampler.sample()
+        request = Request(scope)
         request_id = str(uuid.uuid4())
-        start_time = time.time()
+        start_time = time.perf_counter()
         extra: dict[str, Any] = {
             "request_id": request_id,
             "method": request.method,
@@ -29,47 +47,70 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             "query_params": dict(request.query_params),
         }
 
-        self.logger.info("incoming request", extra={"extra": extra})
+        if sampled:
+            self.logger.info("incoming request", extra={"extra": extra})
+
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
         try:
-            response: Response = await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         except Exception:
             # NOTE: Normally shouldn't be invoked
-            process_time = (time.time() - start_time) * 1000
+            process_time = (time.perf_counter() - start_time) * 1000
             extra.update(
                 {
                     "process_time_ms": f"{process_time:.2f}",
                 }
             )
 
+            if not sampled:
+                self.sampler.force()
             self.logger.exception(
                 "request failed",
                 extra={"extra": extra},
             )
             raise
 
-        process_time = (time.time() - start_time) * 1000
-        if response.status_code >= status.HTTP_400_BAD_REQUEST:
-            extra.update(
-                {
-                    "status_code": response.status_code,
-                    "process_time_ms": f"{process_time:.2f}",
-                }
-            )
-            self.logger.error(
-                "request completed with error status",
-                extra={"extra": extra},
-            )
-            return response
-
+        process_time = (time.perf_counter() - start_time) * 1000
         extra.update(
             {
-                "status_code": response.status_code,
+                "status_code": status_code,
                 "process_time_ms": f"{process_time:.2f}",
             }
         )
-        self.logger.info("request completed successfully", extra={"extra": extra})
-        return response
+        self._log_completed(extra, status_code, process_time, sampled)
+
+    def _log_completed(
+        self,
+        extra: dict[str, Any],
+        status_code: int,
+        process_time: float,
+        sampled: bool,
+    ) -> None:
+        if status_code >= status.HTTP_400_BAD_REQUEST:
+            if not sampled:
+                self.sampler.force()
+            self.logger.error(
+                "request completed with error status",
+                extra={"extra": extra},
+            )
+            return
+
+        if self.sampler.is_slow(process_time):
+            if not sampled:
+                self.sampler.force()
+            self.logger.warning("request completed slowly", extra={"extra": extra})
+            return
+
+        if sampled:
+            extra["sample_rate"] = self.sampler.sample_rate
+            self.logger.info("request completed successfully", extra={"extra": extra})
 
 
 class TraceMiddleware(BaseHTTPMiddleware):
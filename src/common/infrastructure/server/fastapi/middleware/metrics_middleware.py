@@ -0,0 +1,74 @@
+import time
+
+from common.infrastructure.metrics.registry import MetricsRegistry
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class HTTPMetrics:
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self.requests = registry.counter(
+            "http_requests_total",
+            "HTTP requests by method, route template and status code.",
+            ("method", "route", "status"),
+        )
+        self.duration = registry.histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency by method and route template.",
+            ("method", "route"),
+        )
+        self.in_flight = registry.gauge(
+            "http_requests_in_flight", "HTTP requests currently being served."
+        )
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording request counts, latency and concurrency.
+
+    Requests are labelled with the route template (``/orders/{order_id}``) so
+    the number of series stays bounded regardless of the URLs requested.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: HTTPMetrics) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        root_path = scope.get("root_path", "")
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        self.metrics.in_flight.inc()
+        start_time = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start_time
+            self.metrics.in_flight.dec()
+
+            method = scope["method"]
+            route = self._route_template(scope, root_path)
+            self.metrics.requests.inc((method, route, str(status_code)))
+            self.metrics.duration.observe(elapsed, (method, route))
+
+    @staticmethod
+    def _route_template(scope: Scope, root_path: str) -> str:
+        route = scope.get("route")
+        if route is not None:
+            return str(route.path)
+        # NOTE: Mounted apps (static files) only extend the root path
+        mount_path = scope.get("root_path", "")
+        if mount_path != root_path:
+            return f"{mount_path.removeprefix(root_path)}/{{path}}"
+        return UNMATCHED_ROUTE
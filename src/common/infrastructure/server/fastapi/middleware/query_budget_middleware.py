@@ -0,0 +1,22 @@
+from common.infrastructure.database.sqlalchemy.query_profiler import QueryProfiler
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class QueryBudgetMiddleware:
+    """Pure ASGI middleware counting the statements issued by each request."""
+
+    def __init__(self, app: ASGIApp, profiler: QueryProfiler) -> None:
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with self.profiler.request(f"{scope['method']} {scope['path']}") as queries:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                if (route := scope.get("route")) is not None:
+                    queries.label = f"{scope['method']} {route.path}"
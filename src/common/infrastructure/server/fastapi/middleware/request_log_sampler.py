@@ -0,0 +1,111 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Self
+
+from common.infrastructure.config.logger_config import LoggerConfig
+from common.infrastructure.metrics.registry import MetricsRegistry
+
+
+@dataclass(frozen=True)
+class RequestLogStats:
+    excluded: int
+    sampled_in: int
+    sampled_out: int
+    forced: int
+    sample_rate: int
+
+
+class RequestLogSampler:
+    """Decides which requests are logged by LoggingMiddleware.
+
+    One in ``sample_rate`` requests is sampled in. Failed requests and requests
+    slower than ``slow_threshold_ms`` are logged regardless (``forced``).
+    Requests under an excluded path prefix are not logged at all.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 1,
+        slow_threshold_ms: float | None = None,
+        exclude_prefixes: Iterable[str] = (),
+    ) -> None:
+        if sample_rate < 1:
+            raise ValueError(f"Sample rate must be positive, got {sample_rate}")
+        self.sample_rate = sample_rate
+        self.slow_threshold_ms = slow_threshold_ms
+        self.exclude_prefixes = tuple(exclude_prefixes)
+        self._requests = 0
+        self._excluded = 0
+        self._sampled_in = 0
+        self._sampled_out = 0
+        self._forced = 0
+
+    @classmethod
+    def from_config(cls, cfg: LoggerConfig) -> Self:
+        slow_threshold = cfg.request_slow_threshold
+        return cls(
+            sample_rate=cfg.request_sample_rate,
+            slow_threshold_ms=(
+                slow_threshold.total_seconds() * 1000 if slow_threshold else None
+            ),
+            exclude_prefixes=cfg.request_exclude_prefixes,
+        )
+
+    def is_excluded(self, path: str) -> bool:
+        if self.exclude_prefixes and path.startswith(self.exclude_prefixes):
+            self._excluded += 1
+            return True
+        return False
+
+    def sample(self) -> bool:
+        self._requests += 1
+        if self._requests % self.sample_rate == 0:
+            self._sampled_in += 1
+            return True
+        self._sampled_out += 1
+        return False
+
+    def is_slow(self, process_time_ms: float) -> bool:
+        return (
+            self.slow_threshold_ms is not None
+            and process_time_ms >= self.slow_threshold_ms
+        )
+
+    def force(self) -> None:
+        self._forced += 1
+
+    def stats(self) -> RequestLogStats:
+        return RequestLogStats(
+            excluded=self._excluded,
+            sampled_in=self._sampled_in,
+            sampled_out=self._sampled_out,
+            forced=self._forced,
+            sample_rate=self.sample_rate,
+        )
+
+
+class RequestLogMetrics:
+    """Exports the sampler counts on every render.
+
+    Dashboards multiply sampled request log counts by ``sample_rate``.
+    """
+
+    def __init__(self, registry: MetricsRegistry, sampler: RequestLogSampler) -> None:
+        self.sampler = sampler
+        self.requests = registry.counter(
+            "request_log_requests_total",
+            "Requests seen by the request log sampler by decision.",
+            ("decision",),
+        )
+        self.sample_rate = registry.gauge(
+            "request_log_sample_rate", "One in this many requests is logged."
+        )
+        registry.on_collect(self.collect)
+
+    def collect(self) -> None:
+        stats = self.sampler.stats()
+        self.requests.set_total(stats.excluded, ("excluded",))
+        self.requests.set_total(stats.sampled_in, ("sampled_in",))
+        self.requests.set_total(stats.sampled_out, ("sampled_out",))
+        self.requests.set_total(stats.forced, ("forced",))
+        self.sample_rate.set(stats.sample_rate)
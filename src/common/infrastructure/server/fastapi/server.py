@@ -7,9 +7,14 @@ from enum import Enum
 from functools import wraps
 from typing import Any, TypeVar
 
-from fastapi import APIRouter, FastAPI
+from common.infrastructure.metrics.registry import MetricsRegistry
+from common.infrastructure.server.fastapi.middleware.metrics_middleware import (
+    HTTPMetrics,
+    MetricsMiddleware,
+)
+from fastapi import APIRouter, FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp
 
 
 DEPENDENCY = TypeVar("DEPENDENCY", bound=ABC)
@@ -64,9 +69,9 @@ class FastAPIServer:
                     )
 
     def use_middleware(
-        self, middleware: type[BaseHTTPMiddleware], **options: Any
+        self, middleware: Callable[..., ASGIApp], **options: Any
     ) -> None:
-        self._app.add_middleware(middleware, **options)  # type: ignore[arg-type]
+        self._app.add_middleware(middleware, **options)
         self.logger.info("middleware %s added", middleware)
 
     def include_cors_middleware(self) -> None:
@@ -79,6 +84,19 @@ class FastAPIServer:
         )
         self.logger.info("CORS middleware added with allow_origins=['*']")
 
+    def expose_metrics(self, registry: MetricsRegistry, path: str = "/metrics") -> None:
+        """Record HTTP metrics and serve the registry in the Prometheus format.
+
+        Should be called last so that the layer sees the final status codes.
+        """
+        self.use_middleware(MetricsMiddleware, metrics=HTTPMetrics(registry))
+
+        async def metrics() -> Response:
+            return Response(registry.render(), media_type="text/plain; version=0.0.4")
+
+        self._app.add_api_route(path, metrics, include_in_schema=False)
+        self.logger.info(f"metrics exposed: path={path}")
+
     def register_router(
         self, router: APIRouter, prefix: str, tags: list[str | Enum] | None
     ) -> None:
@@ -0,0 +1,44 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Self
+
+
+SLOT = "<!--fastfit:slot-->"
+
+
+def _digest(data: bytes, size: int = 16) -> str:
+    return hashlib.blake2b(data, digest_size=size).hexdigest()
+
+
+@dataclass(frozen=True)
+class RenderedPage:
+    """Pre-rendered HTML split around a single per-request slot."""
+
+    head: bytes
+    tail: bytes
+    digest: str
+
+    @classmethod
+    def create(cls, html: str, slot: str = SLOT) -> Self:
+        head, _, tail = html.partition(slot)
+        head_bytes, tail_bytes = head.encode(), tail.encode()
+        return cls(
+            head=head_bytes, tail=tail_bytes, digest=_digest(head_bytes + tail_bytes)
+        )
+
+    def body(self, fragment: bytes = b"") -> bytes:
+        return b"".join((self.head, fragment, self.tail))
+
+    def etag(self, fragment: bytes = b"") -> str:
+        """Strong ETag of the body produced for the given fragment."""
+        return f'"{self.digest}.{_digest(fragment, 8)}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison as required for If-None-Match (RFC 9110, 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in tags
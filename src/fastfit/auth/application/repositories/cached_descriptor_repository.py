@@ -0,0 +1,44 @@
+from uuid import UUID
+
+from fastfit.auth.application.interfaces.repositories.descriptor_repository import (
+    IIdentityDescriptorRepository,
+)
+from fastfit.identity.application.exceptions import IdentityNotFoundError
+from fastfit.identity.application.interfaces.services.identity_descriptor_cache import (
+    IIdentityDescriptorCache,
+)
+from fastfit.identity.domain.value_objects.descriptor import IdentityDescriptor
+
+
+class CachedIdentityDescriptorRepository(IIdentityDescriptorRepository):
+    """Serves descriptors from the cache, loading them on a miss.
+
+    Without a cache every descriptor is loaded from the wrapped repository.
+    """
+
+    def __init__(
+        self,
+        descriptor_repository: IIdentityDescriptorRepository,
+        descriptor_cache: IIdentityDescriptorCache | None = None,
+    ) -> None:
+        self.descriptor_repository = descriptor_repository
+        self.descriptor_cache = descriptor_cache
+
+    async def get_by_id(self, identity_id: UUID) -> IdentityDescriptor:
+        if self.descriptor_cache is None:
+            return await self.descriptor_repository.get_by_id(identity_id)
+
+        descriptor = self.descriptor_cache.get(identity_id)
+        if descriptor is not None:
+            return descriptor
+        if self.descriptor_cache.is_missing(identity_id):
+            raise IdentityNotFoundError(identity_id)
+
+        try:
+            descriptor = await self.descriptor_repository.get_by_id(identity_id)
+        except IdentityNotFoundError:
+            self.descriptor_cache.put_missing(identity_id)
+            raise
+
+        self.descriptor_cache.put(descriptor)
+        return descriptor
@@ -9,3 +9,8 @@ class AuthConfig(BaseModel):
     issuer: str
     access_token_ttl: timedelta = timedelta(minutes=15)
     refresh_token_ttl: timedelta = timedelta(days=7)
+    claims_cache_enabled: bool = True
+    claims_cache_max_size: int = 10_000
+    # NOTE: Sign the username into access tokens and trust it instead of
+    # looking the identity up on every authenticated request
+    username_claim: bool = False
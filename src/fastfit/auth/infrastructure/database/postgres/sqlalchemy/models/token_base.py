@@ -15,6 +15,6 @@ class TokenBase(Base):
     value: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     issued_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     expires_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False
+        DateTime(timezone=True), nullable=False, index=True
     )
     revoked: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
@@ -10,7 +10,19 @@ from fastfit.auth.infrastructure.database.postgres.sqlalchemy.mappers.token_mapp
 from fastfit.auth.infrastructure.database.postgres.sqlalchemy.models.token_base import (
     TokenBase,
 )
-from sqlalchemy import select, update
+from sqlalchemy import bindparam, select, update
+
+
+# NOTE: Built once, calls only bind the token value
+GET_BY_VALUE = select(TokenBase).where(TokenBase.value == bindparam("token_value"))
+# NOTE: The evaluate strategy reads bindparam() defaults, not the executed
+# params, so loaded tokens are synchronized from RETURNING instead
+REVOKE = (
+    update(TokenBase)
+    .where(TokenBase.value == bindparam("token_value"))
+    .values(revoked=True)
+    .execution_options(synchronize_session="fetch")
+)
 
 
 class RefreshTokenRepository(IRefreshTokenRepository):
@@ -18,15 +30,15 @@ class RefreshTokenRepository(IRefreshTokenRepository):
         self.executor = executor
 
     async def get(self, value: str) -> Token:
-        stmt = select(TokenBase).where(TokenBase.value == value)
-        result = await self.executor.execute_scalar_one(stmt)
+        result = await self.executor.execute_scalar_one(
+            GET_BY_VALUE, {"token_value": value}
+        )
         if not result:
             raise NotFoundError(value)
         return TokenMapper.to_domain(result)
 
     async def revoke(self, value: str) -> None:
-        stmt = update(TokenBase).where(TokenBase.value == value).values(revoked=True)
-        await self.executor.execute(stmt)
+        await self.executor.execute(REVOKE, {"token_value": value})
 
     async def add(self, token: Token) -> None:
         base = TokenMapper.to_persistence(token)
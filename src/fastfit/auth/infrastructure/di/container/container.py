@@ -1,6 +1,9 @@
 from typing import Any
 
 from dependency_injector import containers, providers
+from fastfit.auth.application.repositories.cached_descriptor_repository import (
+    CachedIdentityDescriptorRepository,
+)
 from fastfit.auth.application.repositories.descriptor_repository import (
     IdentityDescriptorRepository,
 )
@@ -16,6 +19,7 @@ from fastfit.auth.application.usecases.command.verify_code_use_case import (
 from fastfit.auth.infrastructure.database.postgres.sqlalchemy.repositories.refresh_token_repository import (
     RefreshTokenRepository,
 )
+from fastfit.auth.infrastructure.di.container.providers import provide_claims_cache
 from fastfit.auth.infrastructure.services.jwt.token_introspector import (
     JWTTokenIntrospector,
 )
@@ -33,12 +37,15 @@ class TokenContainer(containers.DeclarativeContainer):
 
     query_executor: providers.Dependency[Any] = providers.Dependency()
     identity_repository: providers.Dependency[Any] = providers.Dependency()
+    descriptor_cache: providers.Dependency[Any] = providers.Dependency()
 
     refresh_token_repository = providers.Singleton(
         RefreshTokenRepository, query_executor
     )
     identity_descriptor_repository = providers.Singleton(
-        IdentityDescriptorRepository, identity_repository
+        CachedIdentityDescriptorRepository,
+        providers.Singleton(IdentityDescriptorRepository, identity_repository),
+        descriptor_cache,
     )
 
     token_issuer = providers.Singleton(
@@ -48,6 +55,7 @@ class TokenContainer(containers.DeclarativeContainer):
         uuid_generator=uuid_generator,
         clock=clock,
         refresh_token_repository=refresh_token_repository,
+        descriptor_repository=identity_descriptor_repository,
     )
     token_revoker = providers.Singleton(
         JWTTokenRevoker,
@@ -61,11 +69,13 @@ class TokenContainer(containers.DeclarativeContainer):
         clock=clock,
         refresh_token_repository=refresh_token_repository,
     )
+    claims_cache = providers.Singleton(provide_claims_cache, auth_config)
     token_introspector = providers.Singleton(
         JWTTokenIntrospector,
         config=auth_config,
         descriptor_repository=identity_descriptor_repository,
         clock=clock,
+        claims_cache=claims_cache,
     )
 
 
@@ -0,0 +1,8 @@
+from fastfit.auth.infrastructure.config.auth_config import AuthConfig
+from fastfit.auth.infrastructure.services.jwt.claims_cache import TokenClaimsCache
+
+
+def provide_claims_cache(config: AuthConfig) -> TokenClaimsCache | None:
+    if not config.claims_cache_enabled:
+        return None
+    return TokenClaimsCache(config.claims_cache_max_size)
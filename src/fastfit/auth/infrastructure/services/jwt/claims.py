@@ -10,6 +10,7 @@ class TokenClaims:
     iss: str
     iat: datetime
     exp: datetime
+    username: str | None = None
 
     @property
     def identity_id(self) -> UUID:
@@ -22,5 +23,12 @@ class TokenClaims:
         issuer: str,
         issued_at: datetime,
         expires_at: datetime,
+        username: str | None = None,
     ) -> Self:
-        return cls(sub=identity_id, iss=issuer, iat=issued_at, exp=expires_at)
+        return cls(
+            sub=identity_id,
+            iss=issuer,
+            iat=issued_at,
+            exp=expires_at,
+            username=username,
+        )
@@ -0,0 +1,96 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+
+from common.infrastructure.cache.lru_cache import CacheStats, LRUCache
+from common.infrastructure.cache.metrics import CacheMetrics
+from common.infrastructure.metrics.registry import MetricsRegistry
+from fastfit.auth.infrastructure.services.jwt.claims import TokenClaims
+
+
+@dataclass(frozen=True)
+class ClaimsCacheStats:
+    cache: CacheStats
+    decodes: int
+    decode_seconds: float
+
+    @property
+    def avg_decode_seconds(self) -> float:
+        return self.decode_seconds / self.decodes if self.decodes else 0.0
+
+    @property
+    def saved_seconds(self) -> float:
+        """CPU time the cache hits would have spent verifying tokens."""
+        return self.cache.hits * self.avg_decode_seconds
+
+
+class TokenClaimsCache:
+    """Verified claims keyed by a digest of the raw token.
+
+    Entries never outlive the token: each one expires at the token ``exp``.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._claims: LRUCache[bytes, TokenClaims] = LRUCache(maxsize=maxsize)
+        self._decodes = 0
+        self._decode_seconds = 0.0
+
+    def get(self, token: str, now: datetime) -> TokenClaims | None:
+        key = self._key(token)
+        claims = self._claims.get(key)
+        if claims is not None and claims.exp <= now:
+            # NOTE: Clocks may disagree with the cache timer, exp is the authority
+            self._claims.pop(key)
+            return None
+        return claims
+
+    def put(self, token: str, claims: TokenClaims, now: datetime) -> None:
+        ttl = (claims.exp - now).total_seconds()
+        if ttl > 0:
+            self._claims.set(self._key(token), claims, ttl=ttl)
+
+    def record_decode(self, seconds: float) -> None:
+        self._decodes += 1
+        self._decode_seconds += seconds
+
+    def stats(self) -> ClaimsCacheStats:
+        return ClaimsCacheStats(
+            cache=self._claims.stats(),
+            decodes=self._decodes,
+            decode_seconds=self._decode_seconds,
+        )
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+class ClaimsCacheMetrics:
+    """Exports claims cache lookups and the verification CPU time it saves."""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        cache_metrics: CacheMetrics,
+        claims_cache: TokenClaimsCache,
+    ) -> None:
+        self.claims_cache = claims_cache
+        self.decodes = registry.counter(
+            "auth_token_decodes_total", "Access tokens verified on a cache miss."
+        )
+        self.decode_seconds = registry.counter(
+            "auth_token_decode_cpu_seconds_total",
+            "CPU time spent verifying access tokens.",
+        )
+        self.saved_seconds = registry.counter(
+            "auth_claims_cache_saved_cpu_seconds_total",
+            "Estimated verification CPU time saved by claims cache hits.",
+        )
+        cache_metrics.track("token_claims", lambda: self.claims_cache.stats().cache)
+        registry.on_collect(self.collect)
+
+    def collect(self) -> None:
+        stats = self.claims_cache.stats()
+        self.decodes.set_total(stats.decodes)
+        self.decode_seconds.set_total(stats.decode_seconds)
+        self.saved_seconds.set_total(stats.saved_seconds)
@@ -1,3 +1,4 @@
+import time
 from typing import Any
 from uuid import UUID
 
@@ -8,6 +9,7 @@ from fastfit.auth.application.interfaces.repositories.descriptor_repository impo
 )
 from fastfit.auth.infrastructure.config.auth_config import AuthConfig
 from fastfit.auth.infrastructure.services.jwt.claims import TokenClaims
+from fastfit.auth.infrastructure.services.jwt.claims_cache import TokenClaimsCache
 from fastfit.identity.application.exceptions import InvalidTokenError, TokenExpiredError
 from fastfit.identity.application.interfaces.services.token_intospector import (
     ITokenIntrospector,
@@ -22,13 +24,20 @@ class JWTTokenIntrospector(ITokenIntrospector):
         config: AuthConfig,
         clock: IClock,
         descriptor_repository: IIdentityDescriptorRepository,
+        claims_cache: TokenClaimsCache | None = None,
     ) -> None:
         self.config = config
         self.clock = clock
         self.descriptor_repository = descriptor_repository
+        self.claims_cache = claims_cache
 
     async def extract_user(self, token: str) -> IdentityDescriptor:
         claims = self.decode(token)
+        if self.config.username_claim and claims.username is not None:
+            return IdentityDescriptor(
+                identity_id=claims.identity_id, username=claims.username
+            )
+
         try:
             return await self.descriptor_repository.get_by_id(claims.identity_id)
         except NotFoundError as e:
@@ -47,6 +56,22 @@ class JWTTokenIntrospector(ITokenIntrospector):
         return self.decode(token).identity_id
 
     def decode(self, token: str) -> TokenClaims:
+        if self.claims_cache is None:
+            return self._decode(token)
+
+        now = self.clock.now().value
+        claims = self.claims_cache.get(token, now)
+        if claims is not None:
+            return claims
+
+        started = time.thread_time()
+        claims = self._decode(token)
+        self.claims_cache.record_decode(time.thread_time() - started)
+
+        self.claims_cache.put(token, claims, now)
+        return claims
+
+    def _decode(self, token: str) -> TokenClaims:
         try:
             payload = jwt.decode(
                 token,
@@ -70,6 +95,7 @@ class JWTTokenIntrospector(ITokenIntrospector):
                 iss=payload["iss"],
                 iat=self.clock.from_timestamp(payload["iat"]).value,
                 exp=self.clock.from_timestamp(payload["exp"]).value,
+                username=payload.get("username"),
             )
         except Exception as e:
             raise InvalidTokenError("Malformed token claims") from e
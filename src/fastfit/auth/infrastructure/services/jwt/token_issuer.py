@@ -7,6 +7,9 @@ from common.domain.interfaces.token_generator import ITokenGenerator
 from common.domain.interfaces.uuid_generator import IUUIDGenerator
 from common.domain.value_objects.datetime import DateTime
 from fastfit.auth.application.dtos.models.auth_tokens import AuthTokens
+from fastfit.auth.application.interfaces.repositories.descriptor_repository import (
+    IIdentityDescriptorRepository,
+)
 from fastfit.auth.application.interfaces.repositories.token_repository import (
     IRefreshTokenRepository,
 )
@@ -18,34 +21,47 @@ from jose import jwt
 
 
 class JWTTokenIssuer(ITokenIssuer):
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         clock: IClock,
         config: AuthConfig,
         token_generator: ITokenGenerator,
         uuid_generator: IUUIDGenerator,
         refresh_token_repository: IRefreshTokenRepository,
+        descriptor_repository: IIdentityDescriptorRepository,
     ) -> None:
         self.config = config
         self.clock = clock
         self.token_generator = token_generator
         self.uuid_generator = uuid_generator
         self.refresh_token_repository = refresh_token_repository
+        self.descriptor_repository = descriptor_repository
 
     async def issue_tokens(self, identity_id: UUID) -> AuthTokens:
-        access = self.issue_access_token(identity_id)
+        username = None
+        if self.config.username_claim:
+            descriptor = await self.descriptor_repository.get_by_id(identity_id)
+            username = descriptor.username
+
+        access = self.issue_access_token(identity_id, username)
         refresh = self.issue_refresh_token(identity_id)
 
         await self.refresh_token_repository.add(refresh)
 
         return AuthTokens.create(identity_id, access.value, refresh.value)
 
-    def issue_access_token(self, identity_id: UUID) -> Token:
+    def issue_access_token(
+        self, identity_id: UUID, username: str | None = None
+    ) -> Token:
         issued_at = self.clock.now()
         expires_at = self.expires_at(issued_at, self.config.access_token_ttl)
 
         claims = TokenClaims.create(
-            identity_id, self.config.issuer, issued_at.value, expires_at.value
+            identity_id,
+            self.config.issuer,
+            issued_at.value,
+            expires_at.value,
+            username=username,
         )
         token_str = self.create_jwt_token(claims)
 
@@ -82,6 +98,8 @@ class JWTTokenIssuer(ITokenIssuer):
             "iat": int(claims.iat.timestamp()),
             "exp": int(claims.exp.timestamp()),
         }
+        if claims.username is not None:
+            payload["username"] = claims.username
         return jwt.encode(
             payload,
             self.config.secret_key,
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from fastfit.identity.domain.value_objects.descriptor import IdentityDescriptor
+
+
+class IIdentityDescriptorCache(ABC):
+    @abstractmethod
+    def get(self, identity_id: UUID) -> IdentityDescriptor | None: ...
+    @abstractmethod
+    def is_missing(self, identity_id: UUID) -> bool: ...
+    @abstractmethod
+    def put(self, descriptor: IdentityDescriptor) -> None: ...
+    @abstractmethod
+    def put_missing(self, identity_id: UUID) -> None: ...
+    @abstractmethod
+    def invalidate(self, identity_id: UUID) -> None: ...
@@ -0,0 +1,10 @@
+from datetime import timedelta
+
+from pydantic import BaseModel
+
+
+class IdentityConfig(BaseModel):
+    descriptor_cache_enabled: bool = True
+    descriptor_cache_ttl: timedelta = timedelta(minutes=5)
+    descriptor_cache_negative_ttl: timedelta = timedelta(seconds=30)
+    descriptor_cache_max_size: int = 10_000
@@ -5,6 +5,9 @@ from fastfit.identity.application.exceptions import IdentityNotFoundError
 from fastfit.identity.application.interfaces.repositories.identity_repository import (
     IIdentityRepository,
 )
+from fastfit.identity.application.interfaces.services.identity_descriptor_cache import (
+    IIdentityDescriptorCache,
+)
 from fastfit.identity.domain.entity.identity import Identity
 from fastfit.identity.infrastructure.database.postgres.sqlalchemy.mappers.identity_mapper import (
     IdentityMapper,
@@ -12,27 +15,48 @@ from fastfit.identity.infrastructure.database.postgres.sqlalchemy.mappers.identi
 from fastfit.identity.infrastructure.database.postgres.sqlalchemy.models.identity_base import (
     IdentityBase,
 )
-from sqlalchemy import exists, select
+from sqlalchemy import bindparam, exists, select
+
+
+# NOTE: Built once and executed with params, so a lookup costs a parameter
+# bind instead of constructing and hashing a new statement
+GET_BY_ID = select(IdentityBase).where(
+    IdentityBase.identity_id == bindparam("identity_id")
+)
+GET_BY_USERNAME = select(IdentityBase).where(
+    IdentityBase.username == bindparam("username")
+)
+EXISTS_BY_USERNAME = select(
+    exists().where(IdentityBase.username == bindparam("username"))
+)
 
 
 class IdentityRepository(IIdentityRepository):
-    def __init__(self, executor: QueryExecutor) -> None:
+    def __init__(
+        self,
+        executor: QueryExecutor,
+        descriptor_cache: IIdentityDescriptorCache | None = None,
+    ) -> None:
         self.executor = executor
+        self.descriptor_cache = descriptor_cache
 
     async def get_by_id(self, identity_id: UUID) -> Identity:
-        stmt = select(IdentityBase).where(IdentityBase.identity_id == identity_id)
-        identity = await self.executor.execute_scalar_one(stmt)
+        identity = await self.executor.execute_scalar_one(
+            GET_BY_ID, {"identity_id": identity_id}
+        )
         if not identity:
             raise IdentityNotFoundError(identity_id)
         return IdentityMapper.to_domain(identity)
 
     async def exists_by_username(self, username: str) -> bool:
-        stmt = select(exists().where(IdentityBase.username == username))
-        return await self.executor.execute_scalar(stmt)
+        return await self.executor.execute_scalar(
+            EXISTS_BY_USERNAME, {"username": username}
+        )
 
     async def get_by_username(self, username: str) -> Identity:
-        stmt = select(IdentityBase).where(IdentityBase.username == username)
-        identity = await self.executor.execute_scalar_one(stmt)
+        identity = await self.executor.execute_scalar_one(
+            GET_BY_USERNAME, {"username": username}
+        )
         if not identity:
             raise IdentityNotFoundError(username)
         return IdentityMapper.to_domain(identity)
@@ -40,3 +64,5 @@ class IdentityRepository(IIdentityRepository):
     async def add(self, entity: Identity) -> None:
         model = IdentityMapper.to_persistence(entity)
         await self.executor.add(model)
+        if self.descriptor_cache is not None:
+            self.descriptor_cache.invalidate(entity.identity_id)
@@ -9,19 +9,27 @@ from fastfit.identity.domain.factories.identity_factory import IdentityFactory
 from fastfit.identity.infrastructure.database.postgres.sqlalchemy.repositories.identity_repository import (
     IdentityRepository,
 )
+from fastfit.identity.infrastructure.di.container.providers import (
+    provide_descriptor_cache,
+)
 from fastfit.identity.infrastructure.services.bcrypt.password_hasher import (
     BcryptPasswordHasher,
 )
 
 
 class IdentityContainer(containers.DeclarativeContainer):
+    identity_config: providers.Dependency[Any] = providers.Dependency()
+
     uuid_generator: providers.Dependency[Any] = providers.Dependency()
     query_executor: providers.Dependency[Any] = providers.Dependency()
     # NOTE: token_introspector is for semantics only, not used but needed for presentation layer
     token_introspector: providers.Dependency[Any] = providers.Dependency()
 
     identity_factory = providers.Singleton(IdentityFactory, uuid_generator)
-    identity_repository = providers.Singleton(IdentityRepository, query_executor)
+    descriptor_cache = providers.Singleton(provide_descriptor_cache, identity_config)
+    identity_repository = providers.Singleton(
+        IdentityRepository, query_executor, descriptor_cache
+    )
 
     password_hasher = providers.Singleton(BcryptPasswordHasher)
 
@@ -0,0 +1,12 @@
+from fastfit.identity.infrastructure.config.identity_config import IdentityConfig
+from fastfit.identity.infrastructure.services.memory.identity_descriptor_cache import (
+    InMemoryIdentityDescriptorCache,
+)
+
+
+def provide_descriptor_cache(
+    config: IdentityConfig,
+) -> InMemoryIdentityDescriptorCache | None:
+    if not config.descriptor_cache_enabled:
+        return None
+    return InMemoryIdentityDescriptorCache(config)
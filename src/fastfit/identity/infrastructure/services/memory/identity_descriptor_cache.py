@@ -0,0 +1,50 @@
+from uuid import UUID
+
+from common.infrastructure.cache.lru_cache import CacheStats, LRUCache
+from fastfit.identity.application.interfaces.services.identity_descriptor_cache import (
+    IIdentityDescriptorCache,
+)
+from fastfit.identity.domain.value_objects.descriptor import IdentityDescriptor
+from fastfit.identity.infrastructure.config.identity_config import IdentityConfig
+
+
+class InMemoryIdentityDescriptorCache(IIdentityDescriptorCache):
+    """Identity descriptors kept in process memory.
+
+    Unknown identities are remembered for a shorter time, so a stale or forged
+    subject cannot force a query per request.
+    """
+
+    def __init__(self, config: IdentityConfig) -> None:
+        self._descriptors: LRUCache[UUID, IdentityDescriptor] = LRUCache(
+            maxsize=config.descriptor_cache_max_size,
+            ttl=config.descriptor_cache_ttl.total_seconds(),
+        )
+        self._missing: LRUCache[UUID, bool] = LRUCache(
+            maxsize=config.descriptor_cache_max_size,
+            ttl=config.descriptor_cache_negative_ttl.total_seconds(),
+        )
+
+    def get(self, identity_id: UUID) -> IdentityDescriptor | None:
+        return self._descriptors.get(identity_id)
+
+    def is_missing(self, identity_id: UUID) -> bool:
+        return self._missing.get(identity_id) is not None
+
+    def put(self, descriptor: IdentityDescriptor) -> None:
+        self._missing.pop(descriptor.identity_id)
+        self._descriptors.set(descriptor.identity_id, descriptor)
+
+    def put_missing(self, identity_id: UUID) -> None:
+        self._descriptors.pop(identity_id)
+        self._missing.set(identity_id, True)
+
+    def invalidate(self, identity_id: UUID) -> None:
+        self._descriptors.pop(identity_id)
+        self._missing.pop(identity_id)
+
+    def stats(self) -> CacheStats:
+        return self._descriptors.stats()
+
+    def negative_stats(self) -> CacheStats:
+        return self._missing.stats()
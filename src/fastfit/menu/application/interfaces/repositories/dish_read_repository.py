@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from decimal import Decimal
 from uuid import UUID
 
@@ -10,6 +11,8 @@ class IDishReadRepository(ABC):
     @abstractmethod
     async def get_by_id(self, dish_id: UUID) -> DishReadModel: ...
     @abstractmethod
+    async def get_by_ids(self, dish_ids: Sequence[UUID]) -> list[DishReadModel]: ...
+    @abstractmethod
     async def get_by_restaurant(self, restaurant_id: UUID) -> list[DishReadModel]: ...
     @abstractmethod
     async def filter(
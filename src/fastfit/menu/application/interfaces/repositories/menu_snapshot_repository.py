@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from fastfit.menu.application.interfaces.services.menu_snapshot_cache import (
+    MenuSnapshot,
+)
+
+
+class IMenuSnapshotRepository(ABC):
+    @abstractmethod
+    async def get_snapshot(self, restaurant_id: UUID) -> MenuSnapshot: ...
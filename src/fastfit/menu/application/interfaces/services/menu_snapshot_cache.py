@@ -0,0 +1,48 @@
+import hashlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Self
+from uuid import UUID
+
+from fastfit.menu.application.read_models.dish_read_model import DishReadModel
+
+
+@dataclass(frozen=True)
+class MenuSnapshot:
+    restaurant_id: UUID
+    version: int
+    dishes: tuple[DishReadModel, ...]
+    digest: str
+
+    @classmethod
+    def create(
+        cls, restaurant_id: UUID, version: int, dishes: list[DishReadModel]
+    ) -> Self:
+        # NOTE: Digest depends on content only, so it is stable across processes
+        digest = hashlib.blake2b(repr(dishes).encode(), digest_size=16).hexdigest()
+        return cls(
+            restaurant_id=restaurant_id,
+            version=version,
+            dishes=tuple(dishes),
+            digest=digest,
+        )
+
+    @cached_property
+    def index(self) -> dict[UUID, DishReadModel]:
+        return {dish.dish_id: dish for dish in self.dishes}
+
+
+class IMenuSnapshotCache(ABC):
+    @abstractmethod
+    def get(self, restaurant_id: UUID) -> MenuSnapshot | None: ...
+    @abstractmethod
+    def version(self, restaurant_id: UUID) -> int: ...
+    @abstractmethod
+    def put(
+        self, restaurant_id: UUID, dishes: list[DishReadModel], version: int
+    ) -> MenuSnapshot: ...
+    @abstractmethod
+    def invalidate(self, restaurant_id: UUID) -> None: ...
+    @abstractmethod
+    def invalidate_all(self) -> None: ...
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from collections.abc import Collection
+from uuid import UUID
+
+from fastfit.menu.domain.value_objects.money import Money
+
+
+class IPriceBook(ABC):
+    @abstractmethod
+    async def get_prices(
+        self, restaurant_id: UUID, dish_ids: Collection[UUID]
+    ) -> dict[UUID, Money]: ...
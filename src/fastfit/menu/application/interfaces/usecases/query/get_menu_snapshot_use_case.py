@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from fastfit.menu.application.dtos.queries.get_menu_snapshot_query import (
+    GetMenuSnapshotQuery,
+)
+from fastfit.menu.application.interfaces.services.menu_snapshot_cache import (
+    MenuSnapshot,
+)
+
+
+class IGetMenuSnapshotUseCase(ABC):
+    @abstractmethod
+    async def execute(self, query: GetMenuSnapshotQuery) -> MenuSnapshot: ...
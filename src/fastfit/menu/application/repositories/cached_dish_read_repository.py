@@ -0,0 +1,85 @@
+from collections.abc import Sequence
+from decimal import Decimal
+from uuid import UUID
+
+from fastfit.menu.application.interfaces.repositories.dish_read_repository import (
+    IDishReadRepository,
+)
+from fastfit.menu.application.interfaces.repositories.menu_snapshot_repository import (
+    IMenuSnapshotRepository,
+)
+from fastfit.menu.application.interfaces.services.menu_snapshot_cache import (
+    IMenuSnapshotCache,
+    MenuSnapshot,
+)
+from fastfit.menu.application.read_models.dish_read_model import DishReadModel
+from fastfit.menu.domain.value_objects.dish_filters import DishFilterType
+
+
+class CachedDishReadRepository(IDishReadRepository, IMenuSnapshotRepository):
+    """Serves restaurant menus from snapshots, loading them on a miss.
+
+    Without a cache every snapshot is loaded from the wrapped repository.
+    Cached snapshots and lookups by ids (used for pricing) are loaded from
+    ``primary_dish_read_repository``, a lagging replica would otherwise be
+    cached under the version of a write it has not seen yet.
+    """
+
+    def __init__(
+        self,
+        dish_read_repository: IDishReadRepository,
+        menu_snapshot_cache: IMenuSnapshotCache | None = None,
+        primary_dish_read_repository: IDishReadRepository | None = None,
+    ) -> None:
+        self.dish_read_repository = dish_read_repository
+        self.menu_snapshot_cache = menu_snapshot_cache
+        self.primary_dish_read_repository = (
+            primary_dish_read_repository or dish_read_repository
+        )
+
+    async def get_by_id(self, dish_id: UUID) -> DishReadModel:
+        return await self.dish_read_repository.get_by_id(dish_id)
+
+    async def get_by_ids(self, dish_ids: Sequence[UUID]) -> list[DishReadModel]:
+        return await self.primary_dish_read_repository.get_by_ids(dish_ids)
+
+    async def get_by_restaurant(self, restaurant_id: UUID) -> list[DishReadModel]:
+        snapshot = await self.get_snapshot(restaurant_id)
+        return list(snapshot.dishes)
+
+    async def filter(
+        self,
+        restaurant_id: UUID,
+        filters: list[DishFilterType],
+        max_calories: Decimal | None,
+    ) -> list[DishReadModel]:
+        if self.menu_snapshot_cache is None:
+            return await self.dish_read_repository.filter(
+                restaurant_id, filters, max_calories
+            )
+
+        snapshot = await self.get_snapshot(restaurant_id)
+        required = set(filters)
+        return [
+            dish
+            for dish in snapshot.dishes
+            if required.issubset(dish.filters)
+            and (max_calories is None or dish.calories <= max_calories)
+        ]
+
+    async def get_snapshot(self, restaurant_id: UUID) -> MenuSnapshot:
+        if self.menu_snapshot_cache is None:
+            dishes = await self.dish_read_repository.get_by_restaurant(restaurant_id)
+            return MenuSnapshot.create(restaurant_id, 0, dishes)
+
+        snapshot = self.menu_snapshot_cache.get(restaurant_id)
+        if snapshot is not None:
+            return snapshot
+
+        # NOTE: Version is taken before loading, so a write that lands while
+        # the query is in flight makes the cache reject this snapshot.
+        version = self.menu_snapshot_cache.version(restaurant_id)
+        dishes = await self.primary_dish_read_repository.get_by_restaurant(
+            restaurant_id
+        )
+        return self.menu_snapshot_cache.put(restaurant_id, dishes, version)
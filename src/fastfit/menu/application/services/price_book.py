@@ -0,0 +1,56 @@
+from collections.abc import Collection
+from uuid import UUID
+
+from fastfit.menu.application.interfaces.repositories.dish_read_repository import (
+    IDishReadRepository,
+)
+from fastfit.menu.application.interfaces.services.menu_snapshot_cache import (
+    IMenuSnapshotCache,
+)
+from fastfit.menu.application.interfaces.services.price_book import IPriceBook
+from fastfit.menu.application.read_models.dish_read_model import DishReadModel
+from fastfit.menu.domain.value_objects.money import Money
+
+
+class MenuPriceBook(IPriceBook):
+    """Current dish prices of a restaurant, read from its menu snapshot.
+
+    Dishes missing from the cached snapshot are resolved with one batched
+    lookup. Dishes that are not on the restaurant's menu are left out of the
+    result.
+    """
+
+    def __init__(
+        self,
+        dish_read_repository: IDishReadRepository,
+        menu_snapshot_cache: IMenuSnapshotCache | None = None,
+    ) -> None:
+        self.dish_read_repository = dish_read_repository
+        self.menu_snapshot_cache = menu_snapshot_cache
+
+    async def get_prices(
+        self, restaurant_id: UUID, dish_ids: Collection[UUID]
+    ) -> dict[UUID, Money]:
+        dishes: dict[UUID, DishReadModel] = {}
+        snapshot = (
+            self.menu_snapshot_cache.get(restaurant_id)
+            if self.menu_snapshot_cache is not None
+            else None
+        )
+        if snapshot is not None:
+            dishes = {
+                dish_id: snapshot.index[dish_id]
+                for dish_id in dish_ids
+                if dish_id in snapshot.index
+            }
+
+        # NOTE: The whole menu is not loaded here, checkout only needs its items
+        if missing := [dish_id for dish_id in dish_ids if dish_id not in dishes]:
+            for dish in await self.dish_read_repository.get_by_ids(missing):
+                dishes[dish.dish_id] = dish
+
+        return {
+            dish_id: Money.create(dish.price, dish.currency)
+            for dish_id, dish in dishes.items()
+            if dish.restaurant_id == restaurant_id
+        }
@@ -0,0 +1,20 @@
+from fastfit.menu.application.dtos.queries.get_menu_snapshot_query import (
+    GetMenuSnapshotQuery,
+)
+from fastfit.menu.application.interfaces.repositories.menu_snapshot_repository import (
+    IMenuSnapshotRepository,
+)
+from fastfit.menu.application.interfaces.services.menu_snapshot_cache import (
+    MenuSnapshot,
+)
+from fastfit.menu.application.interfaces.usecases.query.get_menu_snapshot_use_case import (
+    IGetMenuSnapshotUseCase,
+)
+
+
+class GetMenuSnapshotUseCase(IGetMenuSnapshotUseCase):
+    def __init__(self, menu_snapshot_repository: IMenuSnapshotRepository) -> None:
+        self.menu_snapshot_repository = menu_snapshot_repository
+
+    async def execute(self, query: GetMenuSnapshotQuery) -> MenuSnapshot:
+        return await self.menu_snapshot_repository.get_snapshot(query.restaurant_id)
@@ -9,6 +9,9 @@ from fastfit.menu.application.interfaces.usecases.query.get_dish_by_id_use_case
 from fastfit.menu.application.interfaces.usecases.query.get_dishes_by_restaurant_use_case import (
     IGetDishesByRestaurantUseCase,
 )
+from fastfit.menu.application.interfaces.usecases.query.get_menu_snapshot_use_case import (
+    IGetMenuSnapshotUseCase,
+)
 from fastfit.menu.infrastructure.di.container.container import DishContainer
 from fastfit.menu.presentation.http.fastapi.controllers import menu_router
 
@@ -33,6 +36,10 @@ class MenuApp(IHTTPApp):
             IGetDishesByRestaurantUseCase,
             self.dish_container.get_dishes_by_restaurant_use_case(),
         )
+        self.server.override_dependency(
+            IGetMenuSnapshotUseCase,
+            self.dish_container.get_menu_snapshot_use_case(),
+        )
 
     def register_routers(self) -> None:
         self.server.register_router(menu_router, prefix=self.prefix, tags=self.tags)
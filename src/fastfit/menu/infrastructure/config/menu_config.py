@@ -0,0 +1,9 @@
+from datetime import timedelta
+
+from pydantic import BaseModel
+
+
+class MenuConfig(BaseModel):
+    snapshot_cache_enabled: bool = True
+    snapshot_ttl: timedelta = timedelta(minutes=5)
+    snapshot_max_restaurants: int = 128
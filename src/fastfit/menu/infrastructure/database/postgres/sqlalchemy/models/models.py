@@ -3,7 +3,7 @@ from uuid import UUID
 
 from common.infrastructure.database.sqlalchemy.models.base import Base
 from fastfit.menu.domain.value_objects.dish_filters import DishFilterType
-from sqlalchemy import Enum, ForeignKey, Numeric, String
+from sqlalchemy import Enum, ForeignKey, Index, Numeric, String, text
 from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -18,6 +18,7 @@ class CategoryBase(Base):
 
 class DishBase(Base):
     __tablename__ = "dishes"
+    __table_args__ = (Index("ix_dishes_filters", "filters", postgresql_using="gin"),)
 
     dish_id: Mapped[UUID] = mapped_column(PGUUID, primary_key=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
@@ -33,10 +34,11 @@ class DishBase(Base):
         ARRAY(Enum(DishFilterType)), nullable=False
     )
     category_id: Mapped[UUID] = mapped_column(
-        PGUUID, ForeignKey("categories.category_id"), nullable=False
+        PGUUID, ForeignKey("categories.category_id"), nullable=False, index=True
     )
-    restaurant_id: Mapped[UUID] = mapped_column(PGUUID, nullable=False)
+    restaurant_id: Mapped[UUID] = mapped_column(PGUUID, nullable=False, index=True)
     image: Mapped[str] = mapped_column(String, nullable=True)
+    version: Mapped[int] = mapped_column(nullable=False, server_default=text("1"))
 
     # Relationship to the category record (joined by default in read queries)
     category: Mapped["CategoryBase"] = relationship("CategoryBase", lazy="noload")
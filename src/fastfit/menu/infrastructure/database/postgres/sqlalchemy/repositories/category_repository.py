@@ -1,9 +1,17 @@
+from functools import partial
 from uuid import UUID
 
+from common.infrastructure.database.sqlalchemy.change_tracker import (
+    Changes,
+    column_values,
+)
 from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
 from fastfit.menu.application.interfaces.repositories.category_repository import (
     ICategoryRepository,
 )
+from fastfit.menu.application.interfaces.services.menu_snapshot_cache import (
+    IMenuSnapshotCache,
+)
 from fastfit.menu.domain.entities.category import Category
 from fastfit.menu.infrastructure.database.postgres.sqlalchemy.mappers.category_mapper import (
     CategoryMapper,
@@ -11,8 +19,13 @@ from fastfit.menu.infrastructure.database.postgres.sqlalchemy.mappers.category_m
 
 
 class CategoryRepository(ICategoryRepository):
-    def __init__(self, executor: QueryExecutor) -> None:
+    def __init__(
+        self,
+        executor: QueryExecutor,
+        menu_snapshot_cache: IMenuSnapshotCache | None = None,
+    ) -> None:
         self.executor = executor
+        self.menu_snapshot_cache = menu_snapshot_cache
 
     async def get_by_id(self, category_id: UUID) -> Category:
         raise NotImplementedError()
@@ -20,10 +33,20 @@ class CategoryRepository(ICategoryRepository):
     async def add(self, entity: Category) -> None:
         model = CategoryMapper.to_persistance(entity)
         await self.executor.add(model)
+        self._invalidate(entity.restaurant_id)
 
     async def save(self, entity: Category) -> None:
         model = CategoryMapper.to_persistance(entity)
-        await self.executor.save(model)
+        await self.executor.update_columns(model, Changes(column_values(model)))
+        self._invalidate(entity.restaurant_id)
 
     async def delete(self, category_id: UUID) -> None:
         raise NotImplementedError()
+
+    def _invalidate(self, restaurant_id: UUID) -> None:
+        # NOTE: Deferred until commit, so a reader cannot cache the old menu
+        # after the eviction and a rolled back write evicts nothing
+        if self.menu_snapshot_cache:
+            self.executor.after_commit(
+                partial(self.menu_snapshot_cache.invalidate, restaurant_id)
+            )
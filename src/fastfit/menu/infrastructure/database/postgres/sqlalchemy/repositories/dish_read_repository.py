@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from decimal import Decimal
 from uuid import UUID
 
@@ -13,32 +14,51 @@ from fastfit.menu.infrastructure.database.postgres.sqlalchemy.mappers.dish_read_
 from fastfit.menu.infrastructure.database.postgres.sqlalchemy.models.models import (
     DishBase,
 )
-from sqlalchemy import select
+from sqlalchemy import any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID
 from sqlalchemy.orm import joinedload
 
 
+# NOTE: Built once and executed with params, so a lookup costs a parameter
+# bind instead of constructing and hashing a new statement
+GET_BY_ID = (
+    select(DishBase)
+    .options(joinedload(DishBase.category))
+    .where(DishBase.dish_id == bindparam("dish_id"))
+)
+# NOTE: A single array parameter keeps one statement for any batch size
+GET_BY_IDS = (
+    select(DishBase)
+    .options(joinedload(DishBase.category))
+    .where(DishBase.dish_id == any_(bindparam("dish_ids", type_=ARRAY(PGUUID))))
+)
+GET_BY_RESTAURANT = (
+    select(DishBase)
+    .options(joinedload(DishBase.category))
+    .where(DishBase.restaurant_id == bindparam("restaurant_id"))
+)
+
+
 class DishReadRepository(IDishReadRepository):
     def __init__(self, executor: QueryExecutor) -> None:
         self.executor = executor
 
     async def get_by_id(self, dish_id: UUID) -> DishReadModel:
-        stmt = (
-            select(DishBase)
-            .options(joinedload(DishBase.category))
-            .where(DishBase.dish_id == dish_id)
-        )
-        model = await self.executor.execute_scalar_one(stmt)
+        model = await self.executor.execute_scalar_one(GET_BY_ID, {"dish_id": dish_id})
         if not model:
             raise ValueError(f"Dish with id {dish_id} not found")
         return DishReadMapper.to_read_model(model)
 
+    async def get_by_ids(self, dish_ids: Sequence[UUID]) -> list[DishReadModel]:
+        models = await self.executor.execute_scalar_many(
+            GET_BY_IDS, {"dish_ids": list(dish_ids)}
+        )
+        return [DishReadMapper.to_read_model(m) for m in models]
+
     async def get_by_restaurant(self, restaurant_id: UUID) -> list[DishReadModel]:
-        stmt = (
-            select(DishBase)
-            .options(joinedload(DishBase.category))
-            .where(DishBase.restaurant_id == restaurant_id)
+        models = await self.executor.execute_scalar_many(
+            GET_BY_RESTAURANT, {"restaurant_id": restaurant_id}
         )
-        models = await self.executor.execute_scalar_many(stmt)
         return [DishReadMapper.to_read_model(m) for m in models]
 
     async def filter(
@@ -53,7 +73,8 @@ class DishReadRepository(IDishReadRepository):
             .where(DishBase.restaurant_id == restaurant_id)
         )
         if filters:
-            stmt = stmt.where(DishBase.filters.contains([f.value for f in filters]))
+            # NOTE: Enum members bind as the enum labels, matched by the GIN index
+            stmt = stmt.where(DishBase.filters.contains(filters))
         if max_calories is not None:
             stmt = stmt.where(DishBase.calories <= max_calories)
         models = await self.executor.execute_scalar_many(stmt)
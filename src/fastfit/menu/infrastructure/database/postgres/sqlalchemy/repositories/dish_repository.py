@@ -1,9 +1,14 @@
+from functools import partial
 from uuid import UUID
 
+from common.infrastructure.database.sqlalchemy.change_tracker import ChangeTracker
 from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
 from fastfit.menu.application.interfaces.repositories.dish_repository import (
     IDishRepository,
 )
+from fastfit.menu.application.interfaces.services.menu_snapshot_cache import (
+    IMenuSnapshotCache,
+)
 from fastfit.menu.domain.entities.dish import Dish
 from fastfit.menu.infrastructure.database.postgres.sqlalchemy.mappers.dish_mapper import (
     DishMapper,
@@ -15,24 +20,47 @@ from sqlalchemy import delete, select
 
 
 class DishRepository(IDishRepository):
-    def __init__(self, executor: QueryExecutor) -> None:
+    def __init__(
+        self,
+        executor: QueryExecutor,
+        menu_snapshot_cache: IMenuSnapshotCache | None = None,
+    ) -> None:
         self.executor = executor
+        self.menu_snapshot_cache = menu_snapshot_cache
+        self.tracker = ChangeTracker()
 
     async def get_by_id(self, dish_id: UUID) -> Dish:
         stmt = select(DishBase).where(DishBase.dish_id == dish_id)
         model = await self.executor.execute_scalar_one(stmt)
         if not model:
             raise ValueError(f"Dish with id {dish_id} not found")
-        return DishMapper.to_domain(model)
+        entity = DishMapper.to_domain(model)
+        self.tracker.track(entity, DishMapper.to_persistence(entity), model.version)
+        return entity
 
     async def add(self, entity: Dish) -> None:
         model = DishMapper.to_persistence(entity)
         await self.executor.add(model)
+        self._invalidate(entity.restaurant_id)
 
     async def save(self, entity: Dish) -> None:
         model = DishMapper.to_persistence(entity)
-        await self.executor.save(model)
+        changes = self.tracker.changes(entity, model)
+        bumped = await self.executor.update_columns(model, changes)
+        self.tracker.refresh(entity, model, changes, bumped)
+        self._invalidate(entity.restaurant_id)
 
     async def delete(self, dish_id: UUID) -> None:
         stmt = delete(DishBase).where(DishBase.dish_id == dish_id)
         await self.executor.execute(stmt)
+        if self.menu_snapshot_cache:
+            # NOTE: Restaurant is unknown here, drop every snapshot
+            self.executor.after_commit(self.menu_snapshot_cache.invalidate_all)
+
+    def _invalidate(self, restaurant_id: UUID) -> None:
+        # NOTE: Deferred until commit, so a reader cannot cache the old menu
+        # after the eviction and a rolled back write evicts nothing
+        if self.menu_snapshot_cache:
+            self.executor.after_commit(
+                partial(self.menu_snapshot_cache.invalidate, restaurant_id)
+            )
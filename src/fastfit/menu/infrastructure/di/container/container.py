@@ -7,36 +7,59 @@ from fastfit.menu.application.usecases.query.get_dish_by_id_use_case import (
 from fastfit.menu.application.usecases.query.get_dishes_by_restaurant_use_case import (
     GetDishesByRestaurantUseCase,
 )
+from fastfit.menu.application.usecases.query.get_menu_snapshot_use_case import (
+    GetMenuSnapshotUseCase,
+)
 from fastfit.menu.domain.factories.category_factory import CategoryFactory
 from fastfit.menu.domain.factories.dish_factory import DishFactory
 from fastfit.menu.infrastructure.database.postgres.sqlalchemy.repositories.category_repository import (
     CategoryRepository,
 )
-from fastfit.menu.infrastructure.database.postgres.sqlalchemy.repositories.dish_read_repository import (
-    DishReadRepository,
-)
 from fastfit.menu.infrastructure.database.postgres.sqlalchemy.repositories.dish_repository import (
     DishRepository,
 )
+from fastfit.menu.infrastructure.di.container.providers import (
+    provide_dish_read_repository,
+    provide_price_book,
+)
+from fastfit.menu.infrastructure.services.memory.menu_snapshot_cache import (
+    InMemoryMenuSnapshotCache,
+)
 
 
 class CategoryContainer(containers.DeclarativeContainer):
     query_executor: providers.Dependency[Any] = providers.Dependency()
     uuid_generator: providers.Dependency[Any] = providers.Dependency()
+    menu_snapshot_cache: providers.Dependency[Any] = providers.Dependency()
 
     category_factory = providers.Singleton(CategoryFactory, uuid_generator)
 
-    category_repository = providers.Singleton(CategoryRepository, query_executor)
+    category_repository = providers.Singleton(
+        CategoryRepository, query_executor, menu_snapshot_cache
+    )
 
 
 class DishContainer(containers.DeclarativeContainer):
+    menu_config: providers.Dependency[Any] = providers.Dependency()
+
     query_executor: providers.Dependency[Any] = providers.Dependency()
+    read_query_executor: providers.Dependency[Any] = providers.Dependency()
     uuid_generator: providers.Dependency[Any] = providers.Dependency()
 
+    menu_snapshot_cache = providers.Singleton(InMemoryMenuSnapshotCache, menu_config)
+
     dish_factory = providers.Singleton(DishFactory, uuid_generator)
 
-    dish_repository = providers.Singleton(DishRepository, query_executor)
-    dish_read_repository = providers.Singleton(DishReadRepository, query_executor)
+    dish_repository = providers.Singleton(
+        DishRepository, query_executor, menu_snapshot_cache
+    )
+    dish_read_repository = providers.Singleton(
+        provide_dish_read_repository,
+        config=menu_config,
+        query_executor=query_executor,
+        read_query_executor=read_query_executor,
+        menu_snapshot_cache=menu_snapshot_cache,
+    )
 
     get_dish_by_id_use_case = providers.Singleton(
         GetDishByIdUseCase, dish_read_repository=dish_read_repository
@@ -45,3 +68,14 @@ class DishContainer(containers.DeclarativeContainer):
         GetDishesByRestaurantUseCase,
         dish_read_repository=dish_read_repository,
     )
+    get_menu_snapshot_use_case = providers.Singleton(
+        GetMenuSnapshotUseCase,
+        menu_snapshot_repository=dish_read_repository,
+    )
+
+    price_book = providers.Singleton(
+        provide_price_book,
+        config=menu_config,
+        dish_read_repository=dish_read_repository,
+        menu_snapshot_cache=menu_snapshot_cache,
+    )
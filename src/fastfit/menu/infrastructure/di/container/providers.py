@@ -0,0 +1,39 @@
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from fastfit.menu.application.interfaces.repositories.dish_read_repository import (
+    IDishReadRepository,
+)
+from fastfit.menu.application.interfaces.services.menu_snapshot_cache import (
+    IMenuSnapshotCache,
+)
+from fastfit.menu.application.repositories.cached_dish_read_repository import (
+    CachedDishReadRepository,
+)
+from fastfit.menu.application.services.price_book import MenuPriceBook
+from fastfit.menu.infrastructure.config.menu_config import MenuConfig
+from fastfit.menu.infrastructure.database.postgres.sqlalchemy.repositories.dish_read_repository import (
+    DishReadRepository,
+)
+
+
+def provide_dish_read_repository(
+    config: MenuConfig,
+    query_executor: QueryExecutor,
+    read_query_executor: QueryExecutor,
+    menu_snapshot_cache: IMenuSnapshotCache,
+) -> CachedDishReadRepository:
+    return CachedDishReadRepository(
+        DishReadRepository(read_query_executor),
+        menu_snapshot_cache if config.snapshot_cache_enabled else None,
+        DishReadRepository(query_executor),
+    )
+
+
+def provide_price_book(
+    config: MenuConfig,
+    dish_read_repository: IDishReadRepository,
+    menu_snapshot_cache: IMenuSnapshotCache,
+) -> MenuPriceBook:
+    return MenuPriceBook(
+        dish_read_repository,
+        menu_snapshot_cache if config.snapshot_cache_enabled else None,
+    )
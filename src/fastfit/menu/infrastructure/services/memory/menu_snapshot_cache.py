@@ -0,0 +1,59 @@
+from uuid import UUID
+
+from common.infrastructure.cache.lru_cache import CacheStats, LRUCache
+from fastfit.menu.application.interfaces.services.menu_snapshot_cache import (
+    IMenuSnapshotCache,
+    MenuSnapshot,
+)
+from fastfit.menu.application.read_models.dish_read_model import DishReadModel
+from fastfit.menu.infrastructure.config.menu_config import MenuConfig
+
+
+class InMemoryMenuSnapshotCache(IMenuSnapshotCache):
+    """Per-restaurant menu snapshots kept in process memory.
+
+    Every invalidation bumps the restaurant version, so a snapshot loaded
+    before a write can never be stored after it. Invalidations only come from
+    repositories in this process: writes made elsewhere (other workers, the
+    CLI seeder) show up once the snapshot expires after ``snapshot_ttl``.
+    """
+
+    def __init__(self, config: MenuConfig) -> None:
+        self._snapshots: LRUCache[UUID, MenuSnapshot] = LRUCache(
+            maxsize=config.snapshot_max_restaurants,
+            ttl=config.snapshot_ttl.total_seconds(),
+        )
+        self._versions: dict[UUID, int] = {}
+        self._generation = 0
+        self._floor = 0
+
+    def get(self, restaurant_id: UUID) -> MenuSnapshot | None:
+        snapshot = self._snapshots.get(restaurant_id)
+        if snapshot is None or snapshot.version != self.version(restaurant_id):
+            return None
+        return snapshot
+
+    def version(self, restaurant_id: UUID) -> int:
+        return max(self._versions.get(restaurant_id, 0), self._floor)
+
+    def put(
+        self, restaurant_id: UUID, dishes: list[DishReadModel], version: int
+    ) -> MenuSnapshot:
+        snapshot = MenuSnapshot.create(restaurant_id, version, dishes)
+        if version == self.version(restaurant_id):
+            self._snapshots.set(restaurant_id, snapshot)
+        return snapshot
+
+    def invalidate(self, restaurant_id: UUID) -> None:
+        self._generation += 1
+        self._versions[restaurant_id] = self._generation
+        self._snapshots.pop(restaurant_id)
+
+    def invalidate_all(self) -> None:
+        self._generation += 1
+        self._floor = self._generation
+        self._versions.clear()
+        self._snapshots.clear()
+
+    def stats(self) -> CacheStats:
+        return self._snapshots.stats()
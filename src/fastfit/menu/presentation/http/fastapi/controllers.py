@@ -1,23 +1,34 @@
 import json
+from functools import lru_cache
 from typing import Annotated
 from urllib.parse import quote, unquote
 from uuid import UUID
 
+from common.infrastructure.cache.lru_cache import LRUCache
+from common.presentation.http.fastapi.rendered_page import (
+    SLOT,
+    RenderedPage,
+    etag_matches,
+)
 from fastapi import APIRouter, Depends, Form, HTTPException, Request, Response
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 from fastfit.identity.presentation.http.fastapi.auth import get_access_token
 from fastfit.menu.application.dtos.queries.get_dish_by_id_query import GetDishByIdQuery
-from fastfit.menu.application.dtos.queries.get_dishes_by_restaurant_query import (
-    GetDishesByRestaurantQuery,
+from fastfit.menu.application.dtos.queries.get_menu_snapshot_query import (
+    GetMenuSnapshotQuery,
+)
+from fastfit.menu.application.interfaces.services.menu_snapshot_cache import (
+    MenuSnapshot,
 )
 from fastfit.menu.application.interfaces.usecases.query.get_dish_by_id_use_case import (
     IGetDishByIdUseCase,
 )
-from fastfit.menu.application.interfaces.usecases.query.get_dishes_by_restaurant_use_case import (
-    IGetDishesByRestaurantUseCase,
+from fastfit.menu.application.interfaces.usecases.query.get_menu_snapshot_use_case import (
+    IGetMenuSnapshotUseCase,
 )
 from fastfit.menu.application.read_models.dish_read_model import DishReadModel
+from markupsafe import Markup
 
 
 menu_router = APIRouter()
@@ -27,6 +38,9 @@ templates = Jinja2Templates(directory="templates")
 
 DEFAULT_RESTAURANT_ID: UUID = UUID(int=0)
 
+# Rendered menu pages keyed by restaurant, menu digest, base url and login state
+menu_pages: LRUCache[tuple[UUID, str, str, bool], RenderedPage] = LRUCache(maxsize=64)
+
 
 # GET endpoint to render the menu page
 @menu_router.get("/", name="landing")
@@ -34,76 +48,105 @@ async def get_landing(request: Request) -> HTMLResponse:
     return templates.TemplateResponse("landing.html", {"request": request})
 
 
+def _render_menu_page(request: Request, snapshot: MenuSnapshot) -> RenderedPage:
+    dishes = snapshot.dishes
+
+    # Extract unique categories from dishes
+    categories = [
+        {"id": str(dish.category.category_id), "name": dish.category.name}
+        for dish in sorted(dishes, key=lambda x: x.category.name)
+    ]
+    # Remove duplicates while preserving order
+    seen: set[str] = set()
+
+    unique_categories: list[dict[str, str]] = []
+    for cat in categories:
+        if (cat["id"]) not in seen:
+            seen.add(cat["id"])
+            unique_categories.append(cat)
+
+    # Prepare menu items for the template
+    menu_items = [
+        {
+            "id": str(dish.dish_id),
+            "name": dish.name,
+            "description": dish.description,
+            "price": f"{dish.price:.2f}",
+            "calories": f"{dish.calories:.0f}",
+            "category": str(dish.category.category_id),
+            "proteins": f"{dish.proteins:.0f}",
+            "fats": f"{dish.fats:.0f}",
+            "carbohydrates": f"{dish.carbohydrates:.0f}",
+            "image": dish.image or "https://placehold.co/400",  # Fallback image
+        }
+        for dish in dishes
+    ]
+
+    # Define calorie filter options
+    calorie_options = [
+        {"value": "all", "label": "Все"},  # noqa: RUF001
+        {"value": "0-300", "label": "0-300 ккал"},
+        {"value": "300-600", "label": "300-600 ккал"},
+        {"value": "600-1000", "label": "600-1000 ккал"},
+        {"value": "1000", "label": "1000+ ккал"},
+    ]
+
+    html = templates.get_template("menu.html").render(
+        {
+            "request": request,
+            "banner_title": "Здоровая еда с FastFit",  # noqa: RUF001
+            "banner_subtitle": "Вкусные и полезные блюда с доставкой или самовывозом",  # noqa: RUF001
+            "banner_image": "https://images.unsplash.com/photo-1512621776951-a57141f2eefd?q=80&w=1200",
+            "categories": [
+                {"id": "all", "name": "Все"},  # noqa: RUF001
+                *unique_categories,
+            ],
+            "menu_items": menu_items,
+            "calorie_options": calorie_options,
+            "cart_message": Markup(SLOT),
+        }
+    )
+    return RenderedPage.create(html)
+
+
+@lru_cache(maxsize=256)
+def _render_cart_message(success_message: str) -> bytes:
+    template = templates.get_template("partials/cart_message.html")
+    return template.render(success_message=success_message).encode()
+
+
 # GET endpoint to render the menu page
 @menu_router.get("/menu", name="menu")
 async def get_menu(
     request: Request,
-    dishes_use_case: Annotated[IGetDishesByRestaurantUseCase, Depends()],
+    snapshot_use_case: Annotated[IGetMenuSnapshotUseCase, Depends()],
     restaurant_id: UUID = DEFAULT_RESTAURANT_ID,  # Assume restaurant_id is passed as a query parameter
-) -> HTMLResponse:
+) -> Response:
     try:
-        # Fetch dishes for the given restaurant
-        query = GetDishesByRestaurantQuery(restaurant_id=restaurant_id)
-        dishes: list[DishReadModel] = await dishes_use_case.execute(query)
-
-        # Extract unique categories from dishes
-        categories = [
-            {"id": str(dish.category.category_id), "name": dish.category.name}
-            for dish in sorted(dishes, key=lambda x: x.category.name)
-        ]
-        # Remove duplicates while preserving order
-        seen: set[str] = set()
-
-        unique_categories: list[dict[str, str]] = []
-        for cat in categories:
-            if (cat["id"]) not in seen:
-                seen.add(cat["id"])
-                unique_categories.append(cat)
-
-        # Prepare menu items for the template
-        menu_items = [
-            {
-                "id": str(dish.dish_id),
-                "name": dish.name,
-                "description": dish.description,
-                "price": f"{dish.price:.2f}",
-                "calories": f"{dish.calories:.0f}",
-                "category": str(dish.category.category_id),
-                "proteins": f"{dish.proteins:.0f}",
-                "fats": f"{dish.fats:.0f}",
-                "carbohydrates": f"{dish.carbohydrates:.0f}",
-                "image": dish.image or "https://placehold.co/400",  # Fallback image
-            }
-            for dish in dishes
-        ]
-
-        # Define calorie filter options
-        calorie_options = [
-            {"value": "all", "label": "Все"},  # noqa: RUF001
-            {"value": "0-300", "label": "0-300 ккал"},
-            {"value": "300-600", "label": "300-600 ккал"},
-            {"value": "600-1000", "label": "600-1000 ккал"},
-            {"value": "1000", "label": "1000+ ккал"},
-        ]
-
-        return templates.TemplateResponse(
-            "menu.html",
-            {
-                "request": request,
-                "banner_title": "Здоровая еда с FastFit",  # noqa: RUF001
-                "banner_subtitle": "Вкусные и полезные блюда с доставкой или самовывозом",  # noqa: RUF001
-                "banner_image": "https://images.unsplash.com/photo-1512621776951-a57141f2eefd?q=80&w=1200",
-                "categories": [
-                    {"id": "all", "name": "Все"},  # noqa: RUF001
-                    *unique_categories,
-                ],
-                "menu_items": menu_items,
-                "calorie_options": calorie_options,
-                "success_message": unquote(
-                    request.cookies.get("success_message") or ""
-                ),
-            },
+        query = GetMenuSnapshotQuery(restaurant_id=restaurant_id)
+        snapshot = await snapshot_use_case.execute(query)
+
+        # NOTE: Page depends on the base url (url_for) and the login state (header)
+        key = (
+            restaurant_id,
+            snapshot.digest,
+            str(request.base_url),
+            bool(request.cookies.get("access_token")),
+        )
+        page = menu_pages.get(key)
+        if page is None:
+            page = _render_menu_page(request, snapshot)
+            menu_pages.set(key, page)
+
+        fragment = _render_cart_message(
+            unquote(request.cookies.get("success_message") or "")
         )
+        etag = page.etag(fragment)
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache", "Vary": "Cookie"}
+
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        return Response(page.body(fragment), media_type="text/html", headers=headers)
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Error fetching menu: {e!s}"
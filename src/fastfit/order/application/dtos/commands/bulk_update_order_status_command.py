@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+from fastfit.order.application.dtos.commands.update_order_status_command import (
+    UpdateOrderStatusCommand,
+)
+
+
+@dataclass
+class BulkUpdateOrderStatusCommand:
+    transitions: list[UpdateOrderStatusCommand]
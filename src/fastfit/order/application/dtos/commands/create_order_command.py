@@ -1,5 +1,4 @@
 from dataclasses import dataclass
-from decimal import Decimal
 from uuid import UUID
 
 from fastfit.order.domain.value_objects.delivery_type import DeliveryType
@@ -9,8 +8,6 @@ from fastfit.order.domain.value_objects.delivery_type import DeliveryType
 class OrderItemDTO:
     dish_id: UUID
     quantity: int
-    price: Decimal
-    currency: str
 
 
 @dataclass
@@ -21,3 +18,4 @@ class CreateOrderCommand:
     delivery_type: DeliveryType
     delivery_address: str | None
     restaurant_id: UUID
+    idempotency_key: str | None = None
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from enum import Enum
+from uuid import UUID
+
+from fastfit.order.domain.value_objects.order_status import OrderStatus
+
+
+class OrderStatusOutcomeType(Enum):
+    APPLIED = "applied"
+    NOT_FOUND = "not_found"
+    INVALID_TRANSITION = "invalid_transition"
+    CONFLICT = "conflict"  # Status changed between validation and update
+
+
+@dataclass(frozen=True)
+class OrderStatusOutcome:
+    order_id: UUID
+    status: OrderStatus
+    outcome: OrderStatusOutcomeType
+
+    @property
+    def applied(self) -> bool:
+        return self.outcome == OrderStatusOutcomeType.APPLIED
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from fastfit.order.application.read_models.kitchen_board import KitchenBoardCursor
+
+
+@dataclass
+class GetKitchenBoardQuery:
+    restaurant_id: UUID
+    since: KitchenBoardCursor | None = None
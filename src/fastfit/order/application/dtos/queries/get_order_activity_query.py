@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from datetime import date
+from uuid import UUID
+
+
+@dataclass
+class GetOrderActivityQuery:
+    user_id: UUID
+    last_day: date
+    days: int
+    timezone: str
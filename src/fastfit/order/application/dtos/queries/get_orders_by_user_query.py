@@ -1,7 +1,15 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from fastfit.order.application.read_models.order_page import OrderCursor
+
+
+DEFAULT_ORDER_PAGE_SIZE = 10
+MAX_ORDER_PAGE_SIZE = 50
+
 
 @dataclass
 class GetOrdersByUserQuery:
     user_id: UUID
+    limit: int = DEFAULT_ORDER_PAGE_SIZE
+    after: OrderCursor | None = None
@@ -0,0 +1,17 @@
+from uuid import UUID
+
+from common.application.exceptions import ApplicationError
+
+
+class DishUnavailableError(ApplicationError):
+    def __init__(self, dish_ids: list[UUID]) -> None:
+        super().__init__(
+            f"Dishes not available: {', '.join(str(dish_id) for dish_id in dish_ids)}"
+        )
+        self.dish_ids = dish_ids
+
+
+class IdempotencyKeyReusedError(ApplicationError):
+    def __init__(self, key: str) -> None:
+        super().__init__(f"Idempotency key '{key}' was used for a different request")
+        self.key = key
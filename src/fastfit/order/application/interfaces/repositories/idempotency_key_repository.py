@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from uuid import UUID
+
+from common.domain.value_objects.datetime import DateTime
+
+
+@dataclass(frozen=True)
+class IdempotencyRecord:
+    user_id: UUID
+    key: str
+    request_hash: str
+    order_id: UUID
+    expires_at: DateTime
+
+
+class IIdempotencyKeyRepository(ABC):
+    @abstractmethod
+    async def get(
+        self, user_id: UUID, key: str, now: DateTime
+    ) -> IdempotencyRecord | None: ...
+
+    @abstractmethod
+    async def claim(
+        self, record: IdempotencyRecord, now: DateTime
+    ) -> IdempotencyRecord: ...
+
+    @abstractmethod
+    async def remove_expired(self, now: DateTime, limit: int) -> int: ...
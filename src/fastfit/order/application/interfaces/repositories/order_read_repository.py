@@ -1,7 +1,15 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Sequence
+from contextlib import AbstractAsyncContextManager
+from datetime import date, datetime
 from uuid import UUID
 
+from fastfit.order.application.read_models.kitchen_board import KitchenBoardOrder
+from fastfit.order.application.read_models.order_page import OrderCursor, OrderPage
 from fastfit.order.application.read_models.order_read_model import OrderReadModel
+from fastfit.order.application.read_models.order_status_read_model import (
+    OrderStatusReadModel,
+)
 from fastfit.order.domain.value_objects.order_status import OrderStatus
 
 
@@ -10,9 +18,33 @@ class IOrderReadRepository(ABC):
     async def get_by_id(self, order_id: UUID) -> OrderReadModel: ...
 
     @abstractmethod
-    async def get_by_user(self, user_id: UUID) -> list[OrderReadModel]: ...
+    async def get_status(self, order_id: UUID) -> OrderStatusReadModel: ...
 
     @abstractmethod
-    async def get_by_restaurant(
-        self, restaurant_id: UUID, status: OrderStatus | None
-    ) -> list[OrderReadModel]: ...
+    async def get_by_user(
+        self, user_id: UUID, limit: int, after: OrderCursor | None = None
+    ) -> OrderPage: ...
+
+    # NOTE: Context manager yielding orders created in [start, end) oldest first,
+    # fetched in batches so memory stays flat however many orders the range
+    # holds. The cursor is released when the block exits.
+    @abstractmethod
+    def stream_by_restaurant(
+        self, restaurant_id: UUID, start: datetime, end: datetime
+    ) -> AbstractAsyncContextManager[AsyncIterator[OrderReadModel]]: ...
+
+    @abstractmethod
+    async def count_by_day(
+        self, user_id: UUID, start: datetime, end: datetime, timezone: str
+    ) -> dict[date, int]: ...
+
+    @abstractmethod
+    async def get_kitchen_board(
+        self, restaurant_id: UUID, statuses: Sequence[OrderStatus]
+    ) -> list[KitchenBoardOrder]: ...
+
+    # NOTE: Returns orders in any status, so boards can drop finished ones
+    @abstractmethod
+    async def get_kitchen_board_changes(
+        self, restaurant_id: UUID, changed_after: datetime
+    ) -> list[KitchenBoardOrder]: ...
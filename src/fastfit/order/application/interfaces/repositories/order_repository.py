@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from uuid import UUID
 
 from fastfit.order.domain.entities.order import Order
+from fastfit.order.domain.value_objects.order_status import OrderStatus
 
 
 class IOrderRepository(ABC):
@@ -13,3 +14,11 @@ class IOrderRepository(ABC):
 
     @abstractmethod
     async def update(self, entity: Order) -> None: ...
+
+    @abstractmethod
+    async def get_statuses(self, order_ids: list[UUID]) -> dict[UUID, OrderStatus]: ...
+
+    @abstractmethod
+    async def update_statuses(
+        self, order_ids: list[UUID], from_status: OrderStatus, to_status: OrderStatus
+    ) -> list[UUID]: ...
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from uuid import UUID
+
+from common.domain.value_objects.datetime import DateTime
+from fastfit.order.domain.value_objects.order_status import OrderStatus
+
+
+@dataclass(frozen=True)
+class ScheduledStatusTransition:
+    order_id: UUID
+    status: OrderStatus
+    due_at: DateTime
+
+
+class IOrderStatusScheduleRepository(ABC):
+    @abstractmethod
+    async def add(self, transition: ScheduledStatusTransition) -> None: ...
+
+    @abstractmethod
+    async def claim_due(
+        self, now: DateTime, limit: int
+    ) -> list[ScheduledStatusTransition]: ...
+
+    @abstractmethod
+    async def remove(self, order_ids: list[UUID]) -> None: ...
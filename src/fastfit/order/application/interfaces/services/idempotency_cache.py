@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from fastfit.order.application.interfaces.repositories.idempotency_key_repository import (
+    IdempotencyRecord,
+)
+
+
+class IIdempotencyCache(ABC):
+    @abstractmethod
+    def get(self, user_id: UUID, key: str) -> IdempotencyRecord | None: ...
+    @abstractmethod
+    def put(self, record: IdempotencyRecord) -> None: ...
@@ -0,0 +1,7 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class IKitchenStaff(ABC):
+    @abstractmethod
+    def is_member(self, identity_id: UUID) -> bool: ...
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from uuid import UUID
+
+from fastfit.order.domain.value_objects.order_status import OrderStatus
+
+
+@dataclass(frozen=True)
+class OrderStatusEvent:
+    order_id: UUID
+    status: OrderStatus
+
+
+class IOrderStatusNotifier(ABC):
+    @abstractmethod
+    async def notify(self, events: Sequence[OrderStatusEvent]) -> None: ...
+
+
+class IOrderStatusSubscription(ABC):
+    # NOTE: Returns None when no event arrived within the heartbeat interval
+    @abstractmethod
+    async def next(self) -> OrderStatusEvent | None: ...
+
+    @abstractmethod
+    def close(self) -> None: ...
+
+
+class IOrderStatusFeed(ABC):
+    @abstractmethod
+    def subscribe(self, order_id: UUID) -> IOrderStatusSubscription: ...
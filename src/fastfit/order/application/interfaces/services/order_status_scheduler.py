@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from fastfit.order.domain.value_objects.order_status import OrderStatus
+
+
+class IOrderStatusScheduler(ABC):
+    @abstractmethod
+    async def schedule(self, order_id: UUID, status: OrderStatus) -> None: ...
+
+    @abstractmethod
+    async def run_due(self, limit: int) -> int: ...
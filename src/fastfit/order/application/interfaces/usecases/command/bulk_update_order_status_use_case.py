@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from fastfit.order.application.dtos.commands.bulk_update_order_status_command import (
+    BulkUpdateOrderStatusCommand,
+)
+from fastfit.order.application.dtos.models.order_status_outcome import (
+    OrderStatusOutcome,
+)
+
+
+class IBulkUpdateOrderStatusUseCase(ABC):
+    @abstractmethod
+    async def execute(
+        self, command: BulkUpdateOrderStatusCommand
+    ) -> list[OrderStatusOutcome]: ...
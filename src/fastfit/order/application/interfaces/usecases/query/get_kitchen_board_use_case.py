@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+from fastfit.order.application.dtos.queries.get_kitchen_board_query import (
+    GetKitchenBoardQuery,
+)
+from fastfit.order.application.read_models.kitchen_board import KitchenBoard
+
+
+class IGetKitchenBoardUseCase(ABC):
+    @abstractmethod
+    async def execute(self, query: GetKitchenBoardQuery) -> KitchenBoard: ...
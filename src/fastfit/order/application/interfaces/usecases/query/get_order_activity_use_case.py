@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from fastfit.order.application.dtos.queries.get_order_activity_query import (
+    GetOrderActivityQuery,
+)
+from fastfit.order.application.read_models.order_activity_read_model import (
+    OrderActivityReadModel,
+)
+
+
+class IGetOrderActivityUseCase(ABC):
+    @abstractmethod
+    async def execute(
+        self, query: GetOrderActivityQuery
+    ) -> list[OrderActivityReadModel]: ...
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from fastfit.order.application.dtos.queries.get_order_status_query import (
+    GetOrderStatusQuery,
+)
+from fastfit.order.application.read_models.order_status_read_model import (
+    OrderStatusReadModel,
+)
+
+
+class IGetOrderStatusUseCase(ABC):
+    @abstractmethod
+    async def execute(self, query: GetOrderStatusQuery) -> OrderStatusReadModel: ...
@@ -3,9 +3,9 @@ from abc import ABC, abstractmethod
 from fastfit.order.application.dtos.queries.get_orders_by_user_query import (
     GetOrdersByUserQuery,
 )
-from fastfit.order.application.read_models.order_read_model import OrderReadModel
+from fastfit.order.application.read_models.order_page import OrderPage
 
 
 class IGetOrdersByUserUseCase(ABC):
     @abstractmethod
-    async def execute(self, query: GetOrdersByUserQuery) -> list[OrderReadModel]: ...
+    async def execute(self, query: GetOrdersByUserQuery) -> OrderPage: ...
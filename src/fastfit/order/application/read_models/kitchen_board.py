@@ -0,0 +1,51 @@
+import base64
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Self
+from uuid import UUID
+
+from fastfit.order.domain.value_objects.delivery_type import DeliveryType
+from fastfit.order.domain.value_objects.order_status import OrderStatus
+
+
+@dataclass(frozen=True)
+class KitchenBoardItem:
+    dish_id: UUID
+    name: str
+    quantity: int
+
+
+@dataclass(frozen=True)
+class KitchenBoardOrder:
+    order_id: UUID
+    status: OrderStatus
+    delivery_type: DeliveryType
+    created_at: datetime
+    updated_at: datetime
+    items: list[KitchenBoardItem]
+
+
+@dataclass(frozen=True)
+class KitchenBoardCursor:
+    """Latest change of a restaurant's orders seen by a board."""
+
+    updated_at: datetime
+
+    def encode(self) -> str:
+        raw = self.updated_at.isoformat().encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> Self:
+        """Parse a token, raising ``ValueError`` if it is malformed."""
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        updated_at = datetime.fromisoformat(raw)
+        if updated_at.tzinfo is None:
+            raise ValueError("Cursor timestamp must be timezone-aware")
+        return cls(updated_at)
+
+
+@dataclass(frozen=True)
+class KitchenBoard:
+    orders: list[KitchenBoardOrder]
+    next_cursor: KitchenBoardCursor | None
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass(frozen=True)
+class OrderActivityReadModel:
+    date: date
+    orders_count: int
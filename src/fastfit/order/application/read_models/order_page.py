@@ -0,0 +1,32 @@
+import base64
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Self
+from uuid import UUID
+
+from fastfit.order.application.read_models.order_read_model import OrderReadModel
+
+
+@dataclass(frozen=True)
+class OrderCursor:
+    """Position after the last order of a page, newest orders first."""
+
+    created_at: datetime
+    order_id: UUID
+
+    def encode(self) -> str:
+        raw = f"{self.created_at.isoformat()}|{self.order_id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> Self:
+        """Parse a token, raising ``ValueError`` if it is malformed."""
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        created_at, _, order_id = raw.partition("|")
+        return cls(datetime.fromisoformat(created_at), UUID(order_id))
+
+
+@dataclass(frozen=True)
+class OrderPage:
+    orders: list[OrderReadModel]
+    next_cursor: OrderCursor | None
@@ -3,15 +3,24 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from fastfit.menu.application.read_models.dish_read_model import DishReadModel
 from fastfit.order.domain.value_objects.delivery_type import DeliveryType
 from fastfit.order.domain.value_objects.order_status import OrderStatus
 
 
+@dataclass(frozen=True)
+class OrderDishReadModel:
+    name: str
+    calories: Decimal
+    proteins: Decimal
+    fats: Decimal
+    carbohydrates: Decimal
+    image: str | None
+
+
 @dataclass(frozen=True)
 class OrderItemReadModel:
     dish_id: UUID
-    dish: DishReadModel
+    dish: OrderDishReadModel
     quantity: int
     price: Decimal
     currency: str
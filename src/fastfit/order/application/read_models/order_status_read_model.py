@@ -4,7 +4,8 @@ from uuid import UUID
 from fastfit.order.domain.value_objects.order_status import OrderStatus
 
 
-@dataclass
-class GetOrdersByRestaurantQuery:
-    restaurant_id: UUID
-    status: OrderStatus | None = None
+@dataclass(frozen=True)
+class OrderStatusReadModel:
+    order_id: UUID
+    user_id: UUID | None
+    status: OrderStatus
@@ -0,0 +1,86 @@
+from collections.abc import Mapping
+from datetime import timedelta
+from uuid import UUID
+
+from common.application.interfaces.transactions.unit_of_work import IUnitOfWork
+from common.domain.interfaces.clock import IClock
+from fastfit.order.application.dtos.commands.bulk_update_order_status_command import (
+    BulkUpdateOrderStatusCommand,
+)
+from fastfit.order.application.dtos.commands.update_order_status_command import (
+    UpdateOrderStatusCommand,
+)
+from fastfit.order.application.interfaces.repositories.order_status_schedule_repository import (
+    IOrderStatusScheduleRepository,
+    ScheduledStatusTransition,
+)
+from fastfit.order.application.interfaces.services.order_status_scheduler import (
+    IOrderStatusScheduler,
+)
+from fastfit.order.application.interfaces.usecases.command.bulk_update_order_status_use_case import (
+    IBulkUpdateOrderStatusUseCase,
+)
+from fastfit.order.domain.value_objects.order_status import OrderStatus
+
+
+# NOTE: Transition scheduled once an order reaches the key status
+NEXT_STATUS: Mapping[OrderStatus, OrderStatus] = {
+    OrderStatus.PREPARING: OrderStatus.READY,
+    OrderStatus.READY: OrderStatus.DELIVERED,
+}
+
+
+class OrderStatusScheduler(IOrderStatusScheduler):
+    """Persists pending status transitions and applies them once due.
+
+    Due rows are claimed with ``SKIP LOCKED`` inside one transaction, so any
+    number of instances can run the scheduler without applying a transition
+    twice, and pending transitions survive restarts.
+    """
+
+    def __init__(
+        self,
+        clock: IClock,
+        uow: IUnitOfWork,
+        schedule_repository: IOrderStatusScheduleRepository,
+        bulk_update_order_status_use_case: IBulkUpdateOrderStatusUseCase,
+        delays: Mapping[OrderStatus, timedelta],
+    ) -> None:
+        self.clock = clock
+        self.uow = uow
+        self.schedule_repository = schedule_repository
+        self.bulk_update_order_status_use_case = bulk_update_order_status_use_case
+        self.delays = delays
+
+    async def schedule(self, order_id: UUID, status: OrderStatus) -> None:
+        await self.schedule_repository.add(self._transition(order_id, status))
+
+    async def run_due(self, limit: int) -> int:
+        async with self.uow:
+            due = await self.schedule_repository.claim_due(self.clock.now(), limit)
+            if not due:
+                return 0
+
+            command = BulkUpdateOrderStatusCommand(
+                [UpdateOrderStatusCommand(t.order_id, t.status) for t in due]
+            )
+            outcomes = await self.bulk_update_order_status_use_case.execute(command)
+
+            # NOTE: Rejected transitions are dropped, not retried: the order
+            # has moved on or disappeared meanwhile
+            await self.schedule_repository.remove([t.order_id for t in due])
+            for outcome in outcomes:
+                next_status = NEXT_STATUS.get(outcome.status)
+                if outcome.applied and next_status is not None:
+                    await self.schedule_repository.add(
+                        self._transition(outcome.order_id, next_status)
+                    )
+            return len(due)
+
+    def _transition(
+        self, order_id: UUID, status: OrderStatus
+    ) -> ScheduledStatusTransition:
+        delay = self.delays.get(status, timedelta(0))
+        return ScheduledStatusTransition(
+            order_id=order_id, status=status, due_at=self.clock.now() + delay
+        )
@@ -0,0 +1,87 @@
+from collections import defaultdict
+from uuid import UUID
+
+from fastfit.order.application.dtos.commands.bulk_update_order_status_command import (
+    BulkUpdateOrderStatusCommand,
+)
+from fastfit.order.application.dtos.models.order_status_outcome import (
+    OrderStatusOutcome,
+    OrderStatusOutcomeType,
+)
+from fastfit.order.application.interfaces.repositories.order_repository import (
+    IOrderRepository,
+)
+from fastfit.order.application.interfaces.services.order_status_events import (
+    IOrderStatusNotifier,
+    OrderStatusEvent,
+)
+from fastfit.order.application.interfaces.usecases.command.bulk_update_order_status_use_case import (
+    IBulkUpdateOrderStatusUseCase,
+)
+from fastfit.order.domain.value_objects.order_status import OrderStatus
+
+
+class BulkUpdateOrderStatusUseCase(IBulkUpdateOrderStatusUseCase):
+    """Applies status transitions with one UPDATE per (from, to) status pair.
+
+    Transitions are validated against the current statuses first.
+    Each UPDATE is guarded by the status it was validated against, so an
+    order changed concurrently is reported as a conflict, not overwritten.
+    """
+
+    def __init__(
+        self,
+        order_repository: IOrderRepository,
+        order_status_notifier: IOrderStatusNotifier,
+    ) -> None:
+        self.order_repository = order_repository
+        self.order_status_notifier = order_status_notifier
+
+    async def execute(
+        self, command: BulkUpdateOrderStatusCommand
+    ) -> list[OrderStatusOutcome]:
+        # NOTE: The last transition requested for an order wins
+        targets = {t.order_id: t.status for t in command.transitions}
+        if not targets:
+            return []
+
+        current = await self.order_repository.get_statuses(list(targets))
+
+        outcomes: dict[UUID, OrderStatusOutcomeType] = {}
+        groups: defaultdict[tuple[OrderStatus, OrderStatus], list[UUID]] = defaultdict(
+            list
+        )
+        for order_id, status in targets.items():
+            from_status = current.get(order_id)
+            if from_status is None:
+                outcomes[order_id] = OrderStatusOutcomeType.NOT_FOUND
+            elif not from_status.can_transition_to(status):
+                outcomes[order_id] = OrderStatusOutcomeType.INVALID_TRANSITION
+            else:
+                groups[from_status, status].append(order_id)
+
+        for (from_status, to_status), order_ids in groups.items():
+            updated = set(
+                await self.order_repository.update_statuses(
+                    order_ids, from_status, to_status
+                )
+            )
+            for order_id in order_ids:
+                outcomes[order_id] = (
+                    OrderStatusOutcomeType.APPLIED
+                    if order_id in updated
+                    else OrderStatusOutcomeType.CONFLICT
+                )
+
+        results = [
+            OrderStatusOutcome(order_id, status, outcomes[order_id])
+            for order_id, status in targets.items()
+        ]
+        await self.order_status_notifier.notify(
+            [
+                OrderStatusEvent(outcome.order_id, outcome.status)
+                for outcome in results
+                if outcome.applied
+            ]
+        )
+        return results
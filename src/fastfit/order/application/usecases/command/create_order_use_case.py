@@ -1,40 +1,58 @@
 from uuid import UUID
 
+from common.application.interfaces.transactions.unit_of_work import IUnitOfWork
 from common.domain.interfaces.clock import IClock
 from common.domain.interfaces.uuid_generator import IUUIDGenerator
 from common.domain.value_objects.phone_number import PhoneNumber
-from fastfit.menu.domain.value_objects.money import Money
+from fastfit.menu.application.interfaces.services.price_book import IPriceBook
 from fastfit.order.application.dtos.commands.create_order_command import (
     CreateOrderCommand,
 )
+from fastfit.order.application.exceptions import DishUnavailableError
 from fastfit.order.application.interfaces.repositories.order_repository import (
     IOrderRepository,
 )
+from fastfit.order.application.interfaces.services.order_status_scheduler import (
+    IOrderStatusScheduler,
+)
 from fastfit.order.application.interfaces.usecases.command.create_order_use_case import (
     ICreateOrderUseCase,
 )
 from fastfit.order.domain.entities.order import Order
 from fastfit.order.domain.entities.order_item import OrderItem
 from fastfit.order.domain.value_objects.delivery_address import DeliveryAddress
+from fastfit.order.domain.value_objects.order_status import OrderStatus
 
 
 class CreateOrderUseCase(ICreateOrderUseCase):
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         clock: IClock,
         uuid_generator: IUUIDGenerator,
+        uow: IUnitOfWork,
         order_repository: IOrderRepository,
+        price_book: IPriceBook,
+        order_status_scheduler: IOrderStatusScheduler,
     ) -> None:
         self.clock = clock
         self.uuid_generator = uuid_generator
+        self.uow = uow
         self.order_repository = order_repository
+        self.price_book = price_book
+        self.order_status_scheduler = order_status_scheduler
 
     async def execute(self, command: CreateOrderCommand) -> UUID:
+        # NOTE: Items are always priced from the menu, never by the client
+        dish_ids = list(dict.fromkeys(item.dish_id for item in command.items))
+        prices = await self.price_book.get_prices(command.restaurant_id, dish_ids)
+        if unavailable := [dish_id for dish_id in dish_ids if dish_id not in prices]:
+            raise DishUnavailableError(unavailable)
+
         items = [
             OrderItem.create(
                 dish_id=item.dish_id,
                 quantity=item.quantity,
-                price=Money.create(item.price, item.currency),
+                price=prices[item.dish_id],
             )
             for item in command.items
         ]
@@ -52,5 +70,9 @@ class CreateOrderUseCase(ICreateOrderUseCase):
             restaurant_id=command.restaurant_id,
             created_at=self.clock.now(),
         )
-        await self.order_repository.add(order)
+        async with self.uow:
+            await self.order_repository.add(order)
+            await self.order_status_scheduler.schedule(
+                order.order_id, OrderStatus.PREPARING
+            )
         return order.order_id
@@ -0,0 +1,129 @@
+import asyncio
+import dataclasses
+import hashlib
+from datetime import timedelta
+from uuid import UUID
+
+from common.application.interfaces.transactions.unit_of_work import IUnitOfWork
+from common.domain.interfaces.clock import IClock
+from fastfit.order.application.dtos.commands.create_order_command import (
+    CreateOrderCommand,
+)
+from fastfit.order.application.exceptions import IdempotencyKeyReusedError
+from fastfit.order.application.interfaces.repositories.idempotency_key_repository import (
+    IdempotencyRecord,
+    IIdempotencyKeyRepository,
+)
+from fastfit.order.application.interfaces.services.idempotency_cache import (
+    IIdempotencyCache,
+)
+from fastfit.order.application.interfaces.usecases.command.create_order_use_case import (
+    ICreateOrderUseCase,
+)
+
+
+class _KeyAlreadyClaimed(Exception):  # noqa: N818
+    """Rolls back an order created while another request claimed its key."""
+
+    def __init__(self, record: IdempotencyRecord) -> None:
+        super().__init__(record.key)
+        self.record = record
+
+
+def request_hash(command: CreateOrderCommand) -> str:
+    # NOTE: Dataclass repr is deterministic for the UUIDs and enums involved
+    payload = repr(dataclasses.replace(command, idempotency_key=None))
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class IdempotentCreateOrderUseCase(ICreateOrderUseCase):
+    """Creates an order at most once per user and idempotency key.
+
+    Replays return the order of the first request. Duplicates arriving while
+    the first is still in flight in this process wait for its result. Across
+    processes the key row is inserted in the order transaction, so the loser
+    blocks on it and rolls its order back once the winner commits.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        clock: IClock,
+        uow: IUnitOfWork,
+        create_order_use_case: ICreateOrderUseCase,
+        idempotency_key_repository: IIdempotencyKeyRepository,
+        ttl: timedelta,
+        idempotency_cache: IIdempotencyCache | None = None,
+    ) -> None:
+        self.clock = clock
+        self.uow = uow
+        self.create_order_use_case = create_order_use_case
+        self.idempotency_key_repository = idempotency_key_repository
+        self.ttl = ttl
+        self.idempotency_cache = idempotency_cache
+        self._in_flight: dict[tuple[UUID, str], asyncio.Future[IdempotencyRecord]] = {}
+
+    async def execute(self, command: CreateOrderCommand) -> UUID:
+        key, user_id = command.idempotency_key, command.user_id
+        if key is None or user_id is None:
+            return await self.create_order_use_case.execute(command)
+
+        digest = request_hash(command)
+        scope = (user_id, key)
+        if (pending := self._in_flight.get(scope)) is not None:
+            return self._replay(await asyncio.shield(pending), digest)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[scope] = future
+        try:
+            record = await self._execute_once(command, user_id, key, digest)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # NOTE: Marks it retrieved when nobody waits
+            raise
+        else:
+            future.set_result(record)
+        finally:
+            del self._in_flight[scope]
+            if not future.done():
+                future.cancel()
+        return self._replay(record, digest)
+
+    async def _execute_once(
+        self, command: CreateOrderCommand, user_id: UUID, key: str, digest: str
+    ) -> IdempotencyRecord:
+        now = self.clock.now()
+        record = (
+            self.idempotency_cache.get(user_id, key)
+            if self.idempotency_cache is not None
+            else None
+        )
+        if record is None:
+            record = await self.idempotency_key_repository.get(user_id, key, now)
+
+        if record is None:
+            try:
+                async with self.uow:
+                    order_id = await self.create_order_use_case.execute(command)
+                    record = await self.idempotency_key_repository.claim(
+                        IdempotencyRecord(
+                            user_id=user_id,
+                            key=key,
+                            request_hash=digest,
+                            order_id=order_id,
+                            expires_at=now + self.ttl,
+                        ),
+                        now,
+                    )
+                    if record.order_id != order_id:
+                        raise _KeyAlreadyClaimed(record)
+            except _KeyAlreadyClaimed as e:
+                record = e.record
+
+        if self.idempotency_cache is not None:
+            self.idempotency_cache.put(record)
+        return record
+
+    def _replay(self, record: IdempotencyRecord, digest: str) -> UUID:
+        if record.request_hash != digest:
+            raise IdempotencyKeyReusedError(record.key)
+        return record.order_id
@@ -0,0 +1,56 @@
+from datetime import timedelta
+
+from fastfit.order.application.dtos.queries.get_kitchen_board_query import (
+    GetKitchenBoardQuery,
+)
+from fastfit.order.application.interfaces.repositories.order_read_repository import (
+    IOrderReadRepository,
+)
+from fastfit.order.application.interfaces.usecases.query.get_kitchen_board_use_case import (
+    IGetKitchenBoardUseCase,
+)
+from fastfit.order.application.read_models.kitchen_board import (
+    KitchenBoard,
+    KitchenBoardCursor,
+)
+from fastfit.order.domain.value_objects.order_status import OrderStatus
+
+
+# NOTE: Orders waiting for the kitchen, in the order they are shown
+ACTIVE_STATUSES = (OrderStatus.CREATED, OrderStatus.PREPARING, OrderStatus.READY)
+
+# NOTE: updated_at is the start time of the writing transaction, so a change
+# committed late can carry a timestamp older than the cursor. Re-reading a
+# short window behind the cursor catches it; boards apply orders by id. Status
+# writes are short transactions, the window covers their commit as long as
+# changes are read from the primary, never from a lagging replica.
+SYNC_OVERLAP = timedelta(seconds=5)
+
+
+class GetKitchenBoardUseCase(IGetKitchenBoardUseCase):
+    """Active orders of a restaurant for the kitchen board.
+
+    Without a cursor the full board is returned. With one, only orders
+    changed since then are returned, including those that left the board,
+    so a polling screen reads a handful of rows per request.
+    """
+
+    def __init__(self, order_read_repository: IOrderReadRepository) -> None:
+        self.order_read_repository = order_read_repository
+
+    async def execute(self, query: GetKitchenBoardQuery) -> KitchenBoard:
+        if query.since is None:
+            orders = await self.order_read_repository.get_kitchen_board(
+                query.restaurant_id, ACTIVE_STATUSES
+            )
+        else:
+            orders = await self.order_read_repository.get_kitchen_board_changes(
+                query.restaurant_id, query.since.updated_at - SYNC_OVERLAP
+            )
+
+        next_cursor = query.since
+        if orders:
+            latest = max(order.updated_at for order in orders)
+            if next_cursor is None or latest > next_cursor.updated_at:
+                next_cursor = KitchenBoardCursor(latest)
+        return KitchenBoard(orders, next_cursor)
@@ -0,0 +1,36 @@
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from fastfit.order.application.dtos.queries.get_order_activity_query import (
+    GetOrderActivityQuery,
+)
+from fastfit.order.application.interfaces.repositories.order_read_repository import (
+    IOrderReadRepository,
+)
+from fastfit.order.application.interfaces.usecases.query.get_order_activity_use_case import (
+    IGetOrderActivityUseCase,
+)
+from fastfit.order.application.read_models.order_activity_read_model import (
+    OrderActivityReadModel,
+)
+
+
+class GetOrderActivityUseCase(IGetOrderActivityUseCase):
+    """Order counts per local day, oldest day first, days without orders included."""
+
+    def __init__(self, order_read_repository: IOrderReadRepository) -> None:
+        self.order_read_repository = order_read_repository
+
+    async def execute(
+        self, query: GetOrderActivityQuery
+    ) -> list[OrderActivityReadModel]:
+        tz = ZoneInfo(query.timezone)
+        first_day = query.last_day - timedelta(days=query.days - 1)
+        counts = await self.order_read_repository.count_by_day(
+            query.user_id,
+            datetime.combine(first_day, time(), tz),
+            datetime.combine(query.last_day + timedelta(days=1), time(), tz),
+            query.timezone,
+        )
+        days = (first_day + timedelta(days=i) for i in range(query.days))
+        return [OrderActivityReadModel(day, counts.get(day, 0)) for day in days]
@@ -0,0 +1,20 @@
+from fastfit.order.application.dtos.queries.get_order_status_query import (
+    GetOrderStatusQuery,
+)
+from fastfit.order.application.interfaces.repositories.order_read_repository import (
+    IOrderReadRepository,
+)
+from fastfit.order.application.interfaces.usecases.query.get_order_status_use_case import (
+    IGetOrderStatusUseCase,
+)
+from fastfit.order.application.read_models.order_status_read_model import (
+    OrderStatusReadModel,
+)
+
+
+class GetOrderStatusUseCase(IGetOrderStatusUseCase):
+    def __init__(self, order_read_repository: IOrderReadRepository) -> None:
+        self.order_read_repository = order_read_repository
+
+    async def execute(self, query: GetOrderStatusQuery) -> OrderStatusReadModel:
+        return await self.order_read_repository.get_status(query.order_id)
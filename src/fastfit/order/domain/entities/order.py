@@ -43,12 +43,7 @@ class Order:
             raise InvariantViolationError("Order must contain at least one item")
 
     def update_status(self, status: OrderStatus) -> None:
-        valid_transitions = {
-            OrderStatus.CREATED: [OrderStatus.PREPARING],
-            OrderStatus.PREPARING: [OrderStatus.READY],
-            OrderStatus.READY: [OrderStatus.DELIVERED, OrderStatus.PICKED_UP],
-        }
-        if status not in valid_transitions.get(self.status, []):
+        if not self.status.can_transition_to(status):
             raise InvariantViolationError(
                 f"Invalid status transition from {self.status} to {status}"
             )
@@ -8,3 +8,17 @@ class OrderStatus(Enum):
     DELIVERED = "delivered"
     PICKED_UP = "picked_up"
     CANCELLED = "cancelled"
+
+    def can_transition_to(self, status: "OrderStatus") -> bool:
+        return status in VALID_TRANSITIONS.get(self, ())
+
+    @property
+    def is_final(self) -> bool:
+        return not VALID_TRANSITIONS.get(self)
+
+
+VALID_TRANSITIONS: dict[OrderStatus, tuple[OrderStatus, ...]] = {
+    OrderStatus.CREATED: (OrderStatus.PREPARING,),
+    OrderStatus.PREPARING: (OrderStatus.READY,),
+    OrderStatus.READY: (OrderStatus.DELIVERED, OrderStatus.PICKED_UP),
+}
@@ -3,15 +3,34 @@ from typing import ClassVar
 
 from common.infrastructure.app.http_app import IHTTPApp
 from common.infrastructure.server.fastapi.server import FastAPIServer
+from fastfit.order.application.interfaces.services.kitchen_staff import IKitchenStaff
+from fastfit.order.application.interfaces.services.order_status_events import (
+    IOrderStatusFeed,
+)
+from fastfit.order.application.interfaces.services.order_status_scheduler import (
+    IOrderStatusScheduler,
+)
+from fastfit.order.application.interfaces.usecases.command.bulk_update_order_status_use_case import (
+    IBulkUpdateOrderStatusUseCase,
+)
 from fastfit.order.application.interfaces.usecases.command.create_order_use_case import (
     ICreateOrderUseCase,
 )
 from fastfit.order.application.interfaces.usecases.command.update_order_status_use_case import (
     IUpdateOrderStatusUseCase,
 )
+from fastfit.order.application.interfaces.usecases.query.get_kitchen_board_use_case import (
+    IGetKitchenBoardUseCase,
+)
+from fastfit.order.application.interfaces.usecases.query.get_order_activity_use_case import (
+    IGetOrderActivityUseCase,
+)
 from fastfit.order.application.interfaces.usecases.query.get_order_by_id_use_case import (
     IGetOrderByIdUseCase,
 )
+from fastfit.order.application.interfaces.usecases.query.get_order_status_use_case import (
+    IGetOrderStatusUseCase,
+)
 from fastfit.order.application.interfaces.usecases.query.get_orders_by_user_use_case import (
     IGetOrdersByUserUseCase,
 )
@@ -33,18 +52,43 @@ class OrderApp(IHTTPApp):
 
     def configure_dependencies(self) -> None:
         self.server.override_dependency(
-            ICreateOrderUseCase, self.order_container.create_order_use_case()
+            ICreateOrderUseCase,
+            self.order_container.idempotent_create_order_use_case(),
         )
         self.server.override_dependency(
             IUpdateOrderStatusUseCase, self.order_container.update_order_use_case()
         )
+        self.server.override_dependency(
+            IBulkUpdateOrderStatusUseCase,
+            self.order_container.bulk_update_order_status_use_case(),
+        )
+        self.server.override_dependency(
+            IOrderStatusScheduler, self.order_container.order_status_scheduler()
+        )
         self.server.override_dependency(
             IGetOrderByIdUseCase, self.order_container.get_order_by_id_use_case()
         )
+        self.server.override_dependency(
+            IGetOrderStatusUseCase, self.order_container.get_order_status_use_case()
+        )
+        self.server.override_dependency(
+            IOrderStatusFeed, self.order_container.order_status_hub()
+        )
         self.server.override_dependency(
             IGetOrdersByUserUseCase,
             self.order_container.get_orders_by_user_use_case(),
         )
+        self.server.override_dependency(
+            IGetOrderActivityUseCase,
+            self.order_container.get_order_activity_use_case(),
+        )
+        self.server.override_dependency(
+            IGetKitchenBoardUseCase,
+            self.order_container.get_kitchen_board_use_case(),
+        )
+        self.server.override_dependency(
+            IKitchenStaff, self.order_container.kitchen_staff()
+        )
 
     def register_routers(self) -> None:
         self.server.register_router(order_router, prefix=self.prefix, tags=self.tags)
@@ -0,0 +1,26 @@
+from datetime import timedelta
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class OrderConfig(BaseModel):
+    scheduler_enabled: bool = True
+    scheduler_interval: timedelta = timedelta(seconds=1)
+    scheduler_batch_size: int = 100
+    scheduler_preparing_delay: timedelta = timedelta(seconds=15)
+    scheduler_ready_delay: timedelta = timedelta(seconds=15)
+    scheduler_delivered_delay: timedelta = timedelta(seconds=60)
+    idempotency_ttl: timedelta = timedelta(hours=24)
+    idempotency_cache_enabled: bool = True
+    idempotency_cache_ttl: timedelta = timedelta(minutes=10)
+    idempotency_cache_size: int = 10_000
+    idempotency_sweep_interval: timedelta = timedelta(minutes=10)
+    idempotency_sweep_batch_size: int = 1000
+    events_notify_enabled: bool = True
+    events_channel: str = "order_status"
+    events_queue_size: int = 8
+    events_heartbeat_interval: timedelta = timedelta(seconds=15)
+    events_listen_check_interval: timedelta = timedelta(seconds=5)
+    # NOTE: Identities allowed to read the kitchen board, empty admits nobody
+    kitchen_staff_ids: list[UUID] = Field(default_factory=list)
@@ -0,0 +1,84 @@
+from uuid import UUID
+
+from common.domain.value_objects.datetime import DateTime
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from fastfit.order.application.interfaces.repositories.idempotency_key_repository import (
+    IdempotencyRecord,
+    IIdempotencyKeyRepository,
+)
+from fastfit.order.infrastructure.database.postgres.sqlalchemy.models.idempotency_key_base import (
+    IdempotencyKeyBase,
+)
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+
+
+class IdempotencyKeyRepository(IIdempotencyKeyRepository):
+    def __init__(self, executor: QueryExecutor) -> None:
+        self.executor = executor
+
+    async def get(
+        self, user_id: UUID, key: str, now: DateTime
+    ) -> IdempotencyRecord | None:
+        stmt = select(IdempotencyKeyBase).where(
+            IdempotencyKeyBase.user_id == user_id,
+            IdempotencyKeyBase.key == key,
+            IdempotencyKeyBase.expires_at > now.value,
+        )
+        model = await self.executor.execute_scalar_one(stmt)
+        return self._to_record(model) if model else None
+
+    async def claim(
+        self, record: IdempotencyRecord, now: DateTime
+    ) -> IdempotencyRecord:
+        # NOTE: A concurrent insert of the same key blocks here until the
+        # other transaction ends; an expired key is taken over in place
+        values = insert(IdempotencyKeyBase).values(
+            user_id=record.user_id,
+            key=record.key,
+            request_hash=record.request_hash,
+            order_id=record.order_id,
+            expires_at=record.expires_at.value,
+        )
+        stmt = values.on_conflict_do_update(
+            index_elements=[IdempotencyKeyBase.user_id, IdempotencyKeyBase.key],
+            set_={
+                "request_hash": values.excluded.request_hash,
+                "order_id": values.excluded.order_id,
+                "expires_at": values.excluded.expires_at,
+            },
+            where=IdempotencyKeyBase.expires_at <= now.value,
+        )
+        await self.executor.execute(stmt)
+
+        # NOTE: Sees either this insert or the row committed by the winner
+        stored = await self.get(record.user_id, record.key, now)
+        return stored or record
+
+    async def remove_expired(self, now: DateTime, limit: int) -> int:
+        expired = (
+            select(IdempotencyKeyBase.user_id, IdempotencyKeyBase.key)
+            .where(IdempotencyKeyBase.expires_at <= now.value)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .subquery()
+        )
+        stmt = (
+            delete(IdempotencyKeyBase)
+            .where(
+                IdempotencyKeyBase.user_id == expired.c.user_id,
+                IdempotencyKeyBase.key == expired.c.key,
+            )
+            .returning(IdempotencyKeyBase.key)
+        )
+        return len(await self.executor.execute_scalar_many(stmt))
+
+    @staticmethod
+    def _to_record(model: IdempotencyKeyBase) -> IdempotencyRecord:
+        return IdempotencyRecord(
+            user_id=model.user_id,
+            key=model.key,
+            request_hash=model.request_hash,
+            order_id=model.order_id,
+            expires_at=DateTime(model.expires_at),
+        )
@@ -0,0 +1,21 @@
+from datetime import datetime
+from uuid import UUID
+
+from common.infrastructure.database.sqlalchemy.models.base import Base
+from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class IdempotencyKeyBase(Base):
+    __tablename__ = "order_idempotency_keys"
+
+    user_id: Mapped[UUID] = mapped_column(PGUUID, primary_key=True)
+    key: Mapped[str] = mapped_column(String, primary_key=True)
+    request_hash: Mapped[str] = mapped_column(String, nullable=False)
+    order_id: Mapped[UUID] = mapped_column(
+        PGUUID, ForeignKey("orders.order_id", ondelete="CASCADE"), nullable=False
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
@@ -8,7 +8,7 @@ from fastfit.menu.infrastructure.database.postgres.sqlalchemy.models.models impo
 )
 from fastfit.order.domain.value_objects.delivery_type import DeliveryType
 from fastfit.order.domain.value_objects.order_status import OrderStatus
-from sqlalchemy import DateTime, Enum, ForeignKey, Numeric, String
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Numeric, String, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -31,6 +31,18 @@ class OrderItemBase(Base):
 
 class OrderBase(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        # NOTE: Serves keyset pages of a user's history and per-day counts
+        Index("ix_orders_user_id_created_at", "user_id", "created_at", "order_id"),
+        Index(
+            "ix_orders_restaurant_id_status_created_at",
+            "restaurant_id",
+            "status",
+            "created_at",
+        ),
+        # NOTE: Serves incremental kitchen board syncs
+        Index("ix_orders_restaurant_id_updated_at", "restaurant_id", "updated_at"),
+    )
 
     order_id: Mapped[UUID] = mapped_column(PGUUID, primary_key=True)
     user_id: Mapped[UUID | None] = mapped_column(PGUUID, nullable=True)
@@ -44,6 +56,7 @@ class OrderBase(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False
     )
+    version: Mapped[int] = mapped_column(nullable=False, server_default=text("1"))
 
     items: Mapped[list[OrderItemBase]] = relationship(
         "OrderItemBase", cascade="all, delete-orphan", lazy="noload"
@@ -0,0 +1,20 @@
+from datetime import datetime
+from uuid import UUID
+
+from common.infrastructure.database.sqlalchemy.models.base import Base
+from fastfit.order.domain.value_objects.order_status import OrderStatus
+from sqlalchemy import DateTime, Enum, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class OrderStatusScheduleBase(Base):
+    __tablename__ = "order_status_schedule"
+
+    order_id: Mapped[UUID] = mapped_column(
+        PGUUID, ForeignKey("orders.order_id", ondelete="CASCADE"), primary_key=True
+    )
+    status: Mapped[OrderStatus] = mapped_column(Enum(OrderStatus), nullable=False)
+    due_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
@@ -1,27 +1,133 @@
+from collections import defaultdict
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from datetime import date, datetime
 from decimal import Decimal
+from typing import Any
 from uuid import UUID
+from zoneinfo import ZoneInfo
 
+from common.application.exceptions import NotFoundError
 from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
-from fastfit.menu.infrastructure.database.postgres.sqlalchemy.mappers.dish_read_mapper import (
-    DishReadMapper,
-)
 from fastfit.menu.infrastructure.database.postgres.sqlalchemy.models.models import (
     DishBase,
 )
 from fastfit.order.application.interfaces.repositories.order_read_repository import (
     IOrderReadRepository,
 )
+from fastfit.order.application.read_models.kitchen_board import (
+    KitchenBoardItem,
+    KitchenBoardOrder,
+)
+from fastfit.order.application.read_models.order_page import OrderCursor, OrderPage
 from fastfit.order.application.read_models.order_read_model import (
+    OrderDishReadModel,
     OrderItemReadModel,
     OrderReadModel,
 )
+from fastfit.order.application.read_models.order_status_read_model import (
+    OrderStatusReadModel,
+)
 from fastfit.order.domain.value_objects.order_status import OrderStatus
 from fastfit.order.infrastructure.database.postgres.sqlalchemy.models.order_base import (
     OrderBase,
     OrderItemBase,
 )
-from sqlalchemy import select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import Row, any_, bindparam, func, select, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID
+
+
+# NOTE: Statements are built once and executed with params, so a request
+# binds values instead of constructing and hashing new statements
+ORDERS = select(
+    OrderBase.order_id,
+    OrderBase.user_id,
+    OrderBase.phone_number,
+    OrderBase.status,
+    OrderBase.delivery_type,
+    OrderBase.delivery_address,
+    OrderBase.restaurant_id,
+    OrderBase.created_at,
+)
+GET_BY_ID = ORDERS.where(OrderBase.order_id == bindparam("order_id"))
+GET_STATUS = select(OrderBase.user_id, OrderBase.status).where(
+    OrderBase.order_id == bindparam("order_id")
+)
+GET_BY_USER = (
+    ORDERS.where(OrderBase.user_id == bindparam("user_id"))
+    .order_by(OrderBase.created_at.desc(), OrderBase.order_id.desc())
+    .limit(bindparam("limit"))
+)
+GET_BY_USER_AFTER = GET_BY_USER.where(
+    tuple_(OrderBase.created_at, OrderBase.order_id)
+    < tuple_(
+        bindparam("after_created_at", type_=OrderBase.created_at.type),
+        bindparam("after_order_id", type_=OrderBase.order_id.type),
+    )
+)
+STREAM_BY_RESTAURANT = ORDERS.where(
+    OrderBase.restaurant_id == bindparam("restaurant_id"),
+    OrderBase.created_at >= bindparam("start"),
+    OrderBase.created_at < bindparam("end"),
+).order_by(OrderBase.created_at, OrderBase.order_id)
+# NOTE: A single array parameter keeps one statement for any page size
+ORDER_ITEMS = (
+    select(
+        OrderItemBase.order_id,
+        OrderItemBase.dish_id,
+        OrderItemBase.quantity,
+        OrderItemBase.price,
+        OrderItemBase.currency,
+        DishBase.name,
+        DishBase.calories,
+        DishBase.proteins,
+        DishBase.fats,
+        DishBase.carbohydrates,
+        DishBase.image,
+    )
+    .join(DishBase, DishBase.dish_id == OrderItemBase.dish_id)
+    .where(OrderItemBase.order_id == any_(bindparam("order_ids", type_=ARRAY(PGUUID))))
+)
+
+ACTIVITY_DAY = func.date_trunc(
+    "day", OrderBase.created_at, bindparam("timezone")
+).label("day")
+COUNT_BY_DAY = (
+    select(ACTIVITY_DAY, func.count().label("orders_count"))
+    .where(
+        OrderBase.user_id == bindparam("user_id"),
+        OrderBase.created_at >= bindparam("start"),
+        OrderBase.created_at < bindparam("end"),
+    )
+    .group_by(ACTIVITY_DAY)
+)
+
+KITCHEN_BOARD = select(
+    OrderBase.order_id,
+    OrderBase.status,
+    OrderBase.delivery_type,
+    OrderBase.created_at,
+    OrderBase.updated_at,
+)
+GET_KITCHEN_BOARD = KITCHEN_BOARD.where(
+    OrderBase.restaurant_id == bindparam("restaurant_id"),
+    OrderBase.status.in_(bindparam("statuses", expanding=True)),
+).order_by(OrderBase.created_at, OrderBase.order_id)
+GET_KITCHEN_BOARD_CHANGES = KITCHEN_BOARD.where(
+    OrderBase.restaurant_id == bindparam("restaurant_id"),
+    OrderBase.updated_at > bindparam("changed_after"),
+).order_by(OrderBase.created_at, OrderBase.order_id)
+KITCHEN_BOARD_ITEMS = (
+    select(
+        OrderItemBase.order_id,
+        OrderItemBase.dish_id,
+        DishBase.name,
+        OrderItemBase.quantity,
+    )
+    .join(DishBase, DishBase.dish_id == OrderItemBase.dish_id)
+    .where(OrderItemBase.order_id == any_(bindparam("order_ids", type_=ARRAY(PGUUID))))
+    .order_by(OrderItemBase.order_id, DishBase.name)
+)
 
 
 class OrderReadRepository(IOrderReadRepository):
@@ -29,75 +135,162 @@ class OrderReadRepository(IOrderReadRepository):
         self.executor = executor
 
     async def get_by_id(self, order_id: UUID) -> OrderReadModel:
-        stmt = (
-            select(OrderBase)
-            .where(OrderBase.order_id == order_id)
-            .options(
-                joinedload(OrderBase.items)
-                .joinedload(OrderItemBase.dish)
-                .joinedload(DishBase.category)
-            )
-        )
-        model = await self.executor.execute_scalar_one(stmt)
-        if not model:
+        row = await self.executor.execute_one(GET_BY_ID, {"order_id": order_id})
+        if row is None:
             raise ValueError(f"Order with id {order_id} not found")
-        return self._to_read_model(model)
-
-    async def get_by_user(self, user_id: UUID) -> list[OrderReadModel]:
-        stmt = (
-            select(OrderBase)
-            .where(OrderBase.user_id == user_id)
-            .options(
-                joinedload(OrderBase.items)
-                .joinedload(OrderItemBase.dish)
-                .joinedload(DishBase.category)
-            )
+        (order,) = await self._load_orders([row])
+        return order
+
+    async def get_status(self, order_id: UUID) -> OrderStatusReadModel:
+        row = await self.executor.execute_one(GET_STATUS, {"order_id": order_id})
+        if row is None:
+            raise NotFoundError(order_id)
+        return OrderStatusReadModel(order_id, row.user_id, row.status)
+
+    async def get_by_user(
+        self, user_id: UUID, limit: int, after: OrderCursor | None = None
+    ) -> OrderPage:
+        params: dict[str, Any] = {"user_id": user_id, "limit": limit + 1}
+        stmt = GET_BY_USER
+        if after is not None:
+            stmt = GET_BY_USER_AFTER
+            params["after_created_at"] = after.created_at
+            params["after_order_id"] = after.order_id
+        rows = await self.executor.execute_many(stmt, params)
+        orders = await self._load_orders(rows[:limit])
+        next_cursor = (
+            OrderCursor(orders[-1].created_at, orders[-1].order_id)
+            if len(rows) > limit
+            else None
         )
-        models = await self.executor.execute_scalar_many(stmt)
-        return [self._to_read_model(model) for model in models]
-
-    async def get_by_restaurant(
-        self, restaurant_id: UUID, status: OrderStatus | None
-    ) -> list[OrderReadModel]:
-        stmt = (
-            select(OrderBase)
-            .where(OrderBase.restaurant_id == restaurant_id)
-            .options(
-                joinedload(OrderBase.items)
-                .joinedload(OrderItemBase.dish)
-                .joinedload(DishBase.category)
-            )
+        return OrderPage(orders, next_cursor)
+
+    @asynccontextmanager
+    async def stream_by_restaurant(
+        self, restaurant_id: UUID, start: datetime, end: datetime
+    ) -> AsyncIterator[AsyncIterator[OrderReadModel]]:
+        params = {"restaurant_id": restaurant_id, "start": start, "end": end}
+        async with self.executor.stream_many(
+            STREAM_BY_RESTAURANT, params
+        ) as partitions:
+            yield self._stream_orders(partitions)
+
+    async def _stream_orders(
+        self, partitions: AsyncIterator[Sequence[Row[Any]]]
+    ) -> AsyncIterator[OrderReadModel]:
+        # NOTE: Items are loaded per batch, so at most one batch of orders and
+        # their items is held in memory at a time
+        async for rows in partitions:
+            for order in await self._load_orders(rows):
+                yield order
+
+    async def count_by_day(
+        self, user_id: UUID, start: datetime, end: datetime, timezone: str
+    ) -> dict[date, int]:
+        # NOTE: Reads only (user_id, created_at), which the user/created_at
+        # index covers, so Postgres can answer with an index-only scan
+        rows = await self.executor.execute_many(
+            COUNT_BY_DAY,
+            {"user_id": user_id, "start": start, "end": end, "timezone": timezone},
+        )
+        tz = ZoneInfo(timezone)
+        return {row.day.astimezone(tz).date(): row.orders_count for row in rows}
+
+    async def get_kitchen_board(
+        self, restaurant_id: UUID, statuses: Sequence[OrderStatus]
+    ) -> list[KitchenBoardOrder]:
+        # NOTE: One range scan of the restaurant/status/created_at index per
+        # status; the board never touches the restaurant's order history
+        rows = await self.executor.execute_many(
+            GET_KITCHEN_BOARD,
+            {"restaurant_id": restaurant_id, "statuses": list(statuses)},
+        )
+        return await self._load_kitchen_board(rows)
+
+    async def get_kitchen_board_changes(
+        self, restaurant_id: UUID, changed_after: datetime
+    ) -> list[KitchenBoardOrder]:
+        rows = await self.executor.execute_many(
+            GET_KITCHEN_BOARD_CHANGES,
+            {"restaurant_id": restaurant_id, "changed_after": changed_after},
         )
-        if status:
-            stmt = stmt.where(OrderBase.status == status)
-        models = await self.executor.execute_scalar_many(stmt)
-        return [self._to_read_model(model) for model in models]
-
-    def _to_read_model(self, model: OrderBase) -> OrderReadModel:
-        items = [
-            OrderItemReadModel(
-                dish_id=item.dish_id,
-                dish=DishReadMapper.to_read_model(item.dish),
-                quantity=item.quantity,
-                price=item.price,
-                currency=item.currency,
+        return await self._load_kitchen_board(rows)
+
+    async def _load_kitchen_board(
+        self, rows: Sequence[Row[Any]]
+    ) -> list[KitchenBoardOrder]:
+        if not rows:
+            return []
+
+        # NOTE: Items are read in a second narrow query instead of joining
+        # them onto the orders, and only the dish name is taken from the menu
+        items: dict[UUID, list[KitchenBoardItem]] = defaultdict(list)
+        for item in await self.executor.execute_many(
+            KITCHEN_BOARD_ITEMS, {"order_ids": [row.order_id for row in rows]}
+        ):
+            items[item.order_id].append(
+                KitchenBoardItem(item.dish_id, item.name, item.quantity)
             )
-            for item in model.items
+
+        return [
+            KitchenBoardOrder(
+                order_id=row.order_id,
+                status=row.status,
+                delivery_type=row.delivery_type,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+                items=items[row.order_id],
+            )
+            for row in rows
         ]
+
+    async def _load_orders(self, rows: Sequence[Row[Any]]) -> list[OrderReadModel]:
+        if not rows:
+            return []
+
+        # NOTE: Plain rows, one per item, with only the dish columns order
+        # pages render: no identity map, no category join, no order columns
+        # repeated per item
+        items: dict[UUID, list[OrderItemReadModel]] = defaultdict(list)
+        for item in await self.executor.execute_many(
+            ORDER_ITEMS, {"order_ids": [row.order_id for row in rows]}
+        ):
+            items[item.order_id].append(
+                OrderItemReadModel(
+                    dish_id=item.dish_id,
+                    dish=OrderDishReadModel(
+                        name=item.name,
+                        calories=item.calories,
+                        proteins=item.proteins,
+                        fats=item.fats,
+                        carbohydrates=item.carbohydrates,
+                        image=item.image,
+                    ),
+                    quantity=item.quantity,
+                    price=item.price,
+                    currency=item.currency,
+                )
+            )
+
+        return [self._to_read_model(row, items[row.order_id]) for row in rows]
+
+    def _to_read_model(
+        self, row: Row[Any], items: list[OrderItemReadModel]
+    ) -> OrderReadModel:
         total_price = Decimal(0)
         for i in items:
             total_price += i.price * i.quantity
 
         return OrderReadModel(
-            order_id=model.order_id,
-            user_id=model.user_id,
-            phone_number=model.phone_number,
+            order_id=row.order_id,
+            user_id=row.user_id,
+            phone_number=row.phone_number,
             items=items,
             total_price=total_price,
             currency="RUB",
-            status=model.status,
-            delivery_type=model.delivery_type,
-            delivery_address=model.delivery_address,
-            restaurant_id=model.restaurant_id,
-            created_at=model.created_at,
+            status=row.status,
+            delivery_type=row.delivery_type,
+            delivery_address=row.delivery_address,
+            restaurant_id=row.restaurant_id,
+            created_at=row.created_at,
         )
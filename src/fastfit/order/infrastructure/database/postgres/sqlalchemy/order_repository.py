@@ -1,34 +1,40 @@
 from uuid import UUID
 
+from common.infrastructure.database.sqlalchemy.change_tracker import ChangeTracker
 from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
 from fastfit.order.application.interfaces.repositories.order_repository import (
     IOrderRepository,
 )
 from fastfit.order.domain.entities.order import Order
+from fastfit.order.domain.value_objects.order_status import OrderStatus
 from fastfit.order.infrastructure.database.postgres.sqlalchemy.mappers.order_mapper import (
     OrderMapper,
 )
 from fastfit.order.infrastructure.database.postgres.sqlalchemy.models.order_base import (
     OrderBase,
 )
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.orm import joinedload
 
 
 class OrderRepository(IOrderRepository):
     def __init__(self, executor: QueryExecutor) -> None:
         self.executor = executor
+        self.tracker = ChangeTracker(related=("items",))
 
     async def get_by_id(self, order_id: UUID) -> Order:
         stmt = (
             select(OrderBase)
             .where(OrderBase.order_id == order_id)
+            # NOTE: One order by key, joining its items costs a single round trip
             .options(joinedload(OrderBase.items))
         )
         model = await self.executor.execute_scalar_one(stmt)
         if not model:
             raise ValueError(f"Order with id {order_id} not found")
-        return OrderMapper.to_domain(model)
+        entity = OrderMapper.to_domain(model)
+        self.tracker.track(entity, OrderMapper.to_persistence(entity), model.version)
+        return entity
 
     async def add(self, entity: Order) -> None:
         model = OrderMapper.to_persistence(entity)
@@ -36,4 +42,33 @@ class OrderRepository(IOrderRepository):
 
     async def update(self, entity: Order) -> None:
         model = OrderMapper.to_persistence(entity)
-        await self.executor.save(model)
+        changes = self.tracker.changes(entity, model)
+        # NOTE: The versioned UPDATE of the orders row also guards item changes
+        bumped = await self.executor.update_columns(model, changes)
+        if changes.related:
+            # NOTE: Changed items need the whole graph to be merged
+            await self.executor.save(model)
+        self.tracker.refresh(entity, model, changes, bumped)
+
+    async def get_statuses(self, order_ids: list[UUID]) -> dict[UUID, OrderStatus]:
+        stmt = select(OrderBase.order_id, OrderBase.status).where(
+            OrderBase.order_id.in_(order_ids)
+        )
+        rows = await self.executor.execute_many(stmt)
+        return {row.order_id: row.status for row in rows}
+
+    async def update_statuses(
+        self, order_ids: list[UUID], from_status: OrderStatus, to_status: OrderStatus
+    ) -> list[UUID]:
+        # NOTE: Only the orders row is written, items are never loaded or merged
+        stmt = (
+            update(OrderBase)
+            .where(
+                OrderBase.order_id.in_(order_ids),
+                OrderBase.status == from_status,
+            )
+            .values(status=to_status, version=OrderBase.version + 1)
+            .returning(OrderBase.order_id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(await self.executor.execute_scalar_many(stmt))
@@ -0,0 +1,62 @@
+from uuid import UUID
+
+from common.domain.value_objects.datetime import DateTime
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from fastfit.order.application.interfaces.repositories.order_status_schedule_repository import (
+    IOrderStatusScheduleRepository,
+    ScheduledStatusTransition,
+)
+from fastfit.order.infrastructure.database.postgres.sqlalchemy.models.order_status_schedule_base import (
+    OrderStatusScheduleBase,
+)
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+
+
+class OrderStatusScheduleRepository(IOrderStatusScheduleRepository):
+    def __init__(self, executor: QueryExecutor) -> None:
+        self.executor = executor
+
+    async def add(self, transition: ScheduledStatusTransition) -> None:
+        stmt = insert(OrderStatusScheduleBase).values(
+            order_id=transition.order_id,
+            status=transition.status,
+            due_at=transition.due_at.value,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[OrderStatusScheduleBase.order_id],
+            set_={
+                "status": stmt.excluded.status,
+                "due_at": stmt.excluded.due_at,
+            },
+        )
+        await self.executor.execute(stmt)
+
+    async def claim_due(
+        self, now: DateTime, limit: int
+    ) -> list[ScheduledStatusTransition]:
+        # NOTE: Rows locked by another instance are skipped, not waited for
+        stmt = (
+            select(OrderStatusScheduleBase)
+            .where(OrderStatusScheduleBase.due_at <= now.value)
+            .order_by(OrderStatusScheduleBase.due_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        models = await self.executor.execute_scalar_many(stmt)
+        return [
+            ScheduledStatusTransition(
+                order_id=model.order_id,
+                status=model.status,
+                due_at=DateTime(model.due_at),
+            )
+            for model in models
+        ]
+
+    async def remove(self, order_ids: list[UUID]) -> None:
+        if not order_ids:
+            return
+        stmt = delete(OrderStatusScheduleBase).where(
+            OrderStatusScheduleBase.order_id.in_(order_ids)
+        )
+        await self.executor.execute(stmt)
@@ -1,43 +1,105 @@
 from typing import Any
 
 from dependency_injector import containers, providers
+from fastfit.order.application.services.order_status_scheduler import (
+    OrderStatusScheduler,
+)
+from fastfit.order.application.usecases.command.bulk_update_order_status_use_case import (
+    BulkUpdateOrderStatusUseCase,
+)
 from fastfit.order.application.usecases.command.create_order_use_case import (
     CreateOrderUseCase,
 )
+from fastfit.order.application.usecases.command.idempotent_create_order_use_case import (
+    IdempotentCreateOrderUseCase,
+)
 from fastfit.order.application.usecases.command.update_order_status_use_case import (
     UpdateOrderStatusUseCase,
 )
+from fastfit.order.application.usecases.query.get_kitchen_board_use_case import (
+    GetKitchenBoardUseCase,
+)
+from fastfit.order.application.usecases.query.get_order_activity_use_case import (
+    GetOrderActivityUseCase,
+)
 from fastfit.order.application.usecases.query.get_order_by_id_use_case import (
     GetOrderByIdUseCase,
 )
+from fastfit.order.application.usecases.query.get_order_status_use_case import (
+    GetOrderStatusUseCase,
+)
 from fastfit.order.application.usecases.query.get_orders_by_user_use_case import (
     GetOrdersByUserUseCase,
 )
+from fastfit.order.infrastructure.database.postgres.sqlalchemy.idempotency_key_repository import (
+    IdempotencyKeyRepository,
+)
 from fastfit.order.infrastructure.database.postgres.sqlalchemy.order_read_repository import (
     OrderReadRepository,
 )
 from fastfit.order.infrastructure.database.postgres.sqlalchemy.order_repository import (
     OrderRepository,
 )
+from fastfit.order.infrastructure.database.postgres.sqlalchemy.order_status_schedule_repository import (
+    OrderStatusScheduleRepository,
+)
+from fastfit.order.infrastructure.di.container.providers import (
+    provide_idempotency_cache,
+    provide_order_status_notifier,
+    provide_status_delays,
+)
+from fastfit.order.infrastructure.services.memory.kitchen_staff import (
+    ConfiguredKitchenStaff,
+)
+from fastfit.order.infrastructure.services.memory.order_status_hub import (
+    InMemoryOrderStatusHub,
+)
 
 
 class OrderContainer(containers.DeclarativeContainer):
+    order_config: providers.Dependency[Any] = providers.Dependency()
+
+    unit_of_work: providers.Dependency[Any] = providers.Dependency()
     query_executor: providers.Dependency[Any] = providers.Dependency()
+    read_query_executor: providers.Dependency[Any] = providers.Dependency()
     clock: providers.Dependency[Any] = providers.Dependency()
     uuid_generator: providers.Dependency[Any] = providers.Dependency()
+    price_book: providers.Dependency[Any] = providers.Dependency()
 
     order_repository = providers.Singleton(OrderRepository, query_executor)
-    order_read_repository = providers.Singleton(OrderReadRepository, query_executor)
+    order_read_repository = providers.Singleton(
+        OrderReadRepository, read_query_executor
+    )
+    # NOTE: For reads that must not lag behind writes or NOTIFY events
+    primary_order_read_repository = providers.Singleton(
+        OrderReadRepository, query_executor
+    )
+    order_status_schedule_repository = providers.Singleton(
+        OrderStatusScheduleRepository, query_executor
+    )
+    idempotency_key_repository = providers.Singleton(
+        IdempotencyKeyRepository, query_executor
+    )
 
-    create_order_use_case = providers.Singleton(
-        CreateOrderUseCase,
-        uuid_generator=uuid_generator,
-        clock=clock,
-        order_repository=order_repository,
+    order_status_hub = providers.Singleton(
+        InMemoryOrderStatusHub, order_config, query_executor
+    )
+    order_status_notifier = providers.Singleton(
+        provide_order_status_notifier,
+        config=order_config,
+        query_executor=query_executor,
+        order_status_hub=order_status_hub,
     )
 
     update_order_use_case = providers.Singleton(
-        UpdateOrderStatusUseCase, order_repository=order_repository
+        UpdateOrderStatusUseCase,
+        order_repository=order_repository,
+        order_status_notifier=order_status_notifier,
+    )
+    bulk_update_order_status_use_case = providers.Singleton(
+        BulkUpdateOrderStatusUseCase,
+        order_repository=order_repository,
+        order_status_notifier=order_status_notifier,
     )
 
     get_order_by_id_use_case = providers.Singleton(
@@ -45,7 +107,53 @@ class OrderContainer(containers.DeclarativeContainer):
         order_read_repository=order_read_repository,
     )
 
+    get_order_status_use_case = providers.Singleton(
+        GetOrderStatusUseCase,
+        order_read_repository=primary_order_read_repository,
+    )
+
     get_orders_by_user_use_case = providers.Singleton(
         GetOrdersByUserUseCase,
         order_read_repository=order_read_repository,
     )
+
+    # NOTE: Read from the primary, a lagging replica could hide a change
+    # behind the board cursor for good
+    get_kitchen_board_use_case = providers.Singleton(
+        GetKitchenBoardUseCase,
+        order_read_repository=primary_order_read_repository,
+    )
+    kitchen_staff = providers.Singleton(ConfiguredKitchenStaff, order_config)
+
+    get_order_activity_use_case = providers.Singleton(
+        GetOrderActivityUseCase,
+        order_read_repository=order_read_repository,
+    )
+
+    order_status_scheduler = providers.Singleton(
+        OrderStatusScheduler,
+        clock=clock,
+        uow=unit_of_work,
+        schedule_repository=order_status_schedule_repository,
+        bulk_update_order_status_use_case=bulk_update_order_status_use_case,
+        delays=providers.Callable(provide_status_delays, order_config),
+    )
+
+    create_order_use_case = providers.Singleton(
+        CreateOrderUseCase,
+        uuid_generator=uuid_generator,
+        clock=clock,
+        uow=unit_of_work,
+        order_repository=order_repository,
+        price_book=price_book,
+        order_status_scheduler=order_status_scheduler,
+    )
+    idempotent_create_order_use_case = providers.Singleton(
+        IdempotentCreateOrderUseCase,
+        clock=clock,
+        uow=unit_of_work,
+        create_order_use_case=create_order_use_case,
+        idempotency_key_repository=idempotency_key_repository,
+        ttl=order_config.provided.idempotency_ttl,
+        idempotency_cache=providers.Singleton(provide_idempotency_cache, order_config),
+    )
@@ -0,0 +1,42 @@
+from datetime import timedelta
+
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from fastfit.order.application.interfaces.services.order_status_events import (
+    IOrderStatusNotifier,
+)
+from fastfit.order.domain.value_objects.order_status import OrderStatus
+from fastfit.order.infrastructure.config.order_config import OrderConfig
+from fastfit.order.infrastructure.services.memory.idempotency_cache import (
+    InMemoryIdempotencyCache,
+)
+from fastfit.order.infrastructure.services.memory.order_status_hub import (
+    InMemoryOrderStatusHub,
+)
+from fastfit.order.infrastructure.services.postgres.order_status_notifier import (
+    PostgresOrderStatusNotifier,
+)
+
+
+def provide_status_delays(config: OrderConfig) -> dict[OrderStatus, timedelta]:
+    return {
+        OrderStatus.PREPARING: config.scheduler_preparing_delay,
+        OrderStatus.READY: config.scheduler_ready_delay,
+        OrderStatus.DELIVERED: config.scheduler_delivered_delay,
+    }
+
+
+def provide_idempotency_cache(config: OrderConfig) -> InMemoryIdempotencyCache | None:
+    if not config.idempotency_cache_enabled:
+        return None
+    return InMemoryIdempotencyCache(config)
+
+
+def provide_order_status_notifier(
+    config: OrderConfig,
+    query_executor: QueryExecutor,
+    order_status_hub: InMemoryOrderStatusHub,
+) -> IOrderStatusNotifier:
+    # NOTE: Without NOTIFY events only reach subscribers of this instance
+    if not config.events_notify_enabled:
+        return order_status_hub
+    return PostgresOrderStatusNotifier(query_executor, config)
@@ -0,0 +1,58 @@
+import asyncio
+import contextlib
+import logging
+
+from common.application.interfaces.transactions.unit_of_work import IUnitOfWork
+from common.domain.interfaces.clock import IClock
+from fastfit.order.application.interfaces.repositories.idempotency_key_repository import (
+    IIdempotencyKeyRepository,
+)
+from fastfit.order.infrastructure.config.order_config import OrderConfig
+
+
+class IdempotencyKeySweeper:
+    """Background loop deleting expired idempotency keys in batches."""
+
+    def __init__(
+        self,
+        clock: IClock,
+        uow: IUnitOfWork,
+        idempotency_key_repository: IIdempotencyKeyRepository,
+        logger: logging.Logger,
+        config: OrderConfig,
+    ) -> None:
+        self.clock = clock
+        self.uow = uow
+        self.idempotency_key_repository = idempotency_key_repository
+        self.logger = logger
+        self.interval = config.idempotency_sweep_interval.total_seconds()
+        self.batch_size = config.idempotency_sweep_batch_size
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run())
+        self.logger.info("idempotency key sweeper started")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        self.logger.info("idempotency key sweeper stopped")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with self.uow:
+                    removed = await self.idempotency_key_repository.remove_expired(
+                        self.clock.now(), self.batch_size
+                    )
+            except Exception:
+                self.logger.exception("idempotency key sweep failed")
+                removed = 0
+            if removed < self.batch_size:
+                await asyncio.sleep(self.interval)
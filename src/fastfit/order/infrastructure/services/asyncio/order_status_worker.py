@@ -0,0 +1,53 @@
+import asyncio
+import contextlib
+import logging
+
+from fastfit.order.application.interfaces.services.order_status_scheduler import (
+    IOrderStatusScheduler,
+)
+from fastfit.order.infrastructure.config.order_config import OrderConfig
+
+
+class OrderStatusWorker:
+    """Background loop applying due status transitions in batches.
+
+    A full batch is followed by the next one right away, so a backlog is
+    drained without waiting for the polling interval.
+    """
+
+    def __init__(
+        self,
+        scheduler: IOrderStatusScheduler,
+        logger: logging.Logger,
+        config: OrderConfig,
+    ) -> None:
+        self.scheduler = scheduler
+        self.logger = logger
+        self.interval = config.scheduler_interval.total_seconds()
+        self.batch_size = config.scheduler_batch_size
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run())
+        self.logger.info("order status worker started")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        self.logger.info("order status worker stopped")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                claimed = await self.scheduler.run_due(self.batch_size)
+            except Exception:
+                self.logger.exception("order status worker iteration failed")
+                claimed = 0
+            if claimed < self.batch_size:
+                await asyncio.sleep(self.interval)
@@ -0,0 +1,30 @@
+from uuid import UUID
+
+from common.infrastructure.cache.lru_cache import LRUCache
+from fastfit.order.application.interfaces.repositories.idempotency_key_repository import (
+    IdempotencyRecord,
+)
+from fastfit.order.application.interfaces.services.idempotency_cache import (
+    IIdempotencyCache,
+)
+from fastfit.order.infrastructure.config.order_config import OrderConfig
+
+
+class InMemoryIdempotencyCache(IIdempotencyCache):
+    """Recently completed idempotency records kept in process memory.
+
+    Entries live far shorter than the stored keys, so a replay served from
+    here never outlives the record in the database.
+    """
+
+    def __init__(self, config: OrderConfig) -> None:
+        self._records: LRUCache[tuple[UUID, str], IdempotencyRecord] = LRUCache(
+            maxsize=config.idempotency_cache_size,
+            ttl=config.idempotency_cache_ttl.total_seconds(),
+        )
+
+    def get(self, user_id: UUID, key: str) -> IdempotencyRecord | None:
+        return self._records.get((user_id, key))
+
+    def put(self, record: IdempotencyRecord) -> None:
+        self._records.set((record.user_id, record.key), record)
@@ -0,0 +1,18 @@
+from uuid import UUID
+
+from fastfit.order.application.interfaces.services.kitchen_staff import IKitchenStaff
+from fastfit.order.infrastructure.config.order_config import OrderConfig
+
+
+class ConfiguredKitchenStaff(IKitchenStaff):
+    """Kitchen staff listed by identity id in ``kitchen_staff_ids``.
+
+    Stands in for staff roles, which identities do not carry yet. An empty
+    list admits nobody.
+    """
+
+    def __init__(self, config: OrderConfig) -> None:
+        self.identity_ids = frozenset(config.kitchen_staff_ids)
+
+    def is_member(self, identity_id: UUID) -> bool:
+        return identity_id in self.identity_ids
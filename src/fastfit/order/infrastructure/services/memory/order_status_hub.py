@@ -0,0 +1,86 @@
+import asyncio
+from collections.abc import Sequence
+from functools import partial
+from uuid import UUID
+
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from fastfit.order.application.interfaces.services.order_status_events import (
+    IOrderStatusFeed,
+    IOrderStatusNotifier,
+    IOrderStatusSubscription,
+    OrderStatusEvent,
+)
+from fastfit.order.infrastructure.config.order_config import OrderConfig
+
+
+class _Subscription(IOrderStatusSubscription):
+    __slots__ = ("heartbeat", "hub", "order_id", "queue")
+
+    def __init__(
+        self, hub: "InMemoryOrderStatusHub", order_id: UUID, heartbeat: float
+    ) -> None:
+        self.hub = hub
+        self.order_id = order_id
+        self.heartbeat = heartbeat
+        self.queue: asyncio.Queue[OrderStatusEvent] = asyncio.Queue(hub.queue_size)
+
+    async def next(self) -> OrderStatusEvent | None:
+        try:
+            async with asyncio.timeout(self.heartbeat):
+                return await self.queue.get()
+        except TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.hub.unsubscribe(self)
+
+    def put(self, event: OrderStatusEvent) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+
+class InMemoryOrderStatusHub(IOrderStatusFeed, IOrderStatusNotifier):
+    """Fans order status events out to the subscribers of this process.
+
+    Every subscriber owns a small bounded queue. A subscriber that falls
+    behind loses its oldest events instead of blocking the publisher, as
+    only the latest status is of interest to it.
+    """
+
+    def __init__(
+        self, config: OrderConfig, executor: QueryExecutor | None = None
+    ) -> None:
+        self.executor = executor
+        self.queue_size = config.events_queue_size
+        self.heartbeat = config.events_heartbeat_interval.total_seconds()
+        self._subscriptions: dict[UUID, set[_Subscription]] = {}
+
+    def subscribe(self, order_id: UUID) -> IOrderStatusSubscription:
+        subscription = _Subscription(self, order_id, self.heartbeat)
+        self._subscriptions.setdefault(order_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: _Subscription) -> None:
+        subscriptions = self._subscriptions.get(subscription.order_id)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscriptions[subscription.order_id]
+
+    async def notify(self, events: Sequence[OrderStatusEvent]) -> None:
+        if self.executor is None:
+            self.dispatch(events)
+            return
+        # NOTE: Notified inside the writing transaction, a rolled back status
+        # must never reach subscribers
+        self.executor.after_commit(partial(self.dispatch, list(events)))
+
+    def dispatch(self, events: Sequence[OrderStatusEvent]) -> None:
+        for event in events:
+            for subscription in self._subscriptions.get(event.order_id, ()):
+                subscription.put(event)
+
+    def subscriptions(self) -> int:
+        return sum(len(s) for s in self._subscriptions.values())
@@ -0,0 +1,95 @@
+import asyncio
+import contextlib
+import json
+import logging
+from typing import Any
+from uuid import UUID
+
+from fastfit.order.application.interfaces.services.order_status_events import (
+    OrderStatusEvent,
+)
+from fastfit.order.domain.value_objects.order_status import OrderStatus
+from fastfit.order.infrastructure.config.order_config import OrderConfig
+from fastfit.order.infrastructure.services.memory.order_status_hub import (
+    InMemoryOrderStatusHub,
+)
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+def decode_events(payload: str) -> list[OrderStatusEvent]:
+    return [
+        OrderStatusEvent(UUID(order_id), OrderStatus[status])
+        for order_id, status in json.loads(payload)
+    ]
+
+
+class PostgresOrderStatusListener:
+    """Feeds NOTIFY status events of all instances into the local hub.
+
+    Holds a single LISTEN connection per process for as long as it runs and
+    reconnects when the connection is lost. Events published while it is
+    disconnected are not replayed.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        hub: InMemoryOrderStatusHub,
+        logger: logging.Logger,
+        config: OrderConfig,
+    ) -> None:
+        self.engine = engine
+        self.hub = hub
+        self.logger = logger
+        self.channel = config.events_channel
+        self.interval = config.events_listen_check_interval.total_seconds()
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run())
+        self.logger.info("order status listener started")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        self.logger.info("order status listener stopped")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except Exception:
+                self.logger.exception("order status listener connection failed")
+            await asyncio.sleep(self.interval)
+
+    async def _listen(self) -> None:
+        async with self.engine.connect() as connection:
+            raw_connection = await connection.get_raw_connection()
+            # NOTE: LISTEN needs the asyncpg connection itself, not the adapter
+            driver_connection: Any = raw_connection.driver_connection
+            await driver_connection.add_listener(self.channel, self._on_notification)
+            try:
+                while not driver_connection.is_closed():
+                    await asyncio.sleep(self.interval)
+            finally:
+                if not driver_connection.is_closed():
+                    await driver_connection.remove_listener(
+                        self.channel, self._on_notification
+                    )
+        self.logger.warning("order status listener connection closed")
+
+    def _on_notification(
+        self, connection: Any, pid: int, channel: str, payload: str
+    ) -> None:
+        try:
+            events = decode_events(payload)
+        except (ValueError, KeyError):
+            self.logger.exception("malformed order status notification")
+            return
+        self.hub.dispatch(events)
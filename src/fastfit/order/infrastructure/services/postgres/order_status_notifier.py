@@ -0,0 +1,40 @@
+import json
+from collections.abc import Sequence
+
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from fastfit.order.application.interfaces.services.order_status_events import (
+    IOrderStatusNotifier,
+    OrderStatusEvent,
+)
+from fastfit.order.infrastructure.config.order_config import OrderConfig
+from sqlalchemy import func, select
+
+
+# NOTE: Keeps every payload well below the 8000 bytes NOTIFY accepts
+EVENTS_PER_NOTIFICATION = 100
+
+
+def encode_events(events: Sequence[OrderStatusEvent]) -> str:
+    return json.dumps([[str(event.order_id), event.status.name] for event in events])
+
+
+class PostgresOrderStatusNotifier(IOrderStatusNotifier):
+    """Publishes status events with NOTIFY on the current transaction.
+
+    Postgres delivers notifications only once the transaction commits, so
+    listeners on every instance never see a status that was rolled back.
+    """
+
+    def __init__(self, executor: QueryExecutor, config: OrderConfig) -> None:
+        self.executor = executor
+        self.channel = config.events_channel
+
+    async def notify(self, events: Sequence[OrderStatusEvent]) -> None:
+        if not events:
+            return
+        payloads = [
+            encode_events(events[i : i + EVENTS_PER_NOTIFICATION])
+            for i in range(0, len(events), EVENTS_PER_NOTIFICATION)
+        ]
+        stmt = select(*(func.pg_notify(self.channel, payload) for payload in payloads))
+        await self.executor.execute(stmt)
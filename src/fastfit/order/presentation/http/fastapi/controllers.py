@@ -1,12 +1,12 @@
-import asyncio
-from datetime import UTC, datetime, timedelta
-from decimal import Decimal
+import json
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
 from typing import Annotated, Any
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from fastfit.identity.domain.value_objects.descriptor import IdentityDescriptor
 from fastfit.identity.presentation.http.fastapi.auth import get_descriptor
@@ -15,27 +15,51 @@ from fastfit.order.application.dtos.commands.create_order_command import (
     CreateOrderCommand,
     OrderItemDTO,
 )
-from fastfit.order.application.dtos.commands.update_order_status_command import (
-    UpdateOrderStatusCommand,
+from fastfit.order.application.dtos.queries.get_kitchen_board_query import (
+    GetKitchenBoardQuery,
+)
+from fastfit.order.application.dtos.queries.get_order_activity_query import (
+    GetOrderActivityQuery,
 )
 from fastfit.order.application.dtos.queries.get_order_by_id_query import (
     GetOrderByIdQuery,
 )
+from fastfit.order.application.dtos.queries.get_order_status_query import (
+    GetOrderStatusQuery,
+)
 from fastfit.order.application.dtos.queries.get_orders_by_user_query import (
+    DEFAULT_ORDER_PAGE_SIZE,
+    MAX_ORDER_PAGE_SIZE,
     GetOrdersByUserQuery,
 )
+from fastfit.order.application.interfaces.services.kitchen_staff import IKitchenStaff
+from fastfit.order.application.interfaces.services.order_status_events import (
+    IOrderStatusFeed,
+    IOrderStatusSubscription,
+)
 from fastfit.order.application.interfaces.usecases.command.create_order_use_case import (
     ICreateOrderUseCase,
 )
-from fastfit.order.application.interfaces.usecases.command.update_order_status_use_case import (
-    IUpdateOrderStatusUseCase,
+from fastfit.order.application.interfaces.usecases.query.get_kitchen_board_use_case import (
+    IGetKitchenBoardUseCase,
+)
+from fastfit.order.application.interfaces.usecases.query.get_order_activity_use_case import (
+    IGetOrderActivityUseCase,
 )
 from fastfit.order.application.interfaces.usecases.query.get_order_by_id_use_case import (
     IGetOrderByIdUseCase,
 )
+from fastfit.order.application.interfaces.usecases.query.get_order_status_use_case import (
+    IGetOrderStatusUseCase,
+)
 from fastfit.order.application.interfaces.usecases.query.get_orders_by_user_use_case import (
     IGetOrdersByUserUseCase,
 )
+from fastfit.order.application.read_models.kitchen_board import (
+    KitchenBoardCursor,
+    KitchenBoardOrder,
+)
+from fastfit.order.application.read_models.order_page import OrderCursor, OrderPage
 from fastfit.order.application.read_models.order_read_model import OrderReadModel
 from fastfit.order.domain.value_objects.delivery_type import DeliveryType
 from fastfit.order.domain.value_objects.order_status import OrderStatus
@@ -48,33 +72,49 @@ order_router = APIRouter()
 templates = Jinja2Templates(directory="templates")
 
 
-async def update_status(
-    bg: BackgroundTasks,
-    command: UpdateOrderStatusCommand,
-    use_case: IUpdateOrderStatusUseCase,
-    delay: int = 15,
-) -> None:
-    await asyncio.sleep(delay)
-    await use_case.execute(command)
-
-    next_status = None
-    delay = 15
-    if command.status == OrderStatus.PREPARING:
-        next_status = OrderStatus.READY
-    if command.status == OrderStatus.READY:
-        next_status = OrderStatus.DELIVERED
-        delay = 60
-
-    if next_status is None:
-        return
-
-    bg.add_task(
-        update_status,
-        bg=bg,
-        use_case=use_case,
-        command=UpdateOrderStatusCommand(command.order_id, next_status),
-        delay=delay,
-    )
+PROFILE_TIMEZONE = ZoneInfo("Europe/Moscow")
+ACTIVITY_DAYS = 7
+
+STATUS_COLORS = {
+    "created": "bg-gray-500",
+    "preparing": "bg-yellow-500",
+    "ready": "bg-green-500",
+    "delivered": "bg-blue-500",
+    "picked_up": "bg-blue-500",
+    "cancelled": "bg-red-500",
+}
+
+
+def _format_profile_order(order: OrderReadModel) -> dict[str, Any]:
+    return {
+        "id": str(order.order_id),
+        "date": order.created_at.astimezone(PROFILE_TIMEZONE),
+        "units": [
+            {
+                "quantity": item.quantity,
+                "dish": {
+                    "name": item.dish.name,
+                    "calories": float(item.dish.calories),
+                    "proteins": float(item.dish.proteins),
+                    "fats": float(item.dish.fats),
+                    "carbohydrates": float(item.dish.carbohydrates),
+                    "image": item.dish.image or "https://placehold.co/400",
+                },
+                "price": float(item.price),
+            }
+            for item in order.items
+        ],
+        "total": f"{order.total_price:.2f}",
+        "status": order.status.value,
+        "status_color": STATUS_COLORS.get(order.status.value, "bg-gray-500"),
+    }
+
+
+def _next_page_url(request: Request, page: OrderPage) -> str | None:
+    if page.next_cursor is None:
+        return None
+    url = request.url_for("profile_orders")
+    return str(url.include_query_params(after=page.next_cursor.encode()))
 
 
 # GET endpoint to render the profile page
@@ -83,72 +123,41 @@ async def get_profile(
     request: Request,
     user: Annotated[IdentityDescriptor, Depends(get_descriptor)],
     orders_use_case: Annotated[IGetOrdersByUserUseCase, Depends()],
+    activity_use_case: Annotated[IGetOrderActivityUseCase, Depends()],
 ) -> HTMLResponse:
     try:
-        # Fetch orders for the user
+        # Fetch the first page of orders for the user
         query = GetOrdersByUserQuery(user_id=user.identity_id)
-        orders: list[OrderReadModel] = await orders_use_case.execute(query)
+        page = await orders_use_case.execute(query)
 
-        # Format orders for template
-        formatted_orders: list[dict[str, Any]] = [
+        # Generate activity calendar for the last 7 days, oldest to newest
+        today = datetime.now(UTC).astimezone(PROFILE_TIMEZONE).date()
+        days = await activity_use_case.execute(
+            GetOrderActivityQuery(
+                user_id=user.identity_id,
+                last_day=today,
+                days=ACTIVITY_DAYS,
+                timezone=PROFILE_TIMEZONE.key,
+            )
+        )
+        activity: list[dict[str, Any]] = [
             {
-                "id": str(order.order_id),
-                "date": order.created_at.astimezone(ZoneInfo("Europe/Moscow")),
-                "units": [
-                    {
-                        "quantity": item.quantity,
-                        "dish": {
-                            "name": item.dish.name,
-                            "calories": float(item.dish.calories),
-                            "proteins": float(item.dish.proteins),
-                            "fats": float(item.dish.fats),
-                            "carbohydrates": float(item.dish.carbohydrates),
-                            "image": item.dish.image or "https://placehold.co/400",
-                        },
-                        "price": float(item.price),
-                    }
-                    for item in order.items
-                ],
-                "total": f"{order.total_price:.2f}",
-                "status": order.status.value,
-                "status_color": {
-                    "created": "bg-gray-500",
-                    "preparing": "bg-yellow-500",
-                    "ready": "bg-green-500",
-                    "delivered": "bg-blue-500",
-                    "picked_up": "bg-blue-500",
-                    "cancelled": "bg-red-500",
-                }.get(order.status.value, "bg-gray-500"),
+                "date": day.date.strftime("%Y-%m-%d"),
+                "orders_count": day.orders_count,
+                # Levels: 0 (none), 1, 2, 3, 4 (3+ orders)
+                "level": min(day.orders_count, 4),
             }
-            for order in orders
+            for day in days
         ]
 
-        # Generate activity calendar for the last 7 days
-        today = datetime.now(UTC).astimezone(ZoneInfo("Europe/Moscow")).date()
-        activity: list[dict[str, Any]] = []
-        for i in range(7):
-            date = today - timedelta(days=i)
-            orders_on_date = [
-                order
-                for order in orders
-                if order.created_at.astimezone(ZoneInfo("Europe/Moscow")).date() == date
-            ]
-            orders_count = len(orders_on_date)
-            level = min(orders_count, 4)  # Levels: 0 (none), 1, 2, 3, 4 (3+ orders)
-            activity.append(
-                {
-                    "date": date.strftime("%Y-%m-%d"),
-                    "orders_count": orders_count,
-                    "level": level,
-                }
-            )
-
         return templates.TemplateResponse(
             "profile.html",
             {
                 "request": request,
-                "orders": formatted_orders,
-                "activity": activity[::-1],  # Reverse to show oldest to newest
+                "orders": [_format_profile_order(order) for order in page.orders],
+                "next_page_url": _next_page_url(request, page),
+                "week_orders_count": sum(day.orders_count for day in days),
+                "activity": activity,
                 "city": "Москва",  # Replace with actual user city if available
             },
         )
@@ -158,6 +167,34 @@ async def get_profile(
         ) from e
 
 
+# GET endpoint returning the next page of order cards ("load more")
+@order_router.get("/profile/orders", name="profile_orders")
+async def get_profile_orders(
+    request: Request,
+    user: Annotated[IdentityDescriptor, Depends(get_descriptor)],
+    orders_use_case: Annotated[IGetOrdersByUserUseCase, Depends()],
+    after: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_ORDER_PAGE_SIZE)] = (
+        DEFAULT_ORDER_PAGE_SIZE
+    ),
+) -> HTMLResponse:
+    try:
+        cursor = OrderCursor.decode(after) if after else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid page cursor") from e
+
+    query = GetOrdersByUserQuery(user_id=user.identity_id, limit=limit, after=cursor)
+    page = await orders_use_case.execute(query)
+    return templates.TemplateResponse(
+        "partials/order_cards.html",
+        {
+            "request": request,
+            "orders": [_format_profile_order(order) for order in page.orders],
+            "next_page_url": _next_page_url(request, page),
+        },
+    )
+
+
 @order_router.get("/orders/{order_id}", name="order_details")
 async def get_order_details(
     request: Request,
@@ -190,24 +227,76 @@ async def get_order_details(
             ],
             "total": f"{order.total_price:.2f}",
             "status": order.status.value.capitalize(),
-            "status_color": {
-                "created": "bg-gray-500",
-                "preparing": "bg-yellow-500",
-                "ready": "bg-green-500",
-                "delivered": "bg-blue-500",
-                "picked_up": "bg-blue-500",
-                "cancelled": "bg-red-500",
-            }.get(order.status.value, "bg-gray-500"),
+            "status_color": STATUS_COLORS.get(order.status.value, "bg-gray-500"),
             "delivery_type": order.delivery_type.value,
             "delivery_address": order.delivery_address or "Самовывоз",
         }
         return templates.TemplateResponse(
-            "order_details.html", {"request": request, "order": formatted_order}
+            "order_details.html",
+            {
+                "request": request,
+                "order": formatted_order,
+                "status_colors": STATUS_COLORS,
+                "events_url": (
+                    None
+                    if order.status.is_final
+                    else str(request.url_for("order_events", order_id=order_id))
+                ),
+            },
         )
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"Order not found: {e!s}") from e
 
 
+def _status_message(status: OrderStatus) -> str:
+    data = json.dumps({"status": status.value, "final": status.is_final})
+    return f"event: status\ndata: {data}\n\n"
+
+
+async def _status_messages(
+    status: OrderStatus, subscription: IOrderStatusSubscription
+) -> AsyncIterator[str]:
+    try:
+        yield _status_message(status)
+        while not status.is_final:
+            event = await subscription.next()
+            if event is None:
+                # NOTE: Keeps proxies from dropping the idle connection and
+                # surfaces a vanished client on the next write
+                yield ": heartbeat\n\n"
+                continue
+            status = event.status
+            yield _status_message(status)
+    finally:
+        subscription.close()
+
+
+# GET endpoint streaming status changes of an order as server-sent events
+@order_router.get("/orders/{order_id}/events", name="order_events")
+async def stream_order_events(
+    order_id: UUID,
+    user: Annotated[IdentityDescriptor, Depends(get_descriptor)],
+    status_use_case: Annotated[IGetOrderStatusUseCase, Depends()],
+    order_status_feed: Annotated[IOrderStatusFeed, Depends()],
+) -> StreamingResponse:
+    # NOTE: Subscribing before the read guarantees no change is missed, the
+    # status is read from the primary so it cannot predate a delivered event
+    subscription = order_status_feed.subscribe(order_id)
+    try:
+        order = await status_use_case.execute(GetOrderStatusQuery(order_id=order_id))
+        if order.user_id != user.identity_id:
+            raise HTTPException(status_code=403, detail="Access denied")
+    except BaseException:
+        subscription.close()
+        raise
+
+    return StreamingResponse(
+        _status_messages(order.status, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 class CreateOrderRequest(BaseModel):
     items: list[dict[str, Any]]
     delivery_type: DeliveryType
@@ -219,10 +308,11 @@ class CreateOrderRequest(BaseModel):
 @order_router.post("/orders")
 async def create_order(
     order_data: CreateOrderRequest,
-    background_tasks: BackgroundTasks,
     user: Annotated[IdentityDescriptor, Depends(get_descriptor)],
     create_order_use_case: Annotated[ICreateOrderUseCase, Depends()],
-    update_order_status_use_case: Annotated[IUpdateOrderStatusUseCase, Depends()],
+    idempotency_key: Annotated[
+        str | None, Header(alias="Idempotency-Key", min_length=1, max_length=255)
+    ] = None,
 ) -> JSONResponse:
     try:
         # Validate and map data to CreateOrderCommand
@@ -234,8 +324,6 @@ async def create_order(
                 OrderItemDTO(
                     dish_id=UUID(item["dish_id"]),
                     quantity=int(item["quantity"]),
-                    price=Decimal(item["price"]),
-                    currency="RUB",  # Assume RUB
                 )
                 for item in order_data.items
             ],
@@ -246,15 +334,10 @@ async def create_order(
                 else None
             ),
             restaurant_id=DEFAULT_RESTAURANT_ID,
+            idempotency_key=idempotency_key,
         )
+        # NOTE: A replayed key returns the original order without creating one
         order_id: UUID = await create_order_use_case.execute(command)
-
-        background_tasks.add_task(
-            update_status,
-            bg=background_tasks,
-            use_case=update_order_status_use_case,
-            command=UpdateOrderStatusCommand(order_id, OrderStatus.PREPARING),
-        )
         return JSONResponse(
             content={"order_id": str(order_id), "message": "Order created successfully"}
         )
@@ -262,3 +345,43 @@ async def create_order(
         raise HTTPException(
             status_code=400, detail=f"Error creating order: {e!s}"
         ) from e
+
+
+def _format_kitchen_order(order: KitchenBoardOrder) -> dict[str, Any]:
+    return {
+        "order_id": str(order.order_id),
+        "status": order.status.value,
+        "delivery_type": order.delivery_type.value,
+        "created_at": order.created_at.isoformat(),
+        "items": [
+            {"dish_id": str(item.dish_id), "name": item.name, "quantity": item.quantity}
+            for item in order.items
+        ],
+    }
+
+
+# GET endpoint for kitchen screens: the full board, or only the orders changed
+# since the cursor of the previous response when `since` is given
+@order_router.get("/kitchen/orders", name="kitchen_orders")
+async def get_kitchen_orders(
+    user: Annotated[IdentityDescriptor, Depends(get_descriptor)],
+    kitchen_staff: Annotated[IKitchenStaff, Depends()],
+    kitchen_board_use_case: Annotated[IGetKitchenBoardUseCase, Depends()],
+    since: str | None = None,
+) -> JSONResponse:
+    if not kitchen_staff.is_member(user.identity_id):
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    try:
+        cursor = KitchenBoardCursor.decode(since) if since else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid board cursor") from e
+
+    query = GetKitchenBoardQuery(restaurant_id=DEFAULT_RESTAURANT_ID, since=cursor)
+    board = await kitchen_board_use_case.execute(query)
+    return JSONResponse(
+        content={
+            "orders": [_format_kitchen_order(order) for order in board.orders],
+            "since": board.next_cursor.encode() if board.next_cursor else None,
+        }
+    )